@@ -1,7 +1,8 @@
 # config/app_config.py
 from pathlib import Path
 import yaml
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
 
 CONFIG_PATH = Path(__file__).resolve().parents[2] / "config.yaml"
 
@@ -11,11 +12,61 @@ class LoggingConfig:
     level: str
 
 
+@dataclass
+class SchedulerConfig:
+    max_concurrent_task: int
+    resource_limits: Dict[str, int] = field(default_factory=dict)
+    coalesce_pending: bool = False
+    orphan_running_policy: str = "fail"
+    deploy_timeout_seconds: int = 3600
+    step_timeout_seconds: int = 1800
+
+
+@dataclass
+class ArtifactConfig:
+    gc_interval_seconds: int
+    gc_grace_seconds: int
+    upload_session_ttl_seconds: int
+
+
+@dataclass
+class DockerConfig:
+    engine_api: bool = True
+    socket_path: str = "/var/run/docker.sock"
+    timeout_seconds: int = 30
+    max_connections: int = 10
+    stats_sampler: bool = True
+    stats_history_size: int = 60
+
+
+@dataclass
+class JsonDatasourceConfig:
+    dir: str
+    journal: bool
+    journal_compact_threshold: int
+
+
+@dataclass
+class SqliteDatasourceConfig:
+    path: str
+
+
+@dataclass
+class DatasourceConfig:
+    type: str
+    json: JsonDatasourceConfig
+    sqlite: SqliteDatasourceConfig
+
+
 @dataclass
 class AppConfig:
     name: str
     version: str
     logging: LoggingConfig
+    scheduler: SchedulerConfig
+    artifact: ArtifactConfig
+    docker: DockerConfig
+    datasource: DatasourceConfig
 
     @classmethod
     def load(cls, path: str = CONFIG_PATH) -> "AppConfig":
@@ -24,6 +75,12 @@ class AppConfig:
 
         app_dict = config_dict.get("app", {}) or {}
         logging_dict = app_dict.get("logging", {}) or {}
+        scheduler_dict = app_dict.get("scheduler", {}) or {}
+        artifact_dict = app_dict.get("artifact", {}) or {}
+        docker_dict = app_dict.get("docker", {}) or {}
+        datasource_dict = app_dict.get("datasource", {}) or {}
+        json_datasource_dict = datasource_dict.get("json", {}) or {}
+        sqlite_datasource_dict = datasource_dict.get("sqlite", {}) or {}
 
         return cls(
             name=app_dict.get("name", "Deploy Agent"),
@@ -32,6 +89,43 @@ class AppConfig:
                 file=logging_dict.get("file", False),
                 level=logging_dict.get("level", "DEBUG").upper(),
             ),
+            scheduler=SchedulerConfig(
+                max_concurrent_task=max(int(scheduler_dict.get("max_concurrent_task", 1)), 1),
+                resource_limits={
+                    "docker_build": 1,
+                    "web_deploy": 2,
+                    "file_extract": 2,
+                    **(scheduler_dict.get("resource_limits", {}) or {}),
+                },
+                coalesce_pending=scheduler_dict.get("coalesce_pending", False),
+                orphan_running_policy=(scheduler_dict.get("orphan_running_policy") or "fail").lower(),
+                deploy_timeout_seconds=int(scheduler_dict.get("deploy_timeout_seconds", 3600)),
+                step_timeout_seconds=int(scheduler_dict.get("step_timeout_seconds", 1800)),
+            ),
+            artifact=ArtifactConfig(
+                gc_interval_seconds=int(artifact_dict.get("gc_interval_seconds", 3600)),
+                gc_grace_seconds=int(artifact_dict.get("gc_grace_seconds", 86400)),
+                upload_session_ttl_seconds=int(artifact_dict.get("upload_session_ttl_seconds", 86400)),
+            ),
+            docker=DockerConfig(
+                engine_api=docker_dict.get("engine_api", True),
+                socket_path=docker_dict.get("socket_path", "/var/run/docker.sock"),
+                timeout_seconds=int(docker_dict.get("timeout_seconds", 30)),
+                max_connections=max(int(docker_dict.get("max_connections", 10)), 1),
+                stats_sampler=docker_dict.get("stats_sampler", True),
+                stats_history_size=max(int(docker_dict.get("stats_history_size", 60)), 1),
+            ),
+            datasource=DatasourceConfig(
+                type=datasource_dict.get("type", "json"),
+                json=JsonDatasourceConfig(
+                    dir=json_datasource_dict.get("dir", "data"),
+                    journal=json_datasource_dict.get("journal", False),
+                    journal_compact_threshold=json_datasource_dict.get("journal_compact_threshold", 1000),
+                ),
+                sqlite=SqliteDatasourceConfig(
+                    path=sqlite_datasource_dict.get("path", "data/deploy_agent.db"),
+                ),
+            ),
         )
         
 # 模块级单例
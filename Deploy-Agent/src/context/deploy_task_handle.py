@@ -0,0 +1,232 @@
+import os
+import signal
+import subprocess
+import time
+from threading import Event, Lock, Timer
+from typing import List, Optional, Union
+
+from loguru import logger
+
+
+class DeployCancelledError(Exception):
+    """部署任务被取消"""
+
+
+class DeployTimeoutError(Exception):
+    """部署任务或部署步骤执行超时"""
+
+
+class DeployTaskHandle:
+    """
+    DeployTaskHandle
+
+    部署任务控制句柄（Control Handle）
+
+    与 DeployContext 相对：DeployContext 只存过程数据，
+    取消、超时以及正在执行的子进程等控制信息统一放在这里。
+
+    职责：
+        - 记录取消请求，并终止当前正在执行的子进程组
+        - 任务级超时：到期后按取消处理，终止当前子进程
+        - 步骤级超时：限制单个步骤中子进程的执行时间
+        - 以独立进程组执行外部命令（docker build / docker run 等），保证可被整体终止
+
+    说明：
+        - 纯 Python 步骤（如解压）无法被中途打断，取消与超时在步骤之间生效
+    """
+
+    # 终止子进程组时，SIGTERM 之后等待退出的时间
+    TERMINATE_GRACE_SECONDS = 5
+
+    def __init__(
+        self,
+        task_id: Optional[str] = None,
+        deploy_timeout_seconds: Optional[int] = None,
+        step_timeout_seconds: Optional[int] = None,
+    ):
+        self.task_id = task_id
+        self.deploy_timeout_seconds = deploy_timeout_seconds
+        self.step_timeout_seconds = step_timeout_seconds
+
+        self._cancel_event = Event()
+        self._cancel_reason: Optional[str] = None
+        self._timed_out = False
+
+        self._lock = Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._deadline: Optional[float] = None
+        self._step_deadline: Optional[float] = None
+        self._timer: Optional[Timer] = None
+
+    # ==============================
+    # 生命周期
+    # ==============================
+
+    def start(self):
+        """
+        开始计时，任务级超时从此刻起算。
+        """
+        if self.deploy_timeout_seconds and self.deploy_timeout_seconds > 0:
+            self._deadline = time.monotonic() + self.deploy_timeout_seconds
+            self._timer = Timer(self.deploy_timeout_seconds, self._on_deploy_timeout)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def close(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def begin_step(self):
+        """
+        进入新步骤：检查取消/超时状态，并重置步骤级超时。
+        """
+        self.check()
+        if self.step_timeout_seconds and self.step_timeout_seconds > 0:
+            self._step_deadline = time.monotonic() + self.step_timeout_seconds
+        else:
+            self._step_deadline = None
+
+    # ==============================
+    # 取消与超时
+    # ==============================
+
+    def cancel(self, reason: str = "任务已取消"):
+        """
+        请求取消任务，并终止当前正在执行的子进程组。
+        """
+        with self._lock:
+            if self._cancel_event.is_set():
+                return
+            self._cancel_reason = reason
+            self._cancel_event.set()
+            process = self._process
+
+        logger.info(f"[TASK:{self.task_id}] cancel requested: {reason}")
+        if process is not None:
+            self._terminate_process_group(process)
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check(self):
+        """
+        已取消或已超时时抛出对应异常。
+        """
+        if self._timed_out:
+            raise DeployTimeoutError(self._cancel_reason)
+        if self._cancel_event.is_set():
+            raise DeployCancelledError(self._cancel_reason)
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self._on_deploy_timeout()
+            raise DeployTimeoutError(self._cancel_reason)
+
+    # ==============================
+    # 子进程执行
+    # ==============================
+
+    def run_command(
+        self,
+        command: Union[str, List[str]],
+        cwd: Optional[str] = None,
+        shell: bool = False,
+        stdout=None,
+        stderr=None,
+        text: bool = False,
+        check: bool = False,
+    ) -> subprocess.CompletedProcess:
+        """
+        以独立进程组执行外部命令，语义与 subprocess.run 保持一致。
+
+        额外行为：
+            - 执行时间受步骤级与任务级剩余时间限制，超时后终止整个进程组并抛出 DeployTimeoutError
+            - 执行期间被取消时终止整个进程组并抛出 DeployCancelledError
+        """
+        self.check()
+
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            shell=shell,
+            stdout=stdout,
+            stderr=stderr,
+            text=text,
+            start_new_session=True
+        )
+
+        with self._lock:
+            self._process = process
+            cancelled = self._cancel_event.is_set()
+        if cancelled:
+            self._terminate_process_group(process)
+
+        try:
+            try:
+                output, error = process.communicate(timeout=self._remaining_seconds())
+            except subprocess.TimeoutExpired:
+                self._terminate_process_group(process)
+                process.communicate()
+                if self._deadline is not None and time.monotonic() >= self._deadline:
+                    self._on_deploy_timeout()
+                    raise DeployTimeoutError(self._cancel_reason) from None
+                raise DeployTimeoutError(
+                    f"步骤执行超时（{self.step_timeout_seconds} 秒）"
+                ) from None
+        finally:
+            with self._lock:
+                self._process = None
+
+        self.check()
+
+        if check and process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command, output, error)
+
+        return subprocess.CompletedProcess(command, process.returncode, output, error)
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _remaining_seconds(self) -> Optional[float]:
+        now = time.monotonic()
+        deadlines = [d for d in (self._deadline, self._step_deadline) if d is not None]
+        if not deadlines:
+            return None
+        return max(min(deadlines) - now, 0.0)
+
+    def _on_deploy_timeout(self):
+        with self._lock:
+            if self._timed_out or self._cancel_event.is_set():
+                return
+            self._timed_out = True
+            self._cancel_reason = f"部署任务执行超时（{self.deploy_timeout_seconds} 秒）"
+            self._cancel_event.set()
+            process = self._process
+
+        logger.warning(f"[TASK:{self.task_id}] {self._cancel_reason}")
+        if process is not None:
+            self._terminate_process_group(process)
+
+    def _terminate_process_group(self, process: subprocess.Popen):
+        """
+        先发送 SIGTERM，宽限期后仍未退出则发送 SIGKILL。
+        """
+        if process.poll() is not None:
+            return
+
+        try:
+            pgid = os.getpgid(process.pid)
+        except ProcessLookupError:
+            return
+
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+            try:
+                process.wait(timeout=self.TERMINATE_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+        logger.info(f"[TASK:{self.task_id}] process group terminated, pid={process.pid}")
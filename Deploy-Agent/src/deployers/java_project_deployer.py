@@ -1,6 +1,5 @@
 import os
 import re
-import shutil
 import subprocess
 from datetime import datetime
 from typing import Optional
@@ -8,10 +7,14 @@ from typing import Optional
 from loguru import logger
 
 from context.deploy_context import DeployContext
+from context.deploy_task_handle import DeployCancelledError, DeployTaskHandle, DeployTimeoutError
 from manager import PROJECT_DATA_MANAGER
 from models.entity.deploy_task import DeployTask
 from models.enum.deploy_strategy_enum import DeployStrategyEnum
 from utils.deploy_validator import DeployValidator
+from service.docker_service import DockerService
+from service.resource_limiter import ResourceLimiter
+from utils.file_util import link_or_copy
 
 
 class JavaProjectDeployer:
@@ -22,9 +25,15 @@ class JavaProjectDeployer:
     仅处理部署逻辑，不涉及任务调度与状态管理。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        resource_limiter: Optional[ResourceLimiter] = None,
+        handle: Optional[DeployTaskHandle] = None,
+    ):
         self.java_project = None
         self.deploy_task: Optional[DeployTask] = None
+        self.resource_limiter = resource_limiter
+        self.handle = handle or DeployTaskHandle()
 
     def deploy(
         self,
@@ -125,6 +134,7 @@ class JavaProjectDeployer:
             logger.info(f"[{deploy_task_id}][{strategy}]{prefix} START - {desc}")
 
             try:
+                self.handle.begin_step()
                 func()
                 logger.info(f"[{deploy_task_id}][{strategy}]{prefix} SUCCESS")
             except Exception:
@@ -169,10 +179,10 @@ class JavaProjectDeployer:
             f"{self.java_project.get('project_code')}.jar"
         )
 
-        shutil.copy2(source_jar_path, target_jar_path)
+        method = link_or_copy(source_jar_path, target_jar_path)
         ctx.artifact_path = target_jar_path
 
-        logger.info(f"JAR 已准备到部署目录: {target_jar_path}")
+        logger.info(f"JAR 已准备到部署目录: {target_jar_path}, method={method}")
 
     def _prepare_and_validate_dockerfile(self, ctx: DeployContext, deploy_task: DeployTask):
         """
@@ -241,46 +251,12 @@ class JavaProjectDeployer:
 
         image_name = self._resolve_image_name(deploy_task)
 
-        check_container_cmd = [
-            "docker", "ps", "-a",
-            "--filter", f"name={container_name}",
-            "--format", "{{.Names}}"
-        ]
-
-        result = subprocess.run(
-            check_container_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        if container_name in result.stdout:
-            logger.info(f"[CMD] docker rm -f {container_name}")
-            subprocess.run(
-                ["docker", "rm", "-f", container_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False
-            )
+        self.handle.check()
+        if DockerService.remove_container(container_name):
             logger.info(f"已删除旧容器: {container_name}")
 
-        check_image_cmd = ["docker", "images", "-q", image_name]
-
-        result = subprocess.run(
-            check_image_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        if result.stdout.strip():
-            logger.info(f"[CMD] docker rmi -f {image_name}")
-            subprocess.run(
-                ["docker", "rmi", "-f", image_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False
-            )
+        self.handle.check()
+        if DockerService.remove_image(image_name):
             logger.info(f"已删除旧镜像: {image_name}")
 
     def _build_image(self, ctx: DeployContext, deploy_task: DeployTask):
@@ -299,7 +275,7 @@ class JavaProjectDeployer:
         logger.info(f"[CMD] {' '.join(command)}")
 
         try:
-            subprocess.run(
+            self.handle.run_command(
                 command,
                 cwd=ctx.project_root_path,
                 check=True
@@ -330,7 +306,9 @@ class JavaProjectDeployer:
         logger.info(f"[CMD] {cmd}")
 
         try:
-            subprocess.run(cmd, shell=True, check=True)
+            self.handle.run_command(cmd, shell=True, check=True)
+        except (DeployCancelledError, DeployTimeoutError):
+            raise
         except Exception as e:
             raise RuntimeError(f"容器启动失败: {ctx.container_name}, 错误: {e}")
 
@@ -3,16 +3,21 @@ import re
 import shutil
 import subprocess
 import zipfile
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Optional
 
 from loguru import logger
 
 from context.deploy_context import DeployContext
+from context.deploy_task_handle import DeployCancelledError, DeployTaskHandle, DeployTimeoutError
 from manager import PROJECT_DATA_MANAGER
 from models.entity.deploy_task import DeployTask
 from models.enum.deploy_strategy_enum import DeployStrategyEnum
 from utils.deploy_validator import DeployValidator
+from service.docker_service import DockerService
+from service.resource_limiter import ResourceLimiter
+from utils.file_util import link_or_copy
 
 
 class PythonProjectDeployer:
@@ -23,9 +28,15 @@ class PythonProjectDeployer:
     仅处理部署逻辑，不涉及任务调度与状态管理。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        resource_limiter: Optional[ResourceLimiter] = None,
+        handle: Optional[DeployTaskHandle] = None,
+    ):
         self.python_project = None
         self.deploy_task: Optional[DeployTask] = None
+        self.resource_limiter = resource_limiter
+        self.handle = handle or DeployTaskHandle()
 
     def deploy(
         self,
@@ -129,6 +140,7 @@ class PythonProjectDeployer:
             logger.info(f"[{deploy_task_id}][{strategy}]{prefix} START - {desc}")
 
             try:
+                self.handle.begin_step()
                 func()
                 logger.info(f"[{deploy_task_id}][{strategy}]{prefix} SUCCESS")
             except Exception:
@@ -177,10 +189,10 @@ class PythonProjectDeployer:
             "project.zip"
         )
 
-        shutil.copy2(source_zip_path, target_zip_path)
+        method = link_or_copy(source_zip_path, target_zip_path)
         ctx.artifact_path = target_zip_path
 
-        logger.info(f"ZIP 已准备到部署目录: {target_zip_path}")
+        logger.info(f"ZIP 已准备到部署目录: {target_zip_path}, method={method}")
 
     def _unzip_project(self, ctx: DeployContext):
         """
@@ -203,7 +215,7 @@ class PythonProjectDeployer:
                 shutil.rmtree(path)
 
         try:
-            with zipfile.ZipFile(ctx.artifact_path, "r") as z:
+            with self._file_extract_slot(), zipfile.ZipFile(ctx.artifact_path, "r") as z:
                 z.extractall(app_dir)
         except zipfile.BadZipFile as e:
             raise RuntimeError(f"ZIP 文件无效: {e}")
@@ -329,46 +341,12 @@ class PythonProjectDeployer:
 
         image_name = self._resolve_image_name(deploy_task)
 
-        check_container_cmd = [
-            "docker", "ps", "-a",
-            "--filter", f"name={container_name}",
-            "--format", "{{.Names}}"
-        ]
-
-        result = subprocess.run(
-            check_container_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        if container_name in result.stdout:
-            logger.info(f"[CMD] docker rm -f {container_name}")
-            subprocess.run(
-                ["docker", "rm", "-f", container_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False
-            )
+        self.handle.check()
+        if DockerService.remove_container(container_name):
             logger.info(f"已删除旧容器: {container_name}")
 
-        check_image_cmd = ["docker", "images", "-q", image_name]
-
-        result = subprocess.run(
-            check_image_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        if result.stdout.strip():
-            logger.info(f"[CMD] docker rmi -f {image_name}")
-            subprocess.run(
-                ["docker", "rmi", "-f", image_name],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False
-            )
+        self.handle.check()
+        if DockerService.remove_image(image_name):
             logger.info(f"已删除旧镜像: {image_name}")
 
     def _build_image(self, ctx: DeployContext, deploy_task: DeployTask):
@@ -387,7 +365,7 @@ class PythonProjectDeployer:
         logger.info(f"[CMD] {' '.join(command)}")
 
         try:
-            subprocess.run(
+            self.handle.run_command(
                 command,
                 cwd=ctx.project_root_path,
                 check=True
@@ -418,7 +396,9 @@ class PythonProjectDeployer:
         logger.info(f"[CMD] {cmd}")
 
         try:
-            subprocess.run(cmd, shell=True, check=True)
+            self.handle.run_command(cmd, shell=True, check=True)
+        except (DeployCancelledError, DeployTimeoutError):
+            raise
         except Exception as e:
             raise RuntimeError(f"容器启动失败: {ctx.container_name}, 错误: {e}")
 
@@ -450,4 +430,12 @@ class PythonProjectDeployer:
         if not image_name or not image_tag:
             raise RuntimeError("镜像名称或标签缺失，无法继续部署")
 
-        return f"{image_name}:{image_tag}"
\ No newline at end of file
+        return f"{image_name}:{image_tag}"
+
+    def _file_extract_slot(self):
+        """
+        占用一个 file_extract 资源，未注入限流器时不限制。
+        """
+        if self.resource_limiter is None:
+            return nullcontext()
+        return self.resource_limiter.slot("file_extract")
@@ -1,14 +1,19 @@
 import os
 import shutil
 import zipfile
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Optional
 
 from loguru import logger
 
 from context.deploy_context import DeployContext
+from context.deploy_task_handle import DeployTaskHandle
 from manager import PROJECT_DATA_MANAGER
 from models.entity.deploy_task import DeployTask
+from service.project_status_service import ProjectStatusService
+from service.resource_limiter import ResourceLimiter
+from utils.file_util import link_or_copy
 
 
 class WebProjectDeployer:
@@ -18,9 +23,15 @@ class WebProjectDeployer:
     基于 DeployTask 执行前端静态资源部署流程。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        resource_limiter: Optional[ResourceLimiter] = None,
+        handle: Optional[DeployTaskHandle] = None,
+    ):
         self.web_project = None
         self.deploy_task: Optional[DeployTask] = None
+        self.resource_limiter = resource_limiter
+        self.handle = handle or DeployTaskHandle()
 
     def deploy(self, deploy_task: DeployTask):
         """
@@ -66,6 +77,9 @@ class WebProjectDeployer:
         except Exception:
             logger.error(f"[{deploy_task.id}][{strategy}] FAILED - {project_code}")
             raise
+        finally:
+            # 无论成功与否，部署目录都可能已变化
+            ProjectStatusService.get_instance().invalidate_web_project(self.web_project.get("container_project_path"))
 
         return f"{project_name} 项目部署成功"
 
@@ -79,6 +93,7 @@ class WebProjectDeployer:
 
             logger.info(f"[{task_id}][{strategy}]{prefix} START - {desc}")
             try:
+                self.handle.begin_step()
                 func()
                 logger.info(f"[{task_id}][{strategy}]{prefix} SUCCESS")
             except Exception:
@@ -117,10 +132,10 @@ class WebProjectDeployer:
             f"{self.web_project.get('project_code')}.zip"
         )
 
-        shutil.copy2(source_path, target_path)
+        method = link_or_copy(source_path, target_path)
         ctx.artifact_path = target_path
 
-        logger.info(f"ZIP 已准备到部署目录: {target_path}")
+        logger.info(f"ZIP 已准备到部署目录: {target_path}, method={method}")
 
     def _unzip_artifact(self, ctx: DeployContext, deploy_task: DeployTask):
         """
@@ -148,7 +163,7 @@ class WebProjectDeployer:
 
         try:
             logger.info(f"[{deploy_task.id}][{ctx.current_step}] PROCESS - 开始解压 ZIP: {ctx.artifact_path}")
-            with zipfile.ZipFile(ctx.artifact_path, "r") as zip_ref:
+            with self._file_extract_slot(), zipfile.ZipFile(ctx.artifact_path, "r") as zip_ref:
                 zip_ref.extractall(extract_path)
         except zipfile.BadZipFile as e:
             raise RuntimeError(f"ZIP 文件无效: {e}")
@@ -179,4 +194,12 @@ class WebProjectDeployer:
         }
 
         PROJECT_DATA_MANAGER.update_project(project_id, updated_data)
-        logger.info("项目最近部署时间已更新")
\ No newline at end of file
+        logger.info("项目最近部署时间已更新")
+
+    def _file_extract_slot(self):
+        """
+        占用一个 file_extract 资源，未注入限流器时不限制。
+        """
+        if self.resource_limiter is None:
+            return nullcontext()
+        return self.resource_limiter.slot("file_extract")
@@ -11,6 +11,7 @@ from config.app_config import app_config
 from loguru import logger
 
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -26,11 +27,37 @@ from routes.system_config_routes import system_config_router
 from routes.template_routes import template_router
 from routes.inspect_routes import inspect_router
 from routes.statistics_routes import statistics_router
+from routes.artifact_routes import artifact_router
+from container.app_container import DEPLOY_TASK_SERVICE
+from manager import ARTIFACT_STORE_MANAGER
+from service.async_docker_service import AsyncDockerService
+from service.container_state_cache import ContainerStateCache
+from service.container_stats_sampler import ContainerStatsSampler
+from utils.docker_engine_client import DockerEngineClient
 
 
 # 是否开启Swagger
 ENABLE_SWAGGER = True
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 根据持久化的任务状态恢复部署队列
+    DEPLOY_TASK_SERVICE.recover()
+    # 周期性清理不再被任务引用的产物
+    ARTIFACT_STORE_MANAGER.start_gc_scheduler(DEPLOY_TASK_SERVICE.collect_artifact_references)
+    # 加载容器状态并订阅 Docker 事件流
+    ContainerStateCache.get_instance().start()
+    # 后台采集运行中容器的资源使用情况
+    ContainerStatsSampler.get_instance().start()
+    yield
+    ContainerStatsSampler.get_instance().stop()
+    ContainerStateCache.get_instance().stop()
+    AsyncDockerService.shutdown()
+    # 关闭 Docker Engine API 连接池
+    DockerEngineClient.get_instance().close()
+
+
 app = FastAPI(
     title="Deploy Agent",
     description=(""),
@@ -42,6 +69,7 @@ app = FastAPI(
     },
     docs_url="/docs" if ENABLE_SWAGGER else None,
     openapi_url="/openapi.json" if ENABLE_SWAGGER else None,
+    lifespan=lifespan,
 )
 
 # 更换国内 CDN
@@ -90,6 +118,7 @@ app.include_router(system_config_router)
 app.include_router(template_router)
 app.include_router(inspect_router)
 app.include_router(statistics_router)
+app.include_router(artifact_router)
 
 
 if __name__ == "__main__":
@@ -9,13 +9,19 @@ manager 包统一暴露全局单例管理器实例。
 - DEPLOY_HISTORY_DATA_MANAGER: 管理部署历史记录数据
 - SYSTEM_CONFIG_DATA_MANAGER: 管理系统配置项数据
 - TEMPLATE_MANAGER: 管理部署模板及其内容
+- ARTIFACT_STORE_MANAGER: 管理内容寻址的部署产物存储
+- UPLOAD_SESSION_MANAGER: 管理分片、可续传的产物上传会话
 """
 from .deploy_task_data_manager import DeployTaskDataManager
 from .project_data_manager import ProjectDataManager
 from .system_config_data_manager import SystemConfigDataManager
 from .template_manager import TemplateManager
+from .artifact_store_manager import ArtifactStoreManager
+from .upload_session_manager import UploadSessionManager
 
 PROJECT_DATA_MANAGER = ProjectDataManager().get_instance()
 DEPLOY_TASK_DATA_MANAGER = DeployTaskDataManager().get_instance()
 SYSTEM_CONFIG_DATA_MANAGER = SystemConfigDataManager().get_instance()
-TEMPLATE_MANAGER = TemplateManager().get_instance()
\ No newline at end of file
+TEMPLATE_MANAGER = TemplateManager().get_instance()
+ARTIFACT_STORE_MANAGER = ArtifactStoreManager().get_instance()
+UPLOAD_SESSION_MANAGER = UploadSessionManager().get_instance()
\ No newline at end of file
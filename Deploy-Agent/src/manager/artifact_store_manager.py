@@ -0,0 +1,309 @@
+import hashlib
+import os
+import stat
+import tempfile
+import time
+from datetime import datetime
+from threading import RLock, Timer
+from typing import BinaryIO, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from config.app_config import app_config
+from .repository import create_repository
+
+
+class ArtifactStoreManager:
+    """
+    ArtifactStoreManager
+
+    内容寻址的部署产物存储（Content-Addressed Storage）。
+
+    存储结构：
+        - data/artifacts/sha256/<前两位>/<digest>: 产物文件，按 SHA-256 摘要命名，写入后只读
+        - data/artifacts/tmp: 上传过程中的临时文件
+        - data/artifacts/uploads: 分片上传会话（见 UploadSessionManager）
+        - artifact_data.json（或 SQLite 的 artifact 表）: 产物索引，记录大小、时间与引用的任务 ID
+
+    说明：
+        - 上传时边写入边计算摘要，内容相同的产物只保存一份
+        - 每个引用产物的部署任务计一次引用，任务删除或被取消时释放引用
+        - GC 清理没有任何引用、且超过宽限期未被使用的产物；
+          清理前会根据现存任务重新核对引用，避免索引与任务数据不一致
+    """
+
+    _instance = None
+    _table_name = "artifact"
+    _key_field = "digest"
+    _data_file_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        "data",
+        "artifact_data.json"
+    )
+    _store_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        "data",
+        "artifacts"
+    )
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ArtifactStoreManager, cls).__new__(cls)
+            cls._instance._init_store()
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _init_store(self):
+        self._repository = create_repository(self._table_name, self._data_file_path, self._key_field)
+        self._lock = RLock()
+        self._records: Optional[Dict[str, Dict]] = None
+        self._gc_timer: Optional[Timer] = None
+
+    # ==============================
+    # 写入
+    # ==============================
+
+    def store_stream(self, stream: BinaryIO, file_name: Optional[str] = None) -> Dict:
+        """
+        将文件流写入产物存储，返回产物索引记录。
+
+        边读边计算 SHA-256，写完后按摘要落位；内容已存在时丢弃本次写入。
+        """
+        tmp_dir = os.path.join(self._store_dir, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        sha256 = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sha256.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+                file.flush()
+                os.fsync(file.fileno())
+
+            return self.commit_file(tmp_path, sha256.hexdigest(), size, file_name)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def commit_file(self, file_path: str, digest: str, size: int, file_name: Optional[str] = None) -> Dict:
+        """
+        将已计算好摘要的文件移入产物存储（文件会被移动），返回产物索引记录。
+        """
+        blob_path = self.get_blob_path(digest)
+
+        with self._lock:
+            self._ensure_loaded()
+
+            if os.path.isfile(blob_path):
+                os.remove(file_path)
+                logger.debug(f"产物已存在，跳过写入: sha256={digest}")
+            else:
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(file_path, blob_path)
+                os.chmod(blob_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                logger.info(f"产物已写入: sha256={digest}, size={size}")
+
+            now = datetime.now()
+            record = self._records.get(digest)
+            if record is None:
+                record = {
+                    "digest": digest,
+                    "file_name": file_name,
+                    "size": size,
+                    "refs": [],
+                    "created_at": now,
+                    "last_used_at": now,
+                }
+                self._records[digest] = record
+                self._repository.insert(record)
+            else:
+                record["last_used_at"] = now
+                if file_name:
+                    record["file_name"] = file_name
+                self._repository.update(digest, {
+                    "file_name": record.get("file_name"),
+                    "last_used_at": now,
+                })
+
+            return dict(record)
+
+    # ==============================
+    # 读取
+    # ==============================
+
+    def get_blob_path(self, digest: str) -> str:
+        digest = digest.lower()
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid sha256 digest: {digest}")
+        return os.path.join(self._store_dir, "sha256", digest[:2], digest)
+
+    def get_artifact(self, digest: str) -> Optional[Dict]:
+        """
+        获取产物索引记录，产物文件缺失时返回 None。
+        """
+        with self._lock:
+            self._ensure_loaded()
+            record = self._records.get(digest)
+            if record is None or not os.path.isfile(self.get_blob_path(digest)):
+                return None
+            return dict(record)
+
+    def list_artifacts(self) -> List[Dict]:
+        with self._lock:
+            self._ensure_loaded()
+            return [dict(record) for record in self._records.values()]
+
+    # ==============================
+    # 引用计数
+    # ==============================
+
+    def add_reference(self, digest: str, task_id: str):
+        with self._lock:
+            self._ensure_loaded()
+            record = self._records.get(digest)
+            if record is None:
+                raise ValueError(f"Artifact not found: {digest}")
+
+            if task_id not in record["refs"]:
+                record["refs"].append(task_id)
+            record["last_used_at"] = datetime.now()
+            self._repository.update(digest, {
+                "refs": record["refs"],
+                "last_used_at": record["last_used_at"],
+            })
+
+    def release_reference(self, digest: Optional[str], task_id: str):
+        if not digest:
+            return
+
+        with self._lock:
+            self._ensure_loaded()
+            record = self._records.get(digest)
+            if record is None or task_id not in record["refs"]:
+                return
+
+            record["refs"].remove(task_id)
+            self._repository.update(digest, {"refs": record["refs"]})
+            logger.debug(f"产物引用已释放: sha256={digest}, task_id={task_id}, refs={len(record['refs'])}")
+
+    # ==============================
+    # GC
+    # ==============================
+
+    def gc(self, live_task_refs: Optional[Dict[str, Iterable[str]]] = None) -> Dict:
+        """
+        清理未被引用的产物。
+
+        Args:
+            live_task_refs: 现存任务的引用关系（digest -> 任务 ID 列表），
+                传入时以此为准校正索引中的引用，未传入时仅按索引中的引用判断
+
+        Returns:
+            清理统计：删除数量与释放的字节数
+        """
+        grace_seconds = app_config.artifact.gc_grace_seconds
+        now = datetime.now()
+        removed_count = 0
+        freed_bytes = 0
+
+        with self._lock:
+            self._ensure_loaded()
+
+            if live_task_refs is not None:
+                for digest, record in self._records.items():
+                    refs = sorted(set(live_task_refs.get(digest, [])))
+                    if refs != sorted(record["refs"]):
+                        record["refs"] = refs
+                        self._repository.update(digest, {"refs": refs})
+
+            for digest, record in list(self._records.items()):
+                if record["refs"]:
+                    continue
+
+                last_used_at = record.get("last_used_at") or record.get("created_at")
+                if isinstance(last_used_at, str):
+                    last_used_at = datetime.fromisoformat(last_used_at)
+                if last_used_at and (now - last_used_at).total_seconds() < grace_seconds:
+                    continue
+
+                blob_path = self.get_blob_path(digest)
+                try:
+                    os.remove(blob_path)
+                except FileNotFoundError:
+                    pass
+
+                del self._records[digest]
+                self._repository.delete(digest)
+                removed_count += 1
+                freed_bytes += record.get("size") or 0
+
+            self._cleanup_tmp_files(grace_seconds)
+
+        if removed_count:
+            logger.info(f"产物 GC 完成: removed_count={removed_count}, freed_bytes={freed_bytes}")
+
+        return {"removed_count": removed_count, "freed_bytes": freed_bytes}
+
+    def start_gc_scheduler(self, live_task_refs_provider):
+        """
+        启动周期性 GC。
+
+        Args:
+            live_task_refs_provider: 返回现存任务引用关系的函数，每次 GC 时调用
+        """
+        interval = app_config.artifact.gc_interval_seconds
+        if interval <= 0 or self._gc_timer is not None:
+            return
+
+        def run():
+            try:
+                self.gc(live_task_refs_provider())
+            except Exception as e:
+                logger.exception(f"产物 GC 失败: {e}")
+            finally:
+                self._gc_timer = Timer(interval, run)
+                self._gc_timer.daemon = True
+                self._gc_timer.start()
+
+        self._gc_timer = Timer(0, run)
+        self._gc_timer.daemon = True
+        self._gc_timer.start()
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _ensure_loaded(self):
+        if self._records is not None:
+            return
+        self._records = {record["digest"]: record for record in self._repository.load_all()}
+        for record in self._records.values():
+            record.setdefault("refs", [])
+
+    def _cleanup_tmp_files(self, grace_seconds: int):
+        tmp_dir = os.path.join(self._store_dir, "tmp")
+        if not os.path.isdir(tmp_dir):
+            return
+
+        expire_before = time.time() - max(grace_seconds, 3600)
+        for name in os.listdir(tmp_dir):
+            path = os.path.join(tmp_dir, name)
+            try:
+                if os.path.getmtime(path) < expire_before:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
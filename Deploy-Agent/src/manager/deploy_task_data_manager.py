@@ -1,9 +1,16 @@
-import json
+import atexit
+import base64
 import os
-from typing import List, Optional
+from bisect import bisect_left, bisect_right, insort
+from threading import Lock, RLock, Timer
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
+from loguru import logger
+
+from config.app_config import app_config
 from models.entity.deploy_task import DeployTask
+from .repository import BaseRepository, JournalRepository, JsonRepository, create_repository
 
 
 class DeployTaskDataManager:
@@ -11,18 +18,40 @@ class DeployTaskDataManager:
     DeployTaskDataManager
 
     仅负责 DeployTask 的持久化存取，不处理任务业务逻辑。
+
+    存储说明：
+        - 首次访问时将 deploy_task_data.json 一次性加载到内存，之后的读写都在内存中完成
+        - 以任务 ID 为主键，并维护 project_id、status 二级索引，单条查询为 O(1)
+        - 维护按 created_at 排序的有序索引，分页查询最新任务的成本与页大小成正比
+        - 默认（JSON 快照）：写操作只标记脏数据，由定时器合并（write-behind）后整体落盘，
+          落盘采用“临时文件 + 原子重命名”，避免进程中途退出导致文件损坏
+        - 开启 datasource.json.journal 后：每次变更追加一条日志记录，
+          日志达到阈值后再合并为新快照，写入成本与变更大小成正比
+        - datasource.type 为 sqlite 时：每次变更直接写入 deploy_task 表
+        - 返回的 DeployTask 为内存中的实例，修改请通过 update_deploy_task_fields 完成
     """
 
     _instance = None
+    _table_name = "deploy_task"
+    _key_field = "id"
     _data_file_path = os.path.join(
         os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
         "data",
         "deploy_task_data.json"
     )
+    _journal_file_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        "data",
+        "deploy_task_data.journal"
+    )
+
+    # 合并落盘的延迟（秒）：窗口期内的多次写操作只会触发一次文件写入
+    _flush_delay_seconds = 1.0
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(DeployTaskDataManager, cls).__new__(cls)
+            cls._instance._init_store()
         return cls._instance
 
     @classmethod
@@ -31,92 +60,366 @@ class DeployTaskDataManager:
             cls._instance = cls()
         return cls._instance
 
+    def _init_store(self):
+        self._lock = RLock()
+        self._flush_lock = Lock()
+        self._loaded = False
+        self._repository = self._create_repository()
+
+        # 主存储：task_id -> DeployTask（保持插入顺序）
+        self._tasks: Dict[str, DeployTask] = {}
+        # 二级索引：project_id -> {task_id}、status -> {task_id}
+        self._project_index: Dict[str, Set[str]] = {}
+        self._status_index: Dict[str, Set[str]] = {}
+        # 有序索引：[(created_at, task_id)]，按创建时间升序
+        self._created_order: List[Tuple[datetime, str]] = []
+
+        self._dirty = False
+        self._flush_timer: Optional[Timer] = None
+
+        # 进程退出前把尚未落盘的修改写入文件
+        atexit.register(self.flush)
+
     def save_deploy_task(self, deploy_task: DeployTask):
         """
         保存一个新的 DeployTask。
         """
-        deploy_task_list = self._load_deploy_tasks()
-        deploy_task_list.append(deploy_task)
-        self._save_deploy_tasks(deploy_task_list)
+        with self._lock:
+            self._ensure_loaded()
+            self._put_task(deploy_task)
+            self._persist(lambda: self._repository.insert(deploy_task.model_dump()))
 
     def get_deploy_task(self, deploy_task_id: str) -> Optional[DeployTask]:
         """
         根据任务 ID 获取 DeployTask。
         """
-        deploy_task_list = self._load_deploy_tasks()
-        for task in deploy_task_list:
-            if task.id == deploy_task_id:
-                return task
-        return None
+        with self._lock:
+            self._ensure_loaded()
+            return self._tasks.get(deploy_task_id)
 
     def update_deploy_task_fields(self, deploy_task_id: str, updated_data: dict):
         """
         按字段更新指定任务。
         """
-        deploy_task_list = self._load_deploy_tasks()
+        with self._lock:
+            self._ensure_loaded()
 
-        for task in deploy_task_list:
-            if task.id == deploy_task_id:
-                for key, value in updated_data.items():
-                    if hasattr(task, key):
-                        setattr(task, key, value)
+            task = self._tasks.get(deploy_task_id)
+            if task is None:
+                raise ValueError(f"DeployTask not found: {deploy_task_id}")
 
-                if hasattr(task, "updated_at"):
-                    task.updated_at = datetime.now()
+            applied_data = {}
+            reorder = "created_at" in updated_data
+            self._unindex_task(task, include_order=reorder)
+            for key, value in updated_data.items():
+                if hasattr(task, key):
+                    setattr(task, key, value)
+                    applied_data[key] = value
 
-                self._save_deploy_tasks(deploy_task_list)
-                return
+            if hasattr(task, "updated_at"):
+                task.updated_at = datetime.now()
+                applied_data["updated_at"] = task.updated_at
 
-        raise ValueError(f"DeployTask not found: {deploy_task_id}")
+            self._index_task(task, include_order=reorder)
+            self._persist(lambda: self._repository.update(deploy_task_id, applied_data))
 
     def delete_deploy_task(self, deploy_task_id: str):
         """
         删除指定任务。
         """
-        deploy_task_list = self._load_deploy_tasks()
-        new_task_list = [task for task in deploy_task_list if task.id != deploy_task_id]
-        self._save_deploy_tasks(new_task_list)
+        with self._lock:
+            self._ensure_loaded()
+
+            task = self._tasks.pop(deploy_task_id, None)
+            if task is None:
+                return
+
+            self._unindex_task(task)
+            self._persist(lambda: self._repository.delete(deploy_task_id))
 
     def list_deploy_tasks(self) -> List[DeployTask]:
         """
         返回所有任务。
         """
-        return self._load_deploy_tasks()
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._tasks.values())
 
     def list_deploy_tasks_by_project_id(self, project_id: str) -> List[DeployTask]:
         """
         根据 project_id 查询任务列表。
         """
-        deploy_task_list = self._load_deploy_tasks()
-        return [task for task in deploy_task_list if task.project_id == project_id]
+        with self._lock:
+            self._ensure_loaded()
+            return self._collect(self._project_index.get(project_id))
+
+    def list_deploy_tasks_by_status(self, status: str) -> List[DeployTask]:
+        """
+        根据 status 查询任务列表。
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._collect(self._status_index.get(status))
+
+    def query_deploy_tasks(
+        self,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        trigger_type: Optional[str] = None,
+        operator: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[DeployTask], int, Optional[str]]:
+        """
+        按条件分页查询任务（按创建时间倒序）。
+
+        参数说明：
+            project_id / status: 走二级索引过滤
+            trigger_type / operator: 逐条过滤，operator 匹配 operator_name 或 operator_id
+            created_from / created_to: 创建时间范围（闭区间），走有序索引定位
+            offset / limit: 偏移分页，limit 为 None 时返回全部
+            cursor: 游标分页，取上一页返回的 next_cursor，从该位置之后继续查询
+
+        Returns:
+            (当前页任务列表, 满足条件的总数（不受游标与分页影响）, 下一页游标)
+        """
+        created_from = self._to_naive(created_from)
+        created_to = self._to_naive(created_to)
+
+        with self._lock:
+            self._ensure_loaded()
+
+            candidates: Optional[Set[str]] = None
+            for index, key in ((self._project_index, project_id), (self._status_index, status)):
+                if key is None:
+                    continue
+                task_ids = index.get(key, set())
+                candidates = task_ids if candidates is None else candidates & task_ids
+
+            # 候选集较小时直接对候选集排序，避免在全量有序索引上长距离扫描
+            if candidates is not None and len(candidates) < len(self._created_order):
+                sequence = sorted(self._order_key(self._tasks[task_id]) for task_id in candidates)
+                candidates = None
+            else:
+                sequence = self._created_order
+
+            low = bisect_left(sequence, (created_from, "")) if created_from else 0
+            high = bisect_right(sequence, (created_to, "\uffff")) if created_to else len(sequence)
+
+            def matches(task: DeployTask) -> bool:
+                if candidates is not None and task.id not in candidates:
+                    return False
+                if trigger_type and task.trigger_type != trigger_type:
+                    return False
+                if operator and operator not in (task.operator_name, str(task.operator_id)):
+                    return False
+                return True
+
+            needs_scan = candidates is not None or trigger_type or operator
+            if needs_scan:
+                total = sum(1 for i in range(low, high) if matches(self._tasks[sequence[i][1]]))
+            else:
+                total = max(high - low, 0)
+
+            if cursor:
+                high = min(high, bisect_left(sequence, self._decode_cursor(cursor)))
+
+            page: List[DeployTask] = []
+            skipped = 0
+            has_more = False
+            for i in range(high - 1, low - 1, -1):
+                task = self._tasks[sequence[i][1]]
+                if not matches(task):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                if limit is not None and len(page) >= limit:
+                    has_more = True
+                    break
+                page.append(task)
+
+            next_cursor = self._encode_cursor(page[-1]) if has_more and page else None
+            return page, total, next_cursor
 
     def replace_all_deploy_tasks(self, deploy_tasks: List[DeployTask]):
         """
         用新的任务列表整体覆盖存储内容。
         """
-        self._save_deploy_tasks(deploy_tasks)
+        with self._lock:
+            self._loaded = True
+            self._reset_store()
+            for task in deploy_tasks:
+                self._put_task(task)
+            # 整体覆盖不论哪种存储都需要写完整快照
+            self._mark_dirty()
+
+    def flush(self):
+        """
+        立即将内存中的修改写入文件。
 
-    def _load_deploy_tasks(self) -> List[DeployTask]:
+        正常情况下由定时器自动触发，进程退出时也会调用一次。
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+
+                if not self._dirty:
+                    return
+
+                snapshot = [task.model_dump() for task in self._tasks.values()]
+                self._dirty = False
+
+                # 追加日志模式下，压缩会清空日志，必须在锁内完成，避免丢失并发追加的记录
+                if self._repository.supports_incremental_write:
+                    self._write_snapshot(snapshot)
+                    return
+
+            self._write_snapshot(snapshot)
+
+    # ==============================
+    # 内部方法（调用方需持有 self._lock）
+    # ==============================
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+
+        self._reset_store()
+        for item in self._repository.load_all():
+            task = DeployTask(**item)
+            self._put_task(task)
+        self._loaded = True
+
+        logger.debug(f"DeployTask 数据已加载到内存, count={len(self._tasks)}")
+
+    def _reset_store(self):
+        self._tasks = {}
+        self._project_index = {}
+        self._status_index = {}
+        self._created_order = []
+
+    def _put_task(self, task: DeployTask):
+        previous = self._tasks.get(task.id)
+        if previous is not None:
+            self._unindex_task(previous)
+
+        self._tasks[task.id] = task
+        self._index_task(task)
+
+    def _index_task(self, task: DeployTask, include_order: bool = True):
+        self._project_index.setdefault(task.project_id, set()).add(task.id)
+        self._status_index.setdefault(task.status, set()).add(task.id)
+
+        if include_order:
+            # 新任务通常是最新的，insort 落在列表末尾，代价接近 O(1)
+            insort(self._created_order, self._order_key(task))
+
+    def _unindex_task(self, task: DeployTask, include_order: bool = True):
+        for index, key in ((self._project_index, task.project_id), (self._status_index, task.status)):
+            task_ids = index.get(key)
+            if task_ids is None:
+                continue
+            task_ids.discard(task.id)
+            if not task_ids:
+                del index[key]
+
+        if include_order:
+            key = self._order_key(task)
+            position = bisect_left(self._created_order, key)
+            if position < len(self._created_order) and self._created_order[position] == key:
+                del self._created_order[position]
+
+    @staticmethod
+    def _order_key(task: DeployTask) -> Tuple[datetime, str]:
+        return task.created_at or datetime.min, task.id
+
+    @staticmethod
+    def _to_naive(value: Optional[datetime]) -> Optional[datetime]:
+        # 任务时间均为本地无时区时间，带时区的查询参数先转换为本地时间
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+
+    @staticmethod
+    def _encode_cursor(task: DeployTask) -> str:
+        created_at, task_id = DeployTaskDataManager._order_key(task)
+        raw = f"{created_at.isoformat()}|{task_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
         try:
-            with open(self._data_file_path, "r", encoding="utf-8") as file:
-                raw_data = json.load(file)
-                return [DeployTask(**item) for item in raw_data]
-        except (FileNotFoundError, json.JSONDecodeError):
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            created_at, task_id = raw.split("|", 1)
+            return datetime.fromisoformat(created_at), task_id
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}") from None
+
+    def _collect(self, task_ids: Optional[Set[str]]) -> List[DeployTask]:
+        if not task_ids:
             return []
+        # 按插入顺序返回，与全量扫描时的顺序保持一致
+        if len(task_ids) * 4 < len(self._tasks):
+            tasks = [self._tasks[task_id] for task_id in task_ids]
+            tasks.sort(key=lambda task: task.created_at or datetime.min)
+            return tasks
+        return [task for task_id, task in self._tasks.items() if task_id in task_ids]
+
+    def _persist(self, write_change):
+        """
+        持久化一次变更：支持增量写入的存储立即写入，否则合并后整体落盘。
+        """
+        if not self._repository.supports_incremental_write:
+            self._mark_dirty()
+            return
+
+        write_change()
+        if self._repository.needs_compaction():
+            self._mark_dirty()
 
-    def _save_deploy_tasks(self, deploy_tasks: List[DeployTask]):
-        def default_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Unserializable object {obj} of type {type(obj)}")
-
-        os.makedirs(os.path.dirname(self._data_file_path), exist_ok=True)
-
-        with open(self._data_file_path, "w", encoding="utf-8") as file:
-            json.dump(
-                [task.model_dump() for task in deploy_tasks],
-                file,
-                indent=4,
-                ensure_ascii=False,
-                default=default_serializer
-            )
\ No newline at end of file
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = Timer(self._flush_delay_seconds, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    # ==============================
+    # 存储读写
+    # ==============================
+
+    def _create_repository(self) -> BaseRepository:
+        if (app_config.datasource.type or "json").lower() != "json":
+            return create_repository(self._table_name, self._data_file_path, self._key_field)
+
+        json_config = app_config.datasource.json
+        journal_repository = JournalRepository(
+            self._data_file_path,
+            self._journal_file_path,
+            compact_threshold=json_config.journal_compact_threshold,
+        )
+
+        if json_config.journal:
+            logger.info(f"DeployTask 使用快照 + 追加日志存储: {self._journal_file_path}")
+            return journal_repository
+
+        # 从追加日志模式切回时，先把残留日志合并进快照，避免丢失数据
+        if journal_repository.has_journal():
+            logger.warning(f"检测到残留的部署任务日志，合并到快照: {self._journal_file_path}")
+            journal_repository.replace_all(journal_repository.load_all())
+
+        return JsonRepository(self._data_file_path, indent=None)
+
+    def _write_snapshot(self, snapshot: List[dict]):
+        try:
+            self._repository.replace_all(snapshot)
+        except Exception as e:
+            logger.exception(f"DeployTask 数据落盘失败: {e}")
+            with self._lock:
+                self._mark_dirty()
@@ -0,0 +1,51 @@
+# manager/repository/__init__.py
+"""
+repository 包封装数据的底层存储介质。
+
+DataManager 只与 BaseRepository 交互，不关心数据最终落在整份 JSON 文件、
+追加日志还是 SQLite 中。存储类型由 config.yaml 中的 app.datasource.type 决定。
+
+暴露内容：
+- BaseRepository: 仓储接口
+- JsonRepository: 整文件 JSON 数组存储（默认）
+- JournalRepository: 快照 + 追加日志存储
+- SqliteRepository: SQLite（WAL 模式）存储
+- create_repository: 按配置创建仓储实例
+"""
+import os
+
+from config.app_config import CONFIG_PATH, app_config
+from .base_repository import BaseRepository
+from .json_repository import JsonRepository
+from .journal_repository import JournalRepository
+from .sqlite_repository import SqliteRepository
+
+
+def resolve_sqlite_path() -> str:
+    """
+    解析 SQLite 数据库文件路径，相对路径基于 Agent 根目录（config.yaml 所在目录）。
+    """
+    path = app_config.datasource.sqlite.path
+    if os.path.isabs(path):
+        return path
+    return os.path.join(str(CONFIG_PATH.parent), path)
+
+
+def create_repository(table_name: str, json_file_path: str, key_field: str = "id") -> BaseRepository:
+    """
+    按 app.datasource.type 创建仓储实例。
+
+    Args:
+        table_name: SQLite 存储时使用的表名
+        json_file_path: JSON 存储时使用的数据文件路径
+        key_field: 记录主键字段
+    """
+    datasource_type = (app_config.datasource.type or "json").lower()
+
+    if datasource_type == "sqlite":
+        return SqliteRepository(resolve_sqlite_path(), table_name, key_field)
+
+    if datasource_type != "json":
+        raise ValueError(f"Unsupported datasource type: {app_config.datasource.type}")
+
+    return JsonRepository(json_file_path, key_field)
@@ -0,0 +1,66 @@
+# manager/repository/base_repository.py
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+
+def json_default_serializer(obj):
+    """
+    json.dump 的 default 序列化函数，统一将时间类型转换为 ISO 字符串。
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Unserializable object {obj} of type {type(obj)}")
+
+
+class BaseRepository(ABC):
+    """
+    BaseRepository
+
+    数据仓储接口，记录统一以 dict 表示，由 key_field 指定主键字段。
+
+    说明：
+        - supports_incremental_write 为 True 的实现，单条写入的成本与变更大小成正比，
+          调用方可以在每次变更时直接写入
+        - 为 False 的实现（如整文件 JSON），调用方应尽量合并变更后调用 replace_all 整体写入
+    """
+
+    supports_incremental_write: bool = False
+
+    def __init__(self, key_field: str = "id"):
+        self.key_field = key_field
+
+    @abstractmethod
+    def load_all(self) -> List[Dict]:
+        """返回全部记录（按写入顺序）。"""
+
+    @abstractmethod
+    def get(self, key: Any) -> Optional[Dict]:
+        """根据主键获取单条记录。"""
+
+    def find_by(self, field: str, value: Any) -> List[Dict]:
+        """按字段查询记录，默认实现为全量扫描。"""
+        return [record for record in self.load_all() if record.get(field) == value]
+
+    @abstractmethod
+    def insert(self, record: Dict):
+        """新增或整体覆盖一条记录。"""
+
+    @abstractmethod
+    def update(self, key: Any, fields: Dict):
+        """按字段更新一条记录，记录不存在时抛出 ValueError。"""
+
+    @abstractmethod
+    def delete(self, key: Any):
+        """删除一条记录，记录不存在时忽略。"""
+
+    @abstractmethod
+    def replace_all(self, records: List[Dict]):
+        """用新的记录列表整体覆盖存储内容。"""
+
+    def needs_compaction(self) -> bool:
+        """是否建议调用方尽快执行一次 replace_all 以压缩存储。"""
+        return False
+
+    def close(self):
+        """释放底层资源。"""
@@ -0,0 +1,173 @@
+# manager/repository/journal_repository.py
+import json
+import os
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .base_repository import BaseRepository, json_default_serializer
+from .json_repository import JsonRepository
+
+
+class JournalRepository(BaseRepository):
+    """
+    JournalRepository
+
+    快照 + 追加日志（journal）存储。
+
+    存储结构：
+        - snapshot_path: JSON 数组快照，格式与 JsonRepository 相同
+        - journal_path: 每行一条 JSON 变更记录，形如
+              {"op": "put", "record": {...}}
+              {"op": "patch", "key": "...", "fields": {...}}
+              {"op": "delete", "key": "..."}
+
+    说明：
+        - 写入：每次变更只追加一行，成本与变更大小成正比，与历史数据量无关
+        - 读取：加载快照后按顺序重放日志；进程崩溃导致的半行记录会被跳过
+        - 压缩：日志条数达到 compact_threshold 后 needs_compaction() 返回 True，
+          由调用方通过 replace_all 写入新快照并清空日志
+        - update 不校验记录是否存在，由调用方保证
+    """
+
+    supports_incremental_write = True
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        journal_path: str,
+        key_field: str = "id",
+        compact_threshold: int = 1000,
+    ):
+        super().__init__(key_field)
+        self._snapshot = JsonRepository(snapshot_path, key_field, indent=None)
+        self.journal_path = journal_path
+        self.compact_threshold = compact_threshold
+
+        self._lock = Lock()
+        self._journal_file = None
+        self._journal_entries = self._count_journal_entries()
+
+    def load_all(self) -> List[Dict]:
+        records: Dict[Any, Dict] = {
+            record.get(self.key_field): record
+            for record in self._snapshot.load_all()
+        }
+
+        entries = 0
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                for line_no, line in enumerate(file, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"忽略无法解析的日志记录: {self.journal_path}:{line_no}")
+                        continue
+                    self._apply(records, entry)
+                    entries += 1
+        except FileNotFoundError:
+            pass
+
+        self._journal_entries = entries
+        return list(records.values())
+
+    def get(self, key: Any) -> Optional[Dict]:
+        # 需要完整重放，仅适合低频调用；高频读取应由调用方在内存中缓存
+        for record in self.load_all():
+            if record.get(self.key_field) == key:
+                return record
+        return None
+
+    def insert(self, record: Dict):
+        self._append({"op": "put", "record": record})
+
+    def update(self, key: Any, fields: Dict):
+        self._append({"op": "patch", "key": key, "fields": fields})
+
+    def delete(self, key: Any):
+        self._append({"op": "delete", "key": key})
+
+    def replace_all(self, records: List[Dict]):
+        """
+        写入新快照并清空日志（即一次压缩）。
+
+        先写快照再删除日志：若两步之间进程退出，重放旧日志的结果与新快照一致。
+        """
+        with self._lock:
+            self._snapshot.replace_all(records)
+            self._close_journal()
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_entries = 0
+
+    def needs_compaction(self) -> bool:
+        return self._journal_entries >= self.compact_threshold
+
+    def has_journal(self) -> bool:
+        return os.path.exists(self.journal_path)
+
+    def close(self):
+        with self._lock:
+            self._close_journal()
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _apply(self, records: Dict[Any, Dict], entry: Dict):
+        op = entry.get("op")
+        if op == "put":
+            record = entry.get("record") or {}
+            records[record.get(self.key_field)] = record
+        elif op == "patch":
+            record = records.get(entry.get("key"))
+            if record is not None:
+                record.update(entry.get("fields") or {})
+        elif op == "delete":
+            records.pop(entry.get("key"), None)
+        else:
+            logger.warning(f"忽略未知的日志操作: {op}")
+
+    def _append(self, entry: Dict):
+        line = json.dumps(
+            entry,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=json_default_serializer
+        )
+        with self._lock:
+            if self._journal_file is None:
+                self._open_journal()
+            self._journal_file.write(line + "\n")
+            self._journal_file.flush()
+            self._journal_entries += 1
+
+    def _open_journal(self):
+        os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+
+        # 上次异常退出可能留下不完整的最后一行，补一个换行避免与新记录粘连
+        needs_newline = False
+        if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > 0:
+            with open(self.journal_path, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                needs_newline = file.read(1) != b"\n"
+
+        self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+        if needs_newline:
+            self._journal_file.write("\n")
+
+    def _close_journal(self):
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+
+    def _count_journal_entries(self) -> int:
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                return sum(1 for line in file if line.strip())
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,71 @@
+# manager/repository/json_repository.py
+import json
+from typing import Any, Dict, List, Optional
+
+from utils.file_util import atomic_write_json
+from .base_repository import BaseRepository, json_default_serializer
+
+
+class JsonRepository(BaseRepository):
+    """
+    JsonRepository
+
+    将全部记录以 JSON 数组的形式保存在单个文件中。
+    每次读操作都会重新读取文件，每次写操作都会整体重写文件（原子替换）。
+    """
+
+    supports_incremental_write = False
+
+    def __init__(self, file_path: str, key_field: str = "id", indent: Optional[int] = 4):
+        super().__init__(key_field)
+        self.file_path = file_path
+        self.indent = indent
+
+    def load_all(self) -> List[Dict]:
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return []
+
+    def get(self, key: Any) -> Optional[Dict]:
+        for record in self.load_all():
+            if record.get(self.key_field) == key:
+                return record
+        return None
+
+    def insert(self, record: Dict):
+        records = self.load_all()
+        key = record.get(self.key_field)
+        for i, item in enumerate(records):
+            if item.get(self.key_field) == key:
+                records[i] = record
+                break
+        else:
+            records.append(record)
+        self.replace_all(records)
+
+    def update(self, key: Any, fields: Dict):
+        records = self.load_all()
+        for record in records:
+            if record.get(self.key_field) == key:
+                record.update(fields)
+                self.replace_all(records)
+                return
+        raise ValueError(f"Record not found: {key}")
+
+    def delete(self, key: Any):
+        records = self.load_all()
+        remaining = [record for record in records if record.get(self.key_field) != key]
+        if len(remaining) != len(records):
+            self.replace_all(remaining)
+
+    def replace_all(self, records: List[Dict]):
+        dump_kwargs = {"indent": self.indent} if self.indent else {"separators": (",", ":")}
+        atomic_write_json(
+            self.file_path,
+            records,
+            ensure_ascii=False,
+            default=json_default_serializer,
+            **dump_kwargs
+        )
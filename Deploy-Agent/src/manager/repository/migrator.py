@@ -0,0 +1,86 @@
+# manager/repository/migrator.py
+"""
+一次性迁移工具：将 data 目录下的 JSON 数据导入 SQLite。
+
+用法（在 src 目录下执行）：
+    python -m manager.repository.migrator
+    python -m manager.repository.migrator --overwrite
+
+迁移完成后将 config.yaml 中的 app.datasource.type 改为 sqlite 并重启 Agent。
+原 JSON 文件不会被修改或删除，可作为备份保留。
+"""
+import argparse
+from typing import Dict, Optional
+
+from loguru import logger
+
+from manager.artifact_store_manager import ArtifactStoreManager
+from manager.deploy_task_data_manager import DeployTaskDataManager
+from manager.project_data_manager import ProjectDataManager
+from manager.system_config_data_manager import SystemConfigDataManager
+from manager.template_manager import TemplateManager
+from . import resolve_sqlite_path
+from .journal_repository import JournalRepository
+from .json_repository import JsonRepository
+from .sqlite_repository import SqliteRepository
+
+MANAGER_CLASSES = [
+    ProjectDataManager,
+    TemplateManager,
+    SystemConfigDataManager,
+    DeployTaskDataManager,
+    ArtifactStoreManager,
+]
+
+
+def migrate_json_to_sqlite(db_path: Optional[str] = None, overwrite: bool = False) -> Dict[str, int]:
+    """
+    将各 DataManager 的 JSON 数据导入 SQLite。
+
+    Args:
+        db_path: SQLite 数据库文件路径，默认取 config.yaml 中的 app.datasource.sqlite.path
+        overwrite: 目标表已有数据时是否覆盖；为 False 时跳过非空表
+
+    Returns:
+        Dict[str, int]: 每张表导入的记录数，跳过的表为 -1
+    """
+    db_path = db_path or resolve_sqlite_path()
+    result: Dict[str, int] = {}
+
+    for manager_class in MANAGER_CLASSES:
+        table_name = manager_class._table_name
+        key_field = manager_class._key_field
+
+        journal_path = getattr(manager_class, "_journal_file_path", None)
+        if journal_path:
+            # 部署任务可能处于追加日志模式，需要快照 + 日志一起重放
+            source = JournalRepository(manager_class._data_file_path, journal_path, key_field)
+        else:
+            source = JsonRepository(manager_class._data_file_path, key_field)
+
+        target = SqliteRepository(db_path, table_name, key_field)
+        try:
+            if target.count() > 0 and not overwrite:
+                logger.warning(f"[{table_name}] 目标表已有数据，跳过（如需覆盖请使用 --overwrite）")
+                result[table_name] = -1
+                continue
+
+            records = source.load_all()
+            target.replace_all(records)
+            result[table_name] = len(records)
+            logger.info(f"[{table_name}] 已导入 {len(records)} 条记录")
+        finally:
+            source.close()
+            target.close()
+
+    logger.info(f"JSON -> SQLite 迁移完成: {db_path}")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="将 JSON 数据一次性迁移到 SQLite")
+    parser.add_argument("--db-path", default=None, help="SQLite 数据库文件路径")
+    parser.add_argument("--overwrite", action="store_true", help="覆盖目标表中已有的数据")
+    args = parser.parse_args()
+
+    migrate_json_to_sqlite(args.db_path, args.overwrite)
@@ -0,0 +1,177 @@
+# manager/repository/sqlite_repository.py
+import json
+import os
+import sqlite3
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from .base_repository import BaseRepository, json_default_serializer
+
+
+class SqliteRepository(BaseRepository):
+    """
+    SqliteRepository
+
+    基于 SQLite（WAL 模式）的存储，每种数据一张表。
+
+    表结构：
+        - id: 主键，取值为记录中 key_field 字段的字符串形式
+        - project_id / status / created_at: 从记录中提取的常用查询字段，均建有索引
+        - data: 完整记录的 JSON 文本
+
+    说明：
+        - 单条增删改只涉及一行数据，成本与历史数据量无关
+        - 更新使用 UPSERT 保留 rowid，load_all 按 rowid 返回，与 JSON 文件中的顺序一致
+    """
+
+    supports_incremental_write = True
+
+    INDEXED_FIELDS = ("project_id", "status", "created_at")
+
+    def __init__(self, db_path: str, table_name: str, key_field: str = "id"):
+        super().__init__(key_field)
+        self.db_path = db_path
+        self.table_name = table_name
+
+        self._lock = Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(
+            db_path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_table()
+
+    def load_all(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM {self.table_name} ORDER BY rowid"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get(self, key: Any) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT data FROM {self.table_name} WHERE id = ?",
+                (str(key),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by(self, field: str, value: Any) -> List[Dict]:
+        """
+        按字段查询记录，project_id / status 走索引，其他字段退化为全表扫描。
+        """
+        if field not in self.INDEXED_FIELDS:
+            return [record for record in self.load_all() if record.get(field) == value]
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM {self.table_name} WHERE {field} = ? ORDER BY rowid",
+                (self._to_column_value(value),)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def insert(self, record: Dict):
+        with self._lock:
+            self._upsert(record)
+
+    def update(self, key: Any, fields: Dict):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    f"SELECT data FROM {self.table_name} WHERE id = ?",
+                    (str(key),)
+                ).fetchone()
+                if row is None:
+                    raise ValueError(f"Record not found: {key}")
+
+                record = json.loads(row[0])
+                record.update(fields)
+                self._upsert(record)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: Any):
+        with self._lock:
+            self._conn.execute(
+                f"DELETE FROM {self.table_name} WHERE id = ?",
+                (str(key),)
+            )
+
+    def replace_all(self, records: List[Dict]):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(f"DELETE FROM {self.table_name}")
+                for record in records:
+                    self._upsert(record)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ==============================
+    # 内部方法（调用方需持有 self._lock）
+    # ==============================
+
+    def _create_table(self):
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.table_name} (
+                id TEXT PRIMARY KEY,
+                project_id TEXT,
+                status TEXT,
+                created_at TEXT,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        for field in self.INDEXED_FIELDS:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_{field} "
+                f"ON {self.table_name}({field})"
+            )
+
+    def _upsert(self, record: Dict):
+        data = json.dumps(record, ensure_ascii=False, default=json_default_serializer)
+        self._conn.execute(
+            f"""
+            INSERT INTO {self.table_name} (id, project_id, status, created_at, data)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                project_id = excluded.project_id,
+                status = excluded.status,
+                created_at = excluded.created_at,
+                data = excluded.data
+            """,
+            (
+                str(record.get(self.key_field)),
+                self._to_column_value(record.get("project_id")),
+                self._to_column_value(record.get("status")),
+                self._to_column_value(record.get("created_at")),
+                data,
+            )
+        )
+
+    @staticmethod
+    def _to_column_value(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        try:
+            return json_default_serializer(value)
+        except TypeError:
+            return str(value)
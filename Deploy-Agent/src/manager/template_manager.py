@@ -1,33 +1,26 @@
 import os
-import json
 import uuid
 from typing import List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 
+from .repository import create_repository
+
+
 class TemplateManager:
     _instance = None
+    _table_name = "template"
+    _key_field = "id"
     _data_file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "template_data.json")
     _template_folder_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "template")
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(TemplateManager, cls).__new__(cls)
+            cls._instance._repository = create_repository(cls._table_name, cls._data_file_path, cls._key_field)
         return cls._instance
 
-    def _load_templates(self) -> List[Dict]:
-        try:
-            with open(self._data_file_path, "r", encoding="utf-8") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return []
-
-    def _save_templates(self, templates: List[Dict]):
-        with open(self._data_file_path, "w", encoding="utf-8") as file:
-            json.dump(templates, file, indent=4, ensure_ascii=False)
-
     def create_template(self, template_data: Dict) -> Dict:
-        templates = self._load_templates()
         now = datetime.now().isoformat()
 
         template_path = os.path.join(self._template_folder_path, template_data["relative_path"])
@@ -45,51 +38,40 @@ class TemplateManager:
             "created_at": now,
             "updated_at": now
         }
-        templates.append(template)
-        self._save_templates(templates)
+        self._repository.insert(template)
         return template
 
     def get_template(self, template_id: str) -> Optional[Dict]:
-        templates = self._load_templates()
-        for tpl in templates:
-            if tpl["id"] == template_id:
-                return tpl
-        return None
+        return self._repository.get(template_id)
 
     def update_template(self, template_id: str, updated_data: Dict):
-        templates = self._load_templates()
-        for tpl in templates:
-            if tpl["id"] == template_id:
-                if "content" in updated_data:
-                    file_path = os.path.join(self._template_folder_path, tpl["relative_path"])
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(updated_data["content"])
-                if "description" in updated_data:
-                    tpl["description"] = updated_data["description"]
-                tpl["updated_at"] = datetime.now().isoformat()
-                self._save_templates(templates)
-                return
-        raise ValueError(f"Template with ID {template_id} not found.")
+        tpl = self._repository.get(template_id)
+        if tpl is None:
+            raise ValueError(f"Template with ID {template_id} not found.")
+
+        if "content" in updated_data:
+            file_path = os.path.join(self._template_folder_path, tpl["relative_path"])
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(updated_data["content"])
+
+        fields = {"updated_at": datetime.now().isoformat()}
+        if "description" in updated_data:
+            fields["description"] = updated_data["description"]
+        self._repository.update(template_id, fields)
 
     def delete_template(self, template_id: str):
-        templates = self._load_templates()
-        target_tpl = None
-        for tpl in templates:
-            if tpl["id"] == template_id:
-                target_tpl = tpl
-                break
+        target_tpl = self._repository.get(template_id)
 
         if target_tpl:
             file_path = os.path.join(self._template_folder_path, target_tpl["relative_path"])
             if os.path.exists(file_path):
                 os.remove(file_path)
-            templates = [tpl for tpl in templates if tpl["id"] != template_id]
-            self._save_templates(templates)
+            self._repository.delete(template_id)
         else:
             raise ValueError(f"Template with ID {template_id} not found.")
 
     def list_templates(self) -> List[Dict]:
-        return self._load_templates()
+        return self._repository.load_all()
 
     def get_template_content(self, template_id: str) -> str:
         tpl = self.get_template(template_id)
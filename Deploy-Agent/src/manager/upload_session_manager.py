@@ -0,0 +1,310 @@
+import hashlib
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Optional, Set
+
+from loguru import logger
+
+from config.app_config import app_config
+from utils.file_util import atomic_write_json
+from .artifact_store_manager import ArtifactStoreManager
+
+
+class UploadChunkWriter:
+    """
+    单次分片写入。
+
+    由 UploadSessionManager.open_writer 创建，写入完成后必须调用 close()。
+    """
+
+    def __init__(self, manager: "UploadSessionManager", session_id: str, offset: int, file):
+        self._manager = manager
+        self.session_id = session_id
+        self.offset = offset
+        self._file = file
+        self._closed = False
+
+    def write(self, chunk: bytes):
+        total_size = self._manager._sessions_meta[self.session_id].get("total_size")
+        if total_size is not None and self.offset + len(chunk) > total_size:
+            raise ValueError(f"写入数据超出文件总大小: total_size={total_size}")
+
+        self._file.write(chunk)
+        self._manager._advance_hash(self.session_id, self.offset, chunk)
+        self.offset += len(chunk)
+
+    def close(self) -> int:
+        """
+        结束本次写入，返回已接收的字节数。
+        """
+        if not self._closed:
+            self._closed = True
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._manager._release_writer(self.session_id)
+        return self.offset
+
+
+class UploadSessionManager:
+    """
+    UploadSessionManager
+
+    分片、可续传的产物上传会话。
+
+    流程：
+        1. create_session: 创建会话，返回 session_id
+        2. open_writer(offset) + write + close: 从指定偏移写入一段数据，可多次调用；
+           offset 必须不大于已接收字节数，小于时从该位置截断后重写（用于断点重传）
+        3. finalize(sha256): 校验大小与摘要后移入 ArtifactStoreManager，返回产物记录
+
+    存储结构（与产物存储位于同一目录下，finalize 时可直接重命名）：
+        - data/artifacts/uploads/<session_id>.part: 已接收的数据
+        - data/artifacts/uploads/<session_id>.json: 会话信息（文件名、总大小、期望摘要、时间）
+
+    说明：
+        - 已接收字节数以 .part 文件大小为准，Agent 重启后仍可续传
+        - 按顺序写入时增量计算摘要；发生截断重写或重启后，finalize 时重新读取文件计算
+        - 同一会话同一时刻只允许一个写入或 finalize；finalize 的摘要计算不持有全局锁
+        - 超过 upload_session_ttl_seconds 未更新的会话在创建新会话时清理
+    """
+
+    _instance = None
+    _upload_dir = os.path.join(ArtifactStoreManager._store_dir, "uploads")
+
+    HASH_READ_SIZE = 1024 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(UploadSessionManager, cls).__new__(cls)
+            cls._instance._lock = Lock()
+            cls._instance._sessions_meta: Dict[str, Dict] = {}
+            cls._instance._hashers: Dict[str, tuple] = {}
+            cls._instance._writing: Set[str] = set()
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def create_session(
+        self,
+        file_name: str,
+        total_size: Optional[int] = None,
+        sha256: Optional[str] = None,
+    ) -> Dict:
+        self.cleanup_expired_sessions()
+
+        os.makedirs(self._upload_dir, exist_ok=True)
+        session_id = uuid.uuid4().hex
+        now = datetime.now()
+
+        meta = {
+            "session_id": session_id,
+            "file_name": file_name,
+            "total_size": total_size,
+            "sha256": sha256.lower() if sha256 else None,
+            "created_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+        }
+
+        with self._lock:
+            open(self._part_path(session_id), "wb").close()
+            atomic_write_json(self._meta_path(session_id), meta)
+            self._sessions_meta[session_id] = meta
+            self._hashers[session_id] = (hashlib.sha256(), 0)
+
+        logger.info(f"上传会话已创建: session_id={session_id}, file_name={file_name}, total_size={total_size}")
+        return self._with_progress(meta)
+
+    def get_session(self, session_id: str) -> Optional[Dict]:
+        with self._lock:
+            meta = self._load_meta(session_id)
+            if meta is None:
+                return None
+            return self._with_progress(meta)
+
+    def open_writer(self, session_id: str, offset: int) -> UploadChunkWriter:
+        """
+        从 offset 开始写入数据。
+
+        Raises:
+            ValueError: 会话不存在、已有写入进行中，或 offset 大于已接收字节数
+        """
+        with self._lock:
+            meta = self._load_meta(session_id)
+            if meta is None:
+                raise ValueError(f"上传会话不存在: {session_id}")
+            if session_id in self._writing:
+                raise ValueError(f"上传会话正在写入中: {session_id}")
+
+            received_size = os.path.getsize(self._part_path(session_id))
+            if offset < 0 or offset > received_size:
+                raise ValueError(f"offset 无效: offset={offset}, received_size={received_size}")
+
+            file = open(self._part_path(session_id), "r+b")
+            if offset < received_size:
+                file.truncate(offset)
+                logger.info(f"上传会话从断点重写: session_id={session_id}, offset={offset}")
+            file.seek(offset)
+
+            meta["updated_at"] = datetime.now().isoformat()
+            atomic_write_json(self._meta_path(session_id), meta)
+
+            self._writing.add(session_id)
+            return UploadChunkWriter(self, session_id, offset, file)
+
+    def finalize(self, session_id: str, sha256: Optional[str] = None) -> Dict:
+        """
+        校验并完成上传，返回产物存储中的产物记录。
+
+        Raises:
+            ValueError: 会话不存在、正在写入、大小不符或摘要不符
+        """
+        # 锁内只做检查并标记为处理中（占用写入标记，期间不能写入、中止或再次完成），
+        # 重新计算摘要可能需要读取整个文件，在锁外进行，不阻塞其他会话
+        with self._lock:
+            meta = self._load_meta(session_id)
+            if meta is None:
+                raise ValueError(f"上传会话不存在: {session_id}")
+            if session_id in self._writing:
+                raise ValueError(f"上传会话正在写入中: {session_id}")
+
+            expected_sha256 = (sha256 or meta.get("sha256") or "").lower()
+            if not expected_sha256:
+                raise ValueError("缺少 sha256 校验值")
+
+            part_path = self._part_path(session_id)
+            size = os.path.getsize(part_path)
+            total_size = meta.get("total_size")
+            if total_size is not None and size != total_size:
+                raise ValueError(f"文件大小不符: received_size={size}, total_size={total_size}")
+
+            hasher, hashed_size = self._hashers.get(session_id, (None, -1))
+            self._writing.add(session_id)
+
+        try:
+            if hasher is not None and hashed_size == size:
+                digest = hasher.hexdigest()
+            else:
+                digest = self._hash_file(part_path)
+
+            if digest != expected_sha256:
+                raise ValueError(f"sha256 校验失败: expected={expected_sha256}, actual={digest}")
+
+            with self._lock:
+                artifact = ArtifactStoreManager.get_instance().commit_file(
+                    part_path, digest, size, meta.get("file_name")
+                )
+                self._remove_session(session_id)
+        finally:
+            self._release_writer(session_id)
+
+        logger.info(f"上传会话已完成: session_id={session_id}, sha256={digest}, size={size}")
+        return artifact
+
+    def abort(self, session_id: str) -> bool:
+        with self._lock:
+            if self._load_meta(session_id) is None:
+                return False
+            if session_id in self._writing:
+                raise ValueError(f"上传会话正在写入中: {session_id}")
+            self._remove_session(session_id)
+            return True
+
+    def cleanup_expired_sessions(self):
+        ttl = app_config.artifact.upload_session_ttl_seconds
+        if ttl <= 0 or not os.path.isdir(self._upload_dir):
+            return
+
+        expire_before = time.time() - ttl
+        with self._lock:
+            for name in os.listdir(self._upload_dir):
+                if not name.endswith(".json"):
+                    continue
+                session_id = name[:-len(".json")]
+                if session_id in self._writing:
+                    continue
+                try:
+                    if os.path.getmtime(os.path.join(self._upload_dir, name)) < expire_before:
+                        self._remove_session(session_id)
+                        logger.info(f"过期上传会话已清理: session_id={session_id}")
+                except FileNotFoundError:
+                    pass
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _part_path(self, session_id: str) -> str:
+        return os.path.join(self._upload_dir, f"{session_id}.part")
+
+    def _meta_path(self, session_id: str) -> str:
+        return os.path.join(self._upload_dir, f"{session_id}.json")
+
+    def _load_meta(self, session_id: str) -> Optional[Dict]:
+        meta = self._sessions_meta.get(session_id)
+        if meta is not None:
+            return meta
+
+        # session_id 由 uuid4().hex 生成，拒绝其他格式，避免路径穿越
+        if len(session_id) != 32 or any(c not in "0123456789abcdef" for c in session_id):
+            return None
+
+        try:
+            with open(self._meta_path(session_id), "r", encoding="utf-8") as file:
+                meta = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        if not os.path.exists(self._part_path(session_id)):
+            return None
+
+        self._sessions_meta[session_id] = meta
+        return meta
+
+    def _with_progress(self, meta: Dict) -> Dict:
+        return {
+            **meta,
+            "received_size": os.path.getsize(self._part_path(meta["session_id"])),
+        }
+
+    def _advance_hash(self, session_id: str, offset: int, chunk: bytes):
+        hasher, hashed_size = self._hashers.get(session_id, (None, -1))
+        if hasher is None:
+            return
+        if offset == hashed_size:
+            hasher.update(chunk)
+            self._hashers[session_id] = (hasher, hashed_size + len(chunk))
+        else:
+            # 非顺序写入，放弃增量摘要，finalize 时重新计算
+            self._hashers.pop(session_id, None)
+
+    def _release_writer(self, session_id: str):
+        with self._lock:
+            self._writing.discard(session_id)
+
+    def _hash_file(self, file_path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            while True:
+                chunk = file.read(self.HASH_READ_SIZE)
+                if not chunk:
+                    break
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _remove_session(self, session_id: str):
+        for path in (self._part_path(session_id), self._meta_path(session_id)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._sessions_meta.pop(session_id, None)
+        self._hashers.pop(session_id, None)
@@ -13,4 +13,6 @@ class AddPythonProjectRequestDto(BaseModel):
     network: str
     python_version: str
     host_project_path: str
-    container_project_path: str
\ No newline at end of file
+    container_project_path: str
+    deploy_timeout_seconds: Optional[int] = None  # 部署任务超时时间（秒），为空时使用全局默认值
+    step_timeout_seconds: Optional[int] = None    # 部署步骤超时时间（秒），为空时使用全局默认值
\ No newline at end of file
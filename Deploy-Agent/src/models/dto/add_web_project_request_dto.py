@@ -8,4 +8,6 @@ class AddWebProjectRequestDto(BaseModel):
     git_repository: str
     host_project_path: str
     container_project_path: str
-    access_url: Optional[str]
\ No newline at end of file
+    access_url: Optional[str]
+    deploy_timeout_seconds: Optional[int] = None  # 部署任务超时时间（秒），为空时使用全局默认值
+    step_timeout_seconds: Optional[int] = None    # 部署步骤超时时间（秒），为空时使用全局默认值
\ No newline at end of file
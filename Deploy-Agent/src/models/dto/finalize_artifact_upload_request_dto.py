@@ -0,0 +1,5 @@
+from typing import Optional
+from pydantic import BaseModel
+
+class FinalizeArtifactUploadRequestDto(BaseModel):
+    sha256: Optional[str] = None  # 文件 SHA-256，未提供时使用创建会话时的值
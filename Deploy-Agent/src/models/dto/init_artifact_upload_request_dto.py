@@ -0,0 +1,7 @@
+from typing import Optional
+from pydantic import BaseModel
+
+class InitArtifactUploadRequestDto(BaseModel):
+    file_name: str
+    total_size: Optional[int] = None  # 文件总字节数，提供时 finalize 会校验
+    sha256: Optional[str] = None      # 文件 SHA-256，也可在 finalize 时提供
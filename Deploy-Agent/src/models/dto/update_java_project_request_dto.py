@@ -13,4 +13,6 @@ class UpdateJavaProjectRequestDto(BaseModel):
     network: Optional[str]
     host_project_path: Optional[str]
     container_project_path: Optional[str]
-    git_repository: Optional[str]
\ No newline at end of file
+    git_repository: Optional[str]
+    deploy_timeout_seconds: Optional[int] = None  # 部署任务超时时间（秒），为空时使用全局默认值
+    step_timeout_seconds: Optional[int] = None    # 部署步骤超时时间（秒），为空时使用全局默认值
\ No newline at end of file
@@ -22,6 +22,7 @@ class DeployTask(BaseModel):
 
     upload_file_name: Optional[str] = None
     upload_file_path: Optional[str] = None
+    artifact_digest: Optional[str] = None  # 产物存储中的 SHA-256 摘要
 
     build_image_name: Optional[str] = None
     build_image_tag: Optional[str] = None
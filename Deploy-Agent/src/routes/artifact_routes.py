@@ -0,0 +1,154 @@
+from fastapi import APIRouter, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from loguru import logger
+from starlette.requests import ClientDisconnect
+
+from models.common.http_result import HttpResult
+from models.dto.init_artifact_upload_request_dto import InitArtifactUploadRequestDto
+from models.dto.finalize_artifact_upload_request_dto import FinalizeArtifactUploadRequestDto
+from manager import ARTIFACT_STORE_MANAGER, UPLOAD_SESSION_MANAGER
+
+
+artifact_router = APIRouter()
+
+
+# 建议的分片大小（字节），客户端可自行调整
+RECOMMENDED_CHUNK_SIZE = 8 * 1024 * 1024
+
+# 分片写入磁盘的缓冲大小（字节）
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+@artifact_router.post("/api/deploy-agent/artifact/upload/init", summary="创建分片上传会话")
+async def init_artifact_upload(dto: InitArtifactUploadRequestDto):
+    """
+    创建分片上传会话。
+
+    完整流程：
+        1. POST /artifact/upload/init 创建会话，得到 session_id
+        2. PUT /artifact/upload/{session_id}?offset=N 以原始请求体上传一段数据，可重复调用；
+           中断后通过 GET /artifact/upload/{session_id} 查询 received_size，从该位置继续上传
+        3. POST /artifact/upload/{session_id}/finalize 校验 sha256，得到 artifact_digest
+        4. 调用项目部署接口时传入 artifact_digest 代替文件
+    """
+    if dto.total_size is not None and dto.total_size < 0:
+        return HttpResult.fail(code=400, msg="total_size 不能小于 0")
+
+    session = await run_in_threadpool(
+        UPLOAD_SESSION_MANAGER.create_session,
+        dto.file_name,
+        dto.total_size,
+        dto.sha256,
+    )
+    return HttpResult.ok(data={**session, "chunk_size": RECOMMENDED_CHUNK_SIZE})
+
+
+@artifact_router.get("/api/deploy-agent/artifact/upload/{session_id}", summary="查询分片上传会话")
+async def get_artifact_upload(session_id: str):
+    session = UPLOAD_SESSION_MANAGER.get_session(session_id)
+    if session is None:
+        return HttpResult.fail(code=404, msg=f"上传会话不存在: {session_id}")
+    return HttpResult.ok(data=session)
+
+
+@artifact_router.put("/api/deploy-agent/artifact/upload/{session_id}", summary="上传分片")
+async def upload_artifact_chunk(
+    session_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0, title="本段数据在文件中的起始偏移"),
+):
+    """
+    以流式方式写入一段数据，请求体为原始字节（application/octet-stream）。
+
+    - offset 必须不大于已接收字节数；小于时从 offset 截断后重写
+    - 连接中断时已写入的数据会保留，可从返回或查询到的 received_size 继续上传
+    """
+    # 文件打开、写入与 fsync 都在线程池中执行，不阻塞事件循环
+    if await run_in_threadpool(UPLOAD_SESSION_MANAGER.get_session, session_id) is None:
+        return HttpResult.fail(code=404, msg=f"上传会话不存在: {session_id}")
+
+    try:
+        writer = await run_in_threadpool(UPLOAD_SESSION_MANAGER.open_writer, session_id, offset)
+    except ValueError as e:
+        session = await run_in_threadpool(UPLOAD_SESSION_MANAGER.get_session, session_id)
+        return HttpResult.fail(
+            code=409,
+            msg=str(e),
+            data={"received_size": session.get("received_size") if session else None}
+        )
+
+    # 请求体按 WRITE_BUFFER_SIZE 攒批后写入，减少线程池切换
+    buffer = bytearray()
+    error = None
+    disconnected = False
+    try:
+        try:
+            async for chunk in request.stream():
+                buffer.extend(chunk)
+                if len(buffer) >= WRITE_BUFFER_SIZE:
+                    await run_in_threadpool(writer.write, bytes(buffer))
+                    buffer.clear()
+        except ClientDisconnect:
+            disconnected = True
+            error = "连接中断"
+
+        # 连接中断前已收到的数据同样保留
+        if buffer:
+            await run_in_threadpool(writer.write, bytes(buffer))
+    except ValueError as e:
+        error = str(e)
+    finally:
+        received_size = await run_in_threadpool(writer.close)
+
+    if error is not None:
+        if disconnected:
+            logger.warning(f"分片上传连接中断: session_id={session_id}, received_size={received_size}")
+        return HttpResult.fail(code=400, msg=error, data={"received_size": received_size})
+
+    return HttpResult.ok(data={"session_id": session_id, "received_size": received_size})
+
+
+@artifact_router.post("/api/deploy-agent/artifact/upload/{session_id}/finalize", summary="完成分片上传")
+async def finalize_artifact_upload(session_id: str, dto: FinalizeArtifactUploadRequestDto):
+    """
+    校验文件大小与 sha256，并将文件移入产物存储。
+
+    返回的 digest 可作为部署接口的 artifact_digest 参数。
+    """
+    if UPLOAD_SESSION_MANAGER.get_session(session_id) is None:
+        return HttpResult.fail(code=404, msg=f"上传会话不存在: {session_id}")
+
+    try:
+        artifact = await run_in_threadpool(UPLOAD_SESSION_MANAGER.finalize, session_id, dto.sha256)
+    except ValueError as e:
+        return HttpResult.fail(code=400, msg=str(e))
+
+    return HttpResult.ok(msg="上传完成", data={
+        "digest": artifact["digest"],
+        "file_name": artifact.get("file_name"),
+        "size": artifact.get("size"),
+    })
+
+
+@artifact_router.delete("/api/deploy-agent/artifact/upload/{session_id}", summary="取消分片上传")
+async def abort_artifact_upload(session_id: str):
+    try:
+        removed = UPLOAD_SESSION_MANAGER.abort(session_id)
+    except ValueError as e:
+        return HttpResult.fail(code=409, msg=str(e))
+
+    if not removed:
+        return HttpResult.fail(code=404, msg=f"上传会话不存在: {session_id}")
+    return HttpResult.ok(msg="上传会话已取消")
+
+
+@artifact_router.get("/api/deploy-agent/artifact/{digest}", summary="查询产物")
+async def get_artifact(digest: str):
+    try:
+        artifact = ARTIFACT_STORE_MANAGER.get_artifact(digest.lower())
+    except ValueError as e:
+        return HttpResult.fail(code=400, msg=str(e))
+
+    if artifact is None:
+        return HttpResult.fail(code=404, msg=f"产物不存在: {digest}")
+    return HttpResult.ok(data=artifact)
@@ -1,10 +1,13 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Query
+from fastapi.concurrency import run_in_threadpool
 
 from models.entity.deploy_task import DeployTask
 from models.common.http_result import HttpResult
 from manager import DEPLOY_TASK_DATA_MANAGER, PROJECT_DATA_MANAGER
+from container.app_container import DEPLOY_TASK_SERVICE
 from utils.user_context import get_current_user
 from loguru import logger
 
@@ -12,46 +15,174 @@ from loguru import logger
 deploy_task_router = APIRouter()
 
 
+def _build_project_map() -> Dict[str, Dict]:
+    """
+    构建项目 ID -> 项目信息的映射，每个请求只读取一次项目数据。
+    """
+    return {project.get("id"): project for project in PROJECT_DATA_MANAGER.list_projects()}
+
+
+def _can_operate_project(user: Optional[Dict], project_id: str) -> bool:
+    """
+    用户是否可以操作该项目：permissions 为 None 表示不限制，否则需包含项目的 project_code。
+    """
+    if not user:
+        return False
+
+    permissions = user.get("permissions")
+    if permissions is None:
+        return True
+
+    project = PROJECT_DATA_MANAGER.get_project(project_id)
+    return project is not None and project.get("project_code") in permissions
+
+
+def _to_task_item(task: DeployTask, project: Optional[Dict]) -> Dict:
+    return {
+        **task.model_dump(),
+        "project_code": project.get("project_code") if project else None,
+        "project_name": project.get("project_name") if project else None,
+    }
+
+
 @deploy_task_router.get("/api/deploy-agent/deploy-task/list", summary="获取部署任务列表")
 async def get_deploy_task_list(
     project_id: Optional[str] = Query(None, title="项目ID"),
+    status: Optional[str] = Query(None, title="任务状态"),
+    trigger_type: Optional[str] = Query(None, title="触发方式"),
+    operator: Optional[str] = Query(None, title="操作者名称或ID"),
+    created_from: Optional[datetime] = Query(None, title="创建时间起"),
+    created_to: Optional[datetime] = Query(None, title="创建时间止"),
 ):
     """
     获取部署任务列表（按创建时间倒序）。
 
     支持参数：
         - project_id: 按项目过滤
+        - status / trigger_type / operator: 按任务字段过滤
+        - created_from / created_to: 按创建时间范围过滤
 
     返回字段：
         - DeployTask 原始字段
         - project_code
         - project_name
+
+    说明：
+        - 返回全部匹配的任务，数据量较大时请使用 /deploy-task/page 分页接口
+        - 所属项目已不存在的任务不返回
+    """
+    task_list, _, _ = DEPLOY_TASK_DATA_MANAGER.query_deploy_tasks(
+        project_id=project_id,
+        status=status,
+        trigger_type=trigger_type,
+        operator=operator,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+    project_map = _build_project_map()
+    result = [
+        _to_task_item(task, project_map[task.project_id])
+        for task in task_list
+        if task.project_id in project_map
+    ]
+
+    return HttpResult.ok(result)
+
+
+@deploy_task_router.get("/api/deploy-agent/deploy-task/page", summary="分页获取部署任务列表")
+async def get_deploy_task_page(
+    project_id: Optional[str] = Query(None, title="项目ID"),
+    status: Optional[str] = Query(None, title="任务状态"),
+    trigger_type: Optional[str] = Query(None, title="触发方式"),
+    operator: Optional[str] = Query(None, title="操作者名称或ID"),
+    created_from: Optional[datetime] = Query(None, title="创建时间起"),
+    created_to: Optional[datetime] = Query(None, title="创建时间止"),
+    offset: int = Query(0, ge=0, title="偏移量"),
+    limit: int = Query(20, ge=1, le=500, title="每页条数"),
+    cursor: Optional[str] = Query(None, title="游标（上一页返回的 next_cursor）"),
+):
+    """
+    分页获取部署任务列表（按创建时间倒序）。
+
+    分页方式：
+        - 偏移分页：offset + limit
+        - 游标分页：传入上一页返回的 next_cursor，offset 相对游标位置计算；
+          翻页期间有新任务写入时不会出现重复或遗漏
+
+    返回字段：
+        - items: 当前页任务（含 project_code、project_name，项目已删除时为 null）
+        - total: 满足过滤条件的任务总数
+        - offset / limit: 本次请求的分页参数
+        - next_cursor: 下一页游标，没有更多数据时为 null
+    """
+    try:
+        task_list, total, next_cursor = DEPLOY_TASK_DATA_MANAGER.query_deploy_tasks(
+            project_id=project_id,
+            status=status,
+            trigger_type=trigger_type,
+            operator=operator,
+            created_from=created_from,
+            created_to=created_to,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        return HttpResult.fail(code=400, msg=str(e))
+
+    project_map = _build_project_map()
+
+    return HttpResult.ok({
+        "items": [_to_task_item(task, project_map.get(task.project_id)) for task in task_list],
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_cursor": next_cursor,
+    })
+
+@deploy_task_router.get("/api/deploy-agent/deploy-task/scheduler/stats", summary="获取部署任务调度统计")
+async def get_scheduler_stats():
+    """
+    获取部署任务调度器的队列长度、排队等待时间与各类资源的利用率。
+    """
+    return HttpResult.ok(DEPLOY_TASK_SERVICE.get_scheduler_stats())
+
+
+@deploy_task_router.post("/api/deploy-agent/deploy-task/cancel/{id}", summary="取消部署任务")
+async def cancel_deploy_task(id: str):
+    """
+    取消指定部署任务，需要有该任务所属项目的权限。
+
+    - PENDING 任务立即取消
+    - RUNNING 任务会终止正在执行的子进程，随后状态变为 CANCELLED
     """
-    task_list: List[DeployTask] = DEPLOY_TASK_DATA_MANAGER.list_deploy_tasks()
+    task = DEPLOY_TASK_DATA_MANAGER.get_deploy_task(id)
+    if task is None:
+        return HttpResult.fail(code=404, msg=f"没有找到 id 为 {id} 的部署任务")
 
-    result = []
+    current_user = get_current_user()
+    if not _can_operate_project(current_user, task.project_id):
+        return HttpResult.fail(code=403, msg="没有取消该项目部署任务的权限")
 
-    for task in task_list:
-        if project_id and task.project_id != project_id:
-            continue
+    operator = current_user.get("nickname") if current_user else None
+    reason = f"任务已被 {operator} 取消" if operator else "任务已取消"
 
-        project = PROJECT_DATA_MANAGER.get_project(task.project_id)
-        if project is None:
-            continue
+    try:
+        status = await run_in_threadpool(DEPLOY_TASK_SERVICE.cancel_task, id, reason)
+    except ValueError as e:
+        return HttpResult.fail(code=400, msg=str(e))
 
-        item = {
-            **task.model_dump(),
-            "project_code": project.get("project_code"),
-            "project_name": project.get("project_name"),
-        }
-        result.append(item)
+    logger.info(
+        f"取消部署任务: task_id={id}, project_id={task.project_id}, "
+        f"status={status}, operator={operator}"
+    )
 
-    result.sort(
-        key=lambda x: x.get("created_at") or "",
-        reverse=True
+    return HttpResult.ok(
+        msg="部署任务已取消" if status == "CANCELLED" else "正在取消部署任务",
+        data={"task_id": id, "status": status}
     )
 
-    return HttpResult.ok(result)
 
 # TODO：要做权限校验
 @deploy_task_router.delete("/api/deploy-agent/deploy-task/delete/{id}", summary="删除部署任务")
@@ -70,6 +201,7 @@ async def delete_deploy_task(id: str):
         return HttpResult.fail(code=400, msg=f"当前任务状态为 {task.status}，不允许删除")
 
     DEPLOY_TASK_DATA_MANAGER.delete_deploy_task(id)
+    DEPLOY_TASK_SERVICE.release_task_artifact(task)
     
     logger.info(
         f"删除部署任务: task_id={id}, project_id={task.project_id}, "
@@ -6,7 +6,7 @@ from loguru import logger
 
 from models.common.http_result import HttpResult
 from models.dto.docker_container_logs_request import DockerContainerLogsRequest
-from service.docker_service import DockerService
+from service.async_docker_service import AsyncDockerService
 
 docker_router = APIRouter()
 
@@ -20,7 +20,7 @@ async def get_docker_container_status(
     container_name: str = Query(..., description="容器名称")
 ):
     try:
-        container_status = DockerService.get_container_status(container_name)
+        container_status = await AsyncDockerService.get_container_status(container_name)
 
         if container_status is None:
             return HttpResult.ok(data={
@@ -52,7 +52,7 @@ async def get_docker_container_info(
     查询单个容器的 docker ps 视图信息。
     """
     try:
-        container_info = DockerService.get_container_ps_info(container_name)
+        container_info = await AsyncDockerService.get_container_ps_info(container_name)
 
         if container_info is None:
             return HttpResult.fail(code=404, msg="容器不存在")
@@ -79,7 +79,7 @@ async def get_docker_container_inspect(
     适合高级调试、挂载、网络、环境变量等详细信息分析。
     """
     try:
-        inspect_info = DockerService.get_container_inspect_info(container_name)
+        inspect_info = await AsyncDockerService.get_container_inspect_info(container_name)
 
         if inspect_info is None:
             return HttpResult.fail(code=404, msg="容器不存在")
@@ -103,7 +103,7 @@ async def get_docker_container_summary():
     获取 Docker 容器状态概览。
     """
     try:
-        summary = DockerService.get_container_summary()
+        summary = await AsyncDockerService.get_container_summary()
         return HttpResult.ok(data=summary)
 
     except Exception as e:
@@ -120,7 +120,7 @@ async def list_docker_containers():
     获取所有容器的 docker ps 视图信息列表。
     """
     try:
-        containers = DockerService.list_containers()
+        containers = await AsyncDockerService.list_containers()
         return HttpResult.ok(data=containers)
 
     except Exception as e:
@@ -137,7 +137,7 @@ async def list_docker_images():
     获取本地所有 Docker 镜像信息。
     """
     try:
-        images = DockerService.list_images()
+        images = await AsyncDockerService.list_images()
         return HttpResult.ok(data=images)
 
     except Exception as e:
@@ -154,7 +154,7 @@ async def get_docker_info():
     获取 Docker 基本信息。
     """
     try:
-        info = DockerService.get_docker_info()
+        info = await AsyncDockerService.get_docker_info()
         return HttpResult.ok(data=info)
 
     except Exception as e:
@@ -168,7 +168,7 @@ async def get_docker_info():
 )
 async def get_docker_container_logs(request: DockerContainerLogsRequest):
     try:
-        logs_data = DockerService.get_container_logs(
+        logs_data = await AsyncDockerService.get_container_logs(
             container_name=request.container_name,
             tail=request.tail,
             timestamps=request.timestamps,
@@ -192,7 +192,7 @@ async def get_docker_container_logs(request: DockerContainerLogsRequest):
 )
 async def start_container(container_name: str = Query(..., description="容器名称")):
     try:
-        status = DockerService.get_container_status(container_name)
+        status = await AsyncDockerService.get_container_status(container_name)
 
         if status is None:
             return HttpResult.fail(code=404, msg="容器不存在")
@@ -200,7 +200,7 @@ async def start_container(container_name: str = Query(..., description="容器
         if status.startswith("Up"):
             return HttpResult.fail(msg="容器已在运行")
 
-        output = DockerService.start_container(container_name)
+        output = await AsyncDockerService.start_container(container_name)
         return HttpResult.ok(data=output)
 
     except subprocess.CalledProcessError as e:
@@ -217,7 +217,7 @@ async def start_container(container_name: str = Query(..., description="容器
 )
 async def stop_container(container_name: str = Query(..., description="容器名称")):
     try:
-        status = DockerService.get_container_status(container_name)
+        status = await AsyncDockerService.get_container_status(container_name)
 
         if status is None:
             return HttpResult.fail(code=404, msg="容器不存在")
@@ -225,7 +225,7 @@ async def stop_container(container_name: str = Query(..., description="容器名
         if not status.startswith("Up"):
             return HttpResult.fail(msg="容器未在运行")
 
-        output = DockerService.stop_container(container_name)
+        output = await AsyncDockerService.stop_container(container_name)
         return HttpResult.ok(data=output)
 
     except subprocess.CalledProcessError as e:
@@ -242,7 +242,7 @@ async def stop_container(container_name: str = Query(..., description="容器名
 )
 async def restart_container(container_name: str = Query(..., description="容器名称")):
     try:
-        status = DockerService.get_container_status(container_name)
+        status = await AsyncDockerService.get_container_status(container_name)
 
         if status is None:
             return HttpResult.fail(code=404, msg="容器不存在")
@@ -250,7 +250,7 @@ async def restart_container(container_name: str = Query(..., description="容器
         if not status.startswith("Up"):
             return HttpResult.fail(msg="容器未在运行，无法重启")
 
-        output = DockerService.restart_container(container_name)
+        output = await AsyncDockerService.restart_container(container_name)
         return HttpResult.ok(data=output)
 
     except subprocess.CalledProcessError as e:
@@ -268,7 +268,7 @@ async def get_docker_container_stats(
     container_name: str = Query(..., description="容器名称")
 ):
     try:
-        stats = DockerService.get_container_stats(container_name)
+        stats = await AsyncDockerService.get_container_stats(container_name)
 
         if stats is None:
             return HttpResult.fail(code=404, msg="容器不存在或未运行")
@@ -281,4 +281,51 @@ async def get_docker_container_stats(
 
     except Exception as e:
         logger.error(f"获取容器 stats 异常: {e}")
-        return HttpResult.fail(msg=str(e))
\ No newline at end of file
+        return HttpResult.fail(msg=str(e))
+
+
+@docker_router.get(
+    "/api/deploy-agent/docker/containers/stats/all",
+    summary="获取所有运行中容器的资源监控信息"
+)
+async def list_docker_container_stats():
+    """
+    一次返回所有运行中容器的 CPU、内存、网络与磁盘 IO。
+    """
+    try:
+        stats_list = await AsyncDockerService.list_container_stats()
+        return HttpResult.ok(data=stats_list)
+
+    except subprocess.CalledProcessError as e:
+        logger.error(f"获取容器 stats 列表失败: {e}")
+        return HttpResult.fail(msg=str(e))
+
+    except Exception as e:
+        logger.error(f"获取容器 stats 列表异常: {e}")
+        return HttpResult.fail(msg=str(e))
+
+
+@docker_router.get(
+    "/api/deploy-agent/docker/containers/stats/history",
+    summary="获取指定容器最近的资源监控曲线"
+)
+async def get_docker_container_stats_history(
+    container_name: str = Query(..., description="容器名称")
+):
+    """
+    返回后台采样的最近若干条数值数据（约每秒一条），用于绘制趋势图。
+    """
+    try:
+        samples = await AsyncDockerService.get_container_stats_history(container_name)
+
+        if samples is None:
+            return HttpResult.fail(msg="容器资源采样未启用（需要 Docker Engine API）")
+
+        return HttpResult.ok(data={
+            "container_name": container_name,
+            "samples": samples,
+        })
+
+    except Exception as e:
+        logger.error(f"获取容器 stats 曲线异常: {e}")
+        return HttpResult.fail(msg=str(e))
@@ -5,11 +5,11 @@
 """
 import platform
 import socket
-import subprocess
 from datetime import datetime
 from fastapi import APIRouter
 from models.common.http_result import HttpResult
 from config.app_config import app_config
+from service.async_docker_service import AsyncDockerService
 from loguru import logger
 
 
@@ -26,7 +26,7 @@ async def get_info():
     """
     try:
         try:
-            docker_version = subprocess.check_output(["docker", "--version"], encoding="utf-8").strip()
+            docker_version = await AsyncDockerService.get_docker_version()
         except Exception as e:
             docker_version = f"无法获取: {e}"
 
@@ -1,12 +1,13 @@
 import json
 import uuid
 import httpx
-from pathlib import Path
 from httpx import RequestError
+from typing import Dict, Optional
 from urllib.parse import urlparse
 from datetime import datetime, timezone
 
 from fastapi import File, Query, Request, UploadFile, Form, APIRouter
+from fastapi.concurrency import run_in_threadpool
 
 from models.common.http_result import HttpResult
 from models.entity.deploy_task import DeployTask
@@ -16,15 +17,34 @@ from models.dto.add_python_project_request_dto import AddPythonProjectRequestDto
 from models.dto.update_web_project_request_dto import UpdateWebProjectRequestDto
 from models.dto.update_java_project_request_dto import UpdateJavaProjectRequestDto
 from models.dto.update_python_project_request_dto import UpdatePythonProjectRequestDto
-from manager import PROJECT_DATA_MANAGER
+from manager import ARTIFACT_STORE_MANAGER, PROJECT_DATA_MANAGER
 from container.app_container import DEPLOY_TASK_SERVICE
+from service.project_status_service import ProjectStatusService
 from utils.user_context import get_current_user
-from utils.file_util import save_uploaded_file
 
 
 project_router = APIRouter()
 
 
+async def _resolve_deploy_artifact(file: Optional[UploadFile], artifact_digest: Optional[str]) -> Dict:
+    """
+    解析部署使用的产物：直接上传的文件写入产物存储；指定 artifact_digest 时使用已上传的产物。
+
+    Raises:
+        ValueError: 两者均未提供，或指定的产物不存在
+    """
+    if file is not None:
+        return await run_in_threadpool(ARTIFACT_STORE_MANAGER.store_stream, file.file, file.filename)
+
+    if artifact_digest:
+        artifact = ARTIFACT_STORE_MANAGER.get_artifact(artifact_digest.lower())
+        if artifact is None:
+            raise ValueError(f"产物不存在: {artifact_digest}")
+        return artifact
+
+    raise ValueError("请上传部署文件或指定 artifact_digest")
+
+
 # ==================== 通用项目接口 ====================
 
 @project_router.get(
@@ -98,9 +118,7 @@ async def check_web_project_deployment_status(id: str = Query(..., description="
     if not container_path:
         return HttpResult.fail(code=400, msg="项目未配置 container_project_path（容器项目路径）")
 
-    path_obj = Path(container_path)
-
-    if path_obj.exists() and any(path_obj.iterdir()):
+    if ProjectStatusService.get_instance().is_web_project_deployed(container_path):
         deployment_status = "Deployed"
     else:
         deployment_status = "未部署"
@@ -190,6 +208,8 @@ async def add_web_project(dto: AddWebProjectRequestDto):
         "project_group": dto.project_group,
         "host_project_path": dto.host_project_path,
         "container_project_path": dto.container_project_path,
+        "deploy_timeout_seconds": dto.deploy_timeout_seconds,
+        "step_timeout_seconds": dto.step_timeout_seconds,
         "access_url": dto.access_url,
         "git_repository": dto.git_repository,
         "created_at": datetime.now(),
@@ -212,7 +232,7 @@ async def add_web_project(dto: AddWebProjectRequestDto):
 async def update_web_project(update_dto: UpdateWebProjectRequestDto):
     PROJECT_DATA_MANAGER.update_project(
         update_dto.id,
-        update_dto.model_dump(exclude={"id"})
+        update_dto.model_dump(exclude={"id"}, exclude_unset=True)
     )
     return HttpResult.ok(msg="更新成功")
 
@@ -223,7 +243,8 @@ async def update_web_project(update_dto: UpdateWebProjectRequestDto):
     description="上传前端项目压缩包并创建部署任务。注意：当前仅负责上传并解压静态资源，不处理 nginx 配置。"
 )
 async def deploy_web_project(
-    file: UploadFile = File(..., title="前端项目压缩包"),
+    file: Optional[UploadFile] = File(None, title="前端项目压缩包", description="与 artifact_digest 二选一"),
+    artifact_digest: Optional[str] = Form(None, title="已上传产物的 SHA-256 摘要（分片上传 finalize 后返回）"),
     project_id: str = Form(..., title="前端项目ID"),
     task_name: str = Form("Web 项目部署", title="任务名称"),
     trigger_type: str = Form("MANUAL", title="触发方式"),
@@ -235,15 +256,20 @@ async def deploy_web_project(
             return HttpResult.fail(code=404, msg=f"没有 id 为 {project_id} 的 Web 项目")
 
         current_user = get_current_user()
-        upload_file_path = save_uploaded_file(file)
+        try:
+            artifact = await _resolve_deploy_artifact(file, artifact_digest)
+        except ValueError as e:
+            return HttpResult.fail(code=400, msg=str(e))
+        upload_file_path = ARTIFACT_STORE_MANAGER.get_blob_path(artifact["digest"])
 
         task: DeployTask = DEPLOY_TASK_SERVICE.submit_task(
             project_id=project_id,
             task_name=task_name,
             trigger_type=trigger_type,
             deploy_mechanism=deploy_mechanism,
-            upload_file_name=file.filename,
+            upload_file_name=artifact.get("file_name"),
             upload_file_path=upload_file_path,
+            artifact_digest=artifact["digest"],
             build_image_name=project.get("docker_image_name"),
             build_image_tag=project.get("docker_image_tag"),
             container_name=project.get("container_name"),
@@ -308,6 +334,8 @@ async def add_java_project(dto: AddJavaProjectRequestDto):
         "jdk_version": dto.jdk_version,
         "host_project_path": dto.host_project_path,
         "container_project_path": dto.container_project_path,
+        "deploy_timeout_seconds": dto.deploy_timeout_seconds,
+        "step_timeout_seconds": dto.step_timeout_seconds,
         "git_repository": dto.git_repository,
         "created_at": datetime.now(),
         "updated_at": None,
@@ -329,7 +357,7 @@ async def add_java_project(dto: AddJavaProjectRequestDto):
 async def update_java_project(update_dto: UpdateJavaProjectRequestDto):
     PROJECT_DATA_MANAGER.update_project(
         update_dto.id,
-        update_dto.model_dump(exclude={"id"})
+        update_dto.model_dump(exclude={"id"}, exclude_unset=True)
     )
     return HttpResult.ok(msg="更新成功")
 
@@ -340,7 +368,8 @@ async def update_java_project(update_dto: UpdateJavaProjectRequestDto):
     description="上传 Java 项目的 JAR 包并创建部署任务。"
 )
 async def deploy_java_project(
-    file: UploadFile = File(..., title="JAR 文件", description="上传要部署的 JAR 文件"),
+    file: Optional[UploadFile] = File(None, title="JAR 文件", description="上传要部署的 JAR 文件，与 artifact_digest 二选一"),
+    artifact_digest: Optional[str] = Form(None, title="已上传产物的 SHA-256 摘要（分片上传 finalize 后返回）"),
     project_id: str = Form(..., title="项目ID"),
     task_name: str = Form("Java 项目部署", title="任务名称"),
     trigger_type: str = Form("MANUAL", title="触发方式"),
@@ -354,15 +383,20 @@ async def deploy_java_project(
             return HttpResult.fail(code=404, msg=f"没有 id 为 {project_id} 的 Java 项目")
 
         current_user = get_current_user()
-        upload_file_path = save_uploaded_file(file)
+        try:
+            artifact = await _resolve_deploy_artifact(file, artifact_digest)
+        except ValueError as e:
+            return HttpResult.fail(code=400, msg=str(e))
+        upload_file_path = ARTIFACT_STORE_MANAGER.get_blob_path(artifact["digest"])
 
         task: DeployTask = DEPLOY_TASK_SERVICE.submit_task(
             project_id=project_id,
             task_name=task_name,
             trigger_type=trigger_type,
             deploy_mechanism=deploy_mechanism,
-            upload_file_name=file.filename,
+            upload_file_name=artifact.get("file_name"),
             upload_file_path=upload_file_path,
+            artifact_digest=artifact["digest"],
             build_image_name=project.get("docker_image_name"),
             build_image_tag=project.get("docker_image_tag"),
             container_name=project.get("container_name"),
@@ -429,6 +463,8 @@ async def add_python_project(dto: AddPythonProjectRequestDto):
         "python_version": dto.python_version,
         "host_project_path": dto.host_project_path,
         "container_project_path": dto.container_project_path,
+        "deploy_timeout_seconds": dto.deploy_timeout_seconds,
+        "step_timeout_seconds": dto.step_timeout_seconds,
         "git_repository": dto.git_repository,
         "created_at": datetime.now(),
         "updated_at": None,
@@ -450,7 +486,7 @@ async def add_python_project(dto: AddPythonProjectRequestDto):
 async def update_python_project(update_dto: UpdatePythonProjectRequestDto):
     PROJECT_DATA_MANAGER.update_project(
         update_dto.id,
-        update_dto.model_dump(exclude={"id"})
+        update_dto.model_dump(exclude={"id"}, exclude_unset=True)
     )
     return HttpResult.ok(msg="更新成功")
 
@@ -461,7 +497,8 @@ async def update_python_project(update_dto: UpdatePythonProjectRequestDto):
     description="上传 Python 项目的 ZIP 包并部署 Docker 容器。"
 )
 async def deploy_python_project(
-    file: UploadFile = File(..., title="ZIP 文件", description="上传要部署的 Python 项目压缩包"),
+    file: Optional[UploadFile] = File(None, title="ZIP 文件", description="上传要部署的 Python 项目压缩包，与 artifact_digest 二选一"),
+    artifact_digest: Optional[str] = Form(None, title="已上传产物的 SHA-256 摘要（分片上传 finalize 后返回）"),
     project_id: str = Form(..., title="项目ID"),
     task_name: str = Form("Python 项目部署", title="任务名称"),
     trigger_type: str = Form("MANUAL", title="触发方式"),
@@ -474,15 +511,20 @@ async def deploy_python_project(
             return HttpResult.fail(code=404, msg=f"没有 id 为 {project_id} 的 Python 项目")
 
         current_user = get_current_user()
-        upload_file_path = save_uploaded_file(file)
+        try:
+            artifact = await _resolve_deploy_artifact(file, artifact_digest)
+        except ValueError as e:
+            return HttpResult.fail(code=400, msg=str(e))
+        upload_file_path = ARTIFACT_STORE_MANAGER.get_blob_path(artifact["digest"])
 
         task: DeployTask = DEPLOY_TASK_SERVICE.submit_task(
             project_id=project_id,
             task_name=task_name,
             trigger_type=trigger_type,
             deploy_mechanism=deploy_mechanism,
-            upload_file_name=file.filename,
+            upload_file_name=artifact.get("file_name"),
             upload_file_path=upload_file_path,
+            artifact_digest=artifact["digest"],
             build_image_name=project.get("docker_image_name"),
             build_image_tag=project.get("docker_image_tag"),
             container_name=project.get("container_name"),
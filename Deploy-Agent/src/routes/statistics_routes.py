@@ -1,80 +1,19 @@
-from pathlib import Path
 from fastapi import APIRouter
-import json
 import subprocess
-from datetime import datetime, timezone
 from models.common.http_result import HttpResult
-from manager.project_data_manager import ProjectDataManager
-from utils.docker_util import run_docker_command
+from service.async_docker_service import AsyncDockerService
+from service.project_status_service import ProjectStatusService
 
 
 statistics_router = APIRouter()
-PROJECT_DATA_MANAGER = ProjectDataManager().get_instance()
 
 @statistics_router.get("/api/deploy-agent/statistics/project-status", summary="聚合统计项目部署状态", description="返回所有项目运行状态统计")
 async def get_project_deployment_statistics():
-    check_time = datetime.now(timezone.utc).isoformat()
-
     try:
-        all_projects = PROJECT_DATA_MANAGER.list_projects()
-        result = run_docker_command(["ps", "-a", "--format", "json"])
-
-        container_lines = result.strip().split("\n")
-        container_status_map = {}
-
-        for line in container_lines:
-            try:
-                container_info = json.loads(line)
-                name = container_info.get("Names", "")
-                status = container_info.get("Status", "")
-                container_status_map[name] = status
-            except json.JSONDecodeError:
-                continue
-
-        status_summary = {
-            "total": len(all_projects),
-            "running": 0,
-            "exited": 0,
-            "restarting": 0,
-            "awaiting_deployment": 0,
-        }
-
-        for p in all_projects:
-            project_type = p.get("project_type")
-            
-            if project_type.lower() == "web":
-                container_project_path = p.get("container_project_path")
-                if container_project_path and Path(container_project_path).exists() and any(Path(container_project_path).iterdir()):
-                    status_summary["running"] += 1
-                else:
-                    status_summary["awaiting_deployment"] += 1
-            else:
-                container_name = p.get("container_name")
-                matched = False
-                if container_name:
-                    for name, status in container_status_map.items():
-                        if container_name in name:
-                            matched = True
-                            normalized = (status or "").lower()
-                            if "up" in normalized:
-                                status_summary["running"] += 1
-                            elif "exited" in normalized:
-                                status_summary["exited"] += 1
-                            elif "restarting" in normalized:
-                                status_summary["restarting"] += 1
-                            else:
-                                status_summary["unknown"] += 1
-                            break
-
-                if not matched:
-                    status_summary["awaiting_deployment"] += 1
-
-        return HttpResult.ok(data={
-            **status_summary,
-            "check_time": check_time
-        })
+        summary = await AsyncDockerService.run(ProjectStatusService.get_instance().get_status_summary)
+        return HttpResult.ok(data=summary)
 
     except subprocess.CalledProcessError as e:
         return HttpResult.fail(msg=f"Docker command failed: {e}")
     except Exception as e:
-        return HttpResult.fail(msg=str(e))
\ No newline at end of file
+        return HttpResult.fail(msg=str(e))
@@ -0,0 +1,155 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from config.app_config import app_config
+from service.container_state_cache import ContainerStateCache
+from service.container_stats_sampler import ContainerStatsSampler
+from service.docker_service import DockerService
+from utils.docker_engine_client import DockerEngineClient
+
+
+class AsyncDockerService:
+    """
+    AsyncDockerService
+
+    DockerService 的异步版本，供 async 路由使用。
+
+    说明：
+        - Engine API 请求与 docker CLI 子进程都是阻塞调用，放到专用线程池中执行，不阻塞事件循环；
+          线程数与 Engine API 连接池大小（docker.max_connections）一致
+        - 每次调用都有超时（默认 docker.timeout_seconds，停止、重启容器等为
+          DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS），超时抛出 TimeoutError；
+          线程中的 HTTP 请求 / 子进程也按同样的超时终止，不会长期占用线程
+        - 容器状态缓存、资源采样已就绪时直接读取内存，不经过线程池
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    async def run(cls, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        在 Docker 调用线程池中执行阻塞函数。
+        """
+        timeout = timeout or app_config.docker.timeout_seconds
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(cls._get_executor(), functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Docker 调用超时（{timeout} 秒）: {getattr(func, '__name__', func)}") from None
+
+    @classmethod
+    def shutdown(cls):
+        executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=app_config.docker.max_connections,
+                thread_name_prefix="docker-call"
+            )
+        return cls._executor
+
+    # ==============================
+    # 容器
+    # ==============================
+
+    @classmethod
+    async def list_containers(cls) -> List[Dict[str, Any]]:
+        cache = ContainerStateCache.get_instance()
+        if cache.is_ready():
+            return cache.list_containers()
+        return await cls.run(DockerService.list_containers)
+
+    @classmethod
+    async def get_container_status(cls, container_name: str) -> Optional[str]:
+        cache = ContainerStateCache.get_instance()
+        if cache.is_ready():
+            container = cache.get_container(container_name)
+            return container.get("Status") if container else None
+        return await cls.run(DockerService.get_container_status, container_name)
+
+    @classmethod
+    async def get_container_ps_info(cls, container_name: str) -> Optional[Dict[str, Any]]:
+        return await cls.run(DockerService.get_container_ps_info, container_name)
+
+    @classmethod
+    async def get_container_inspect_info(cls, container_name: str) -> Optional[Dict[str, Any]]:
+        return await cls.run(DockerService.get_container_inspect_info, container_name)
+
+    @classmethod
+    async def get_container_summary(cls) -> Dict[str, int]:
+        return await cls.run(DockerService.get_container_summary)
+
+    @classmethod
+    async def get_container_logs(
+        cls,
+        container_name: str,
+        tail: int = 50,
+        timestamps: bool = False,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await cls.run(
+            DockerService.get_container_logs, container_name,
+            tail=tail, timestamps=timestamps, since=since, until=until,
+        )
+
+    @classmethod
+    async def start_container(cls, container_name: str) -> str:
+        return await cls.run(DockerService.start_container, container_name)
+
+    @classmethod
+    async def stop_container(cls, container_name: str) -> str:
+        return await cls.run(
+            DockerService.stop_container, container_name,
+            timeout=DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS
+        )
+
+    @classmethod
+    async def restart_container(cls, container_name: str) -> str:
+        return await cls.run(
+            DockerService.restart_container, container_name,
+            timeout=DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS
+        )
+
+    @classmethod
+    async def get_container_stats(cls, container_name: str) -> Optional[Dict[str, Any]]:
+        sampler = ContainerStatsSampler.get_instance()
+        if sampler.is_active():
+            stats = sampler.get_latest(container_name)
+            if stats is not None:
+                return stats
+        return await cls.run(DockerService.get_container_stats, container_name)
+
+    @classmethod
+    async def list_container_stats(cls) -> List[Dict[str, Any]]:
+        sampler = ContainerStatsSampler.get_instance()
+        if sampler.is_active():
+            return sampler.list_latest()
+        return await cls.run(DockerService.list_container_stats)
+
+    @classmethod
+    async def get_container_stats_history(cls, container_name: str) -> Optional[List[Dict[str, Any]]]:
+        return DockerService.get_container_stats_history(container_name)
+
+    # ==============================
+    # 镜像与系统
+    # ==============================
+
+    @classmethod
+    async def list_images(cls) -> List[Dict[str, Any]]:
+        return await cls.run(DockerService.list_images)
+
+    @classmethod
+    async def get_docker_info(cls) -> Dict[str, Any]:
+        return await cls.run(DockerService.get_docker_info)
+
+    @classmethod
+    async def get_docker_version(cls) -> str:
+        return await cls.run(DockerService.get_docker_version)
@@ -0,0 +1,220 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from utils.docker_engine_client import DockerEngineClient, DockerEngineError
+from utils.docker_format import format_container_ps
+
+
+class ContainerStateCache:
+    """
+    ContainerStateCache
+
+    常驻内存的容器状态表，由 Docker 事件流驱动更新。
+
+    说明：
+        - 启动时通过 Engine API 全量加载一次（容器列表 + 各容器 inspect 的 State）
+        - 订阅 Docker 事件流（type=container），容器创建、启动、停止、删除、重命名等事件到达时只刷新该容器
+        - 按容器名称与 ID 建立索引，查询为 O(1) 字典查找，不调用 docker
+        - Status（如 "Up 2 hours"）与 RunningFor 在读取时按当前时间计算，不会随时间失真
+        - 事件流断开期间 is_ready() 为 False，调用方应直接查询 Docker；重连后重新全量加载，避免遗漏事件
+        - Engine API 不可用（只能使用 docker CLI）时不启用
+    """
+
+    _instance = None
+
+    # 不影响容器状态的事件（exec、attach 等），收到时不刷新
+    IGNORED_ACTION_PREFIXES = (
+        "exec_", "attach", "detach", "resize", "top", "export", "copy", "archive-path", "commit",
+    )
+    # 事件流断开或 Engine API 不可用时的重试间隔（秒），指数退避到上限
+    RETRY_MIN_SECONDS = 1
+    RETRY_MAX_SECONDS = 30
+
+    def __init__(self, client: Optional[DockerEngineClient] = None):
+        self._client = client
+        self._lock = threading.RLock()
+        # container_id -> (/containers/json 的条目, inspect 的 State)
+        self._containers: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        # 容器名称 -> container_id
+        self._ids_by_name: Dict[str, str] = {}
+        self._ready = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def client(self) -> DockerEngineClient:
+        return self._client or DockerEngineClient.get_instance()
+
+    # ==============================
+    # 生命周期
+    # ==============================
+
+    def start(self):
+        """
+        启动后台线程：加载容器状态并订阅事件流。
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="container-state-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        停止更新。阻塞在事件流上的后台线程在连接关闭（或下一个事件到达）时退出。
+        """
+        self._stop_event.set()
+        self._ready = False
+
+    def is_ready(self) -> bool:
+        return self._ready
+
+    # ==============================
+    # 查询
+    # ==============================
+
+    def list_containers(self) -> List[Dict[str, Any]]:
+        """
+        所有容器，格式与 docker ps -a --format "{{json .}}" 一致。
+        """
+        with self._lock:
+            entries = list(self._containers.values())
+        return [format_container_ps(container, state) for container, state in entries]
+
+    def get_container(self, container_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._containers.get(self._ids_by_name.get(container_name, ""))
+        return format_container_ps(*entry) if entry else None
+
+    def refresh(self, container: str):
+        """
+        立即刷新单个容器（名称或 ID）。
+
+        本地启动、停止、删除容器后调用，使后续查询不必等待事件到达。
+        """
+        if not self._ready:
+            return
+        try:
+            self._refresh(container)
+        except DockerEngineError as e:
+            logger.warning(f"刷新容器状态失败: {container}, {e}")
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _run(self):
+        retry_seconds = self.RETRY_MIN_SECONDS
+        while not self._stop_event.is_set():
+            client = self.client
+            if client.is_available():
+                try:
+                    # 从加载前开始订阅，加载期间发生的事件会在订阅后补发
+                    since = time.time()
+                    self._load_all(client)
+                    self._ready = True
+                    retry_seconds = self.RETRY_MIN_SECONDS
+                    logger.info(f"容器状态缓存已加载: count={len(self._containers)}")
+
+                    for event in client.events(since=since, filters={"type": ["container"]}):
+                        if self._stop_event.is_set():
+                            break
+                        self._on_event(event)
+                except Exception as e:
+                    if not self._stop_event.is_set():
+                        logger.warning(f"容器事件流已断开，{retry_seconds} 秒后重新加载: {e}")
+
+            self._ready = False
+            if self._stop_event.wait(retry_seconds):
+                break
+            retry_seconds = min(retry_seconds * 2, self.RETRY_MAX_SECONDS)
+
+    def _load_all(self, client: DockerEngineClient):
+        entries: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        for container in client.list_containers(all=True):
+            try:
+                state = client.inspect_container(container["Id"]).get("State") or {}
+            except DockerEngineError as e:
+                # 列出后被删除的容器
+                if e.status_code == 404:
+                    continue
+                raise
+            entries[container["Id"]] = (container, state)
+
+        with self._lock:
+            self._containers = {}
+            self._ids_by_name = {}
+            for container, state in entries.values():
+                self._put(container, state)
+
+    def _on_event(self, event: Dict[str, Any]):
+        action = event.get("Action") or event.get("status") or ""
+        if action.startswith(self.IGNORED_ACTION_PREFIXES):
+            return
+
+        container_id = event.get("id") or (event.get("Actor") or {}).get("ID")
+        if not container_id:
+            return
+
+        if action == "destroy":
+            with self._lock:
+                self._remove(container_id)
+            return
+
+        try:
+            self._refresh(container_id)
+        except DockerEngineError as e:
+            logger.warning(f"刷新容器状态失败: {container_id}, {e}")
+
+    def _refresh(self, container: str):
+        client = self.client
+        try:
+            inspect_info = client.inspect_container(container)
+        except DockerEngineError as e:
+            if e.status_code == 404:
+                with self._lock:
+                    self._remove(self._ids_by_name.get(container, container))
+                return
+            raise
+
+        container_id = inspect_info["Id"]
+        listed = [
+            item for item in client.list_containers(all=True, filters={"id": [container_id]})
+            if item.get("Id") == container_id
+        ]
+        with self._lock:
+            if listed:
+                self._put(listed[0], inspect_info.get("State") or {})
+            else:
+                self._remove(container_id)
+
+    def _put(self, container: Dict[str, Any], state: Dict[str, Any]):
+        """
+        写入或更新容器（调用方需持有锁），重命名时移除旧名称的索引。
+        """
+        container_id = container["Id"]
+        self._remove(container_id)
+        self._containers[container_id] = (container, state)
+        for name in container.get("Names") or []:
+            self._ids_by_name[name.lstrip("/")] = container_id
+
+    def _remove(self, container_id: str):
+        """
+        移除容器及其名称索引（调用方需持有锁）。
+        """
+        entry = self._containers.pop(container_id, None)
+        if entry is None:
+            return
+        for name in entry[0].get("Names") or []:
+            name = name.lstrip("/")
+            if self._ids_by_name.get(name) == container_id:
+                del self._ids_by_name[name]
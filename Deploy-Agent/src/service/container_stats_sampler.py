@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from loguru import logger
+
+from config.app_config import app_config
+from utils.docker_engine_client import DockerEngineClient, DockerEngineError
+from utils.docker_format import compute_container_stats, format_container_stats
+
+
+class ContainerStatsSampler:
+    """
+    ContainerStatsSampler
+
+    后台持续采集运行中容器的资源使用情况（CPU / 内存 / 网络 / 磁盘 IO）。
+
+    说明：
+        - 每个运行中的容器保持一条长连接的统计流（Engine API stats?stream=1，约每秒推送一次），
+          与 docker stats 的实现方式相同；不再为每次查询等待一个采样周期
+        - 每 SYNC_INTERVAL_SECONDS 同步一次运行中的容器列表，为新容器建立统计流，移除已停止的容器
+        - 保存每个容器的最新采样（docker stats --format "{{json .}}" 格式）与最近 history_size 条
+          数值采样，用于批量查询与曲线展示
+        - 统计流使用独立的连接池，不占用接口请求的连接
+        - Engine API 不可用（只能使用 docker CLI）时不采集，is_active() 为 False
+    """
+
+    _instance = None
+
+    # 同步运行中容器列表的间隔（秒）
+    SYNC_INTERVAL_SECONDS = 5
+    # 同时保持的统计流数量上限
+    MAX_STREAMS = 256
+
+    def __init__(self, history_size: Optional[int] = None, enabled: Optional[bool] = None):
+        docker_config = app_config.docker
+        self.history_size = history_size or docker_config.stats_history_size
+        self.enabled = docker_config.stats_sampler if enabled is None else enabled
+
+        self._lock = threading.Lock()
+        # 容器名称 -> 最新采样（CLI 格式）
+        self._latest: Dict[str, Dict[str, str]] = {}
+        # 容器名称 -> 最近的数值采样
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
+        # 容器名称 -> 统计流线程
+        self._streams: Dict[str, threading.Thread] = {}
+        self._active = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[DockerEngineClient] = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ==============================
+    # 生命周期
+    # ==============================
+
+    def start(self):
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="container-stats-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        停止采集，关闭统计流的连接池使阻塞中的统计流线程退出。
+        """
+        self._stop_event.set()
+        self._active = False
+        client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def is_active(self) -> bool:
+        return self._active
+
+    # ==============================
+    # 查询
+    # ==============================
+
+    def list_latest(self) -> List[Dict[str, str]]:
+        """
+        所有运行中容器的最新采样，格式与 docker stats --no-stream --format "{{json .}}" 一致。
+        """
+        with self._lock:
+            return [self._latest[name] for name in sorted(self._latest)]
+
+    def get_latest(self, container_name: str) -> Optional[Dict[str, str]]:
+        with self._lock:
+            return self._latest.get(container_name)
+
+    def get_history(self, container_name: str) -> List[Dict[str, Any]]:
+        """
+        容器最近的数值采样（按时间升序），容器未运行时为空。
+        """
+        with self._lock:
+            return list(self._history.get(container_name) or [])
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            engine = DockerEngineClient.get_instance()
+            if engine.is_available():
+                try:
+                    self._sync(engine)
+                    self._active = True
+                except DockerEngineError as e:
+                    self._active = False
+                    logger.warning(f"同步运行中的容器列表失败: {e}")
+            else:
+                self._active = False
+
+            self._stop_event.wait(self.SYNC_INTERVAL_SECONDS)
+
+    def _sync(self, engine: DockerEngineClient):
+        running: Set[str] = set()
+        for container in engine.list_containers(all=False):
+            names = [name.lstrip("/") for name in container.get("Names") or []]
+            # 跳过 link 产生的别名（形如 other/alias）
+            names = [name for name in names if "/" not in name]
+            if names:
+                running.add(names[0])
+
+        if self._client is None:
+            self._client = DockerEngineClient(
+                socket_path=engine.socket_path,
+                timeout_seconds=engine.timeout_seconds,
+                max_connections=self.MAX_STREAMS,
+                enabled=True,
+            )
+
+        with self._lock:
+            for name in list(self._latest):
+                if name not in running:
+                    self._latest.pop(name, None)
+                    self._history.pop(name, None)
+
+            for name in sorted(running):
+                if len(self._streams) >= self.MAX_STREAMS:
+                    break
+                thread = self._streams.get(name)
+                if thread is not None and thread.is_alive():
+                    continue
+                thread = threading.Thread(
+                    target=self._stream, args=(self._client, name),
+                    name=f"container-stats-{name}", daemon=True,
+                )
+                self._streams[name] = thread
+                thread.start()
+
+    def _stream(self, client: DockerEngineClient, container_name: str):
+        try:
+            for stats in client.container_stats_stream(container_name):
+                if self._stop_event.is_set():
+                    break
+                # 首个采样没有上一次的 CPU 数据，无法计算使用率
+                if not (stats.get("precpu_stats") or {}).get("system_cpu_usage"):
+                    continue
+                self._record(container_name, stats)
+        except DockerEngineError as e:
+            if not self._stop_event.is_set():
+                logger.debug(f"容器统计流已结束: {container_name}, {e}")
+        finally:
+            with self._lock:
+                if self._streams.get(container_name) is threading.current_thread():
+                    del self._streams[container_name]
+
+    def _record(self, container_name: str, stats: Dict[str, Any]):
+        sample = {"timestamp": int(time.time()), **compute_container_stats(stats)}
+        row = format_container_stats(stats, container_name)
+        with self._lock:
+            self._latest[container_name] = row
+            history = self._history.get(container_name)
+            if history is None:
+                history = self._history[container_name] = deque(maxlen=self.history_size)
+            history.append(sample)
@@ -1,15 +1,31 @@
+import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from threading import Lock, Thread
-from typing import List, Optional, Set
+from threading import Lock
+from typing import Deque, Dict, List, Optional, Set
 
 from loguru import logger
 
-from manager import PROJECT_DATA_MANAGER, DEPLOY_TASK_DATA_MANAGER
+from config.app_config import app_config
+from context.deploy_task_handle import DeployCancelledError, DeployTaskHandle
+from manager import ARTIFACT_STORE_MANAGER, PROJECT_DATA_MANAGER, DEPLOY_TASK_DATA_MANAGER
 from models.entity.deploy_task import DeployTask
 from deployers.python_project_deployer import PythonProjectDeployer
 from deployers.java_project_deployer import JavaProjectDeployer
 from deployers.web_project_deployer import WebProjectDeployer
+from service.resource_limiter import ResourceLimiter, WaitTimeStats
+from utils.file_util import remove_uploaded_file
+
+
+# 项目类型 -> 任务占用的资源类别
+PROJECT_TYPE_RESOURCE_CLASS = {
+    "JAVA": "docker_build",
+    "PYTHON": "docker_build",
+    "WEB": "web_deploy",
+}
+DEFAULT_RESOURCE_CLASS = "docker_build"
 
 
 class DeployTaskService:
@@ -18,19 +34,53 @@ class DeployTaskService:
 
     职责：
         1. 生成并提交部署任务
-        2. 控制全局并发数量
+        2. 控制全局并发数量，以及各资源类别（docker_build / web_deploy）的并发数量
         3. 保证同一个 project_id 不会同时执行多个部署任务
         4. 更新任务状态与执行时间
-        5. 在任务完成后继续调度等待中的任务
+        5. 在任务完成后继续调度等待中的任务，各项目之间轮询调度
+        6. 统计队列长度、等待时间与资源利用率
+        7. 启动时根据持久化的任务状态恢复等待队列
+        8. 取消等待中或运行中的任务，并对运行中的任务施加任务级/步骤级超时
 
     说明：
         - DeployTaskDataManager 只负责 DeployTask 的持久化存取
         - DeployTaskService 负责任务业务逻辑与调度逻辑
+        - 任务在固定大小的线程池中执行，线程数等于全局并发上限
+        - 部署步骤内的细粒度资源（如 file_extract）由 ResourceLimiter 在步骤执行时限流
+
+    等待队列结构：
+        - pending_lanes: 每个项目一条 FIFO 队列，保证同一项目内按提交顺序执行
+        - ready_projects: 按资源类别划分的就绪项目队列，只包含“有等待任务且当前未在部署”的项目，
+          项目按其队首任务的资源类别归类
+        - 调度时从有空闲资源的类别中弹出队首项目，取出其队首任务执行，单次调度为 O(资源类别数)；
+          项目执行完成后若仍有等待任务，则重新排到就绪队列末尾，实现项目间轮询
     """
 
     def __init__(self):
+        scheduler_config = app_config.scheduler
+
         # 全局最大并发任务数
-        self.max_concurrent_task = 1
+        self.max_concurrent_task = scheduler_config.max_concurrent_task
+
+        # 资源限流器，任务级（docker_build / web_deploy）与步骤级（file_extract）共用
+        self.resource_limiter = ResourceLimiter(scheduler_config.resource_limits)
+
+        # 同一项目有新任务提交时，是否取消该项目仍在等待中的旧任务
+        self.coalesce_pending = scheduler_config.coalesce_pending
+
+        # 启动时遗留的 RUNNING 任务处理方式：fail / requeue
+        self.orphan_running_policy = scheduler_config.orphan_running_policy
+
+        # 默认超时时间（秒），项目未单独配置时使用
+        self.default_deploy_timeout_seconds = scheduler_config.deploy_timeout_seconds
+        self.default_step_timeout_seconds = scheduler_config.step_timeout_seconds
+
+        # 运行中任务 ID -> 任务控制句柄
+        self.task_handles: Dict[str, DeployTaskHandle] = {}
+        self._recovered = False
+
+        # 任务 ID -> 资源类别
+        self.task_resource_classes: Dict[str, str] = {}
 
         # 当前运行中的任务 ID 集合
         self.running_task_ids: Set[str] = set()
@@ -39,14 +89,40 @@ class DeployTaskService:
         # 用于限制同一个 project_id 不能同时执行多个部署任务
         self.deploying_project_ids: Set[str] = set()
 
-        # 等待中的任务队列
-        self.pending_task_queue: List[DeployTask] = []
+        # 项目 ID -> 该项目等待中的任务（FIFO）
+        self.pending_lanes: Dict[str, Deque[DeployTask]] = {}
+
+        # 资源类别 -> 就绪项目 ID 队列（预先创建所有已知类别，调度轮次中不新增键）
+        self.ready_projects: Dict[str, Deque[str]] = {
+            resource_class: deque()
+            for resource_class in (*PROJECT_TYPE_RESOURCE_CLASS.values(), DEFAULT_RESOURCE_CLASS)
+        }
+        self._ready_project_ids: Set[str] = set()
+        # 就绪项目因队首任务类别变化被转入其他类别队列的次数
+        self._ready_requeue_count = 0
+
+        # 等待中的任务总数
+        self.pending_count = 0
 
         # 线程锁，保证提交/完成/调度任务时状态一致
         self._lock = Lock()
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_task,
+            thread_name_prefix="deploy-worker"
+        )
+
+        # 调度统计
+        self._enqueued_at: Dict[str, float] = {}
+        self._running_started_at: Dict[str, float] = {}
+        self._wait_stats = WaitTimeStats()
+        self._busy_seconds = 0.0
+        self._stats_started_at = time.monotonic()
+
         logger.info(
-            f"DeployTaskService initialized, max_concurrent_task={self.max_concurrent_task}"
+            f"DeployTaskService initialized, max_concurrent_task={self.max_concurrent_task}, "
+            f"resource_limits={scheduler_config.resource_limits}, "
+            f"coalesce_pending={self.coalesce_pending}"
         )
 
     def submit_task(
@@ -57,6 +133,7 @@ class DeployTaskService:
         deploy_mechanism: str = "UPLOAD",
         upload_file_name: Optional[str] = None,
         upload_file_path: Optional[str] = None,
+        artifact_digest: Optional[str] = None,
         build_image_name: Optional[str] = None,
         build_image_tag: Optional[str] = None,
         container_name: Optional[str] = None,
@@ -71,8 +148,9 @@ class DeployTaskService:
         流程：
             1. 由 Manager 生成任务 ID
             2. 构造 DeployTask 对象
-            3. 保存任务
-            4. 判断是立即执行还是进入等待队列
+            3. 保存任务，并登记对上传产物的引用
+            4. 开启 coalesce_pending 时，取消同项目仍在等待中的旧任务
+            5. 加入项目等待队列，并立即尝试调度
         """
         with self._lock:
             task_id = str(uuid.uuid4()).replace("-", "")[:8]
@@ -87,6 +165,7 @@ class DeployTaskService:
                 deploy_mechanism=deploy_mechanism,
                 upload_file_name=upload_file_name,
                 upload_file_path=upload_file_path,
+                artifact_digest=artifact_digest,
                 build_image_name=build_image_name,
                 build_image_tag=build_image_tag,
                 container_name=container_name,
@@ -107,17 +186,134 @@ class DeployTaskService:
             DEPLOY_TASK_DATA_MANAGER.save_deploy_task(task)
             logger.info(f"[TASK:{task.id}] task saved successfully")
 
-            if self.can_run(task):
-                self._start_task(task)
-            else:
-                self.pending_task_queue.append(task)
+            if artifact_digest:
+                ARTIFACT_STORE_MANAGER.add_reference(artifact_digest, task.id)
+
+            self.task_resource_classes[task.id] = self._resolve_resource_class(task.project_id)
+            self._enqueued_at[task.id] = time.monotonic()
+
+            if self.coalesce_pending:
+                self._coalesce_pending_tasks(task)
+
+            self._enqueue_pending_task(task)
+            self.dispatch_pending_tasks()
+
+            if task.id not in self.running_task_ids:
                 logger.info(
                     f"[TASK:{task.id}] task added to pending queue, "
-                    f"pending_count={len(self.pending_task_queue)}"
+                    f"pending_count={self.pending_count}"
                 )
 
             return task
 
+    def cancel_task(self, task_id: str, reason: Optional[str] = None) -> str:
+        """
+        取消部署任务。
+
+        规则：
+            - PENDING：立即从等待队列移除，标记为 CANCELLED，并释放临时上传文件
+            - RUNNING：终止当前执行中的子进程组，任务在工作线程退出后标记为 CANCELLED 并释放调度资源
+            - 其他状态：不允许取消
+
+        Returns:
+            取消后的任务状态：CANCELLED（已取消）或 CANCELLING（取消中）
+        """
+        reason = reason or "任务已取消"
+
+        with self._lock:
+            task = DEPLOY_TASK_DATA_MANAGER.get_deploy_task(task_id)
+            if task is None:
+                raise ValueError(f"DeployTask not found: {task_id}")
+
+            handle = self.task_handles.get(task_id)
+            if handle is None:
+                return self._cancel_pending_task(task, reason)
+
+        # 终止子进程可能需要等待数秒，不在持锁状态下进行
+        handle.cancel(reason)
+        return "CANCELLING"
+
+    def _cancel_pending_task(self, task: DeployTask, reason: str) -> str:
+        """
+        取消等待中的任务（调用方需持有 self._lock）。
+        """
+        task_id = task.id
+        if task.status != "PENDING":
+            raise ValueError(f"当前任务状态为 {task.status}，不允许取消")
+
+        lane = self.pending_lanes.get(task.project_id)
+        if lane:
+            for pending_task in list(lane):
+                if pending_task.id == task_id:
+                    lane.remove(pending_task)
+                    self.pending_count -= 1
+                    break
+            if not lane:
+                del self.pending_lanes[task.project_id]
+
+        self.task_resource_classes.pop(task_id, None)
+        self._enqueued_at.pop(task_id, None)
+
+        self.update_task_status(task_id, "CANCELLED", reason)
+        self.release_task_artifact(task)
+
+        logger.info(f"[TASK:{task_id}] pending task cancelled, reason={reason}")
+
+        # 被取消的任务可能位于队首，队首变化后重新调度
+        self.dispatch_pending_tasks()
+        return "CANCELLED"
+
+    def recover(self):
+        """
+        根据持久化的任务状态重建调度队列，在服务启动时调用一次。
+
+        处理规则：
+            - PENDING 任务：按创建时间重新加入等待队列
+            - RUNNING 任务（上次进程退出时中断的任务）：
+                - orphan_running_policy = fail: 标记为 FAILED
+                - orphan_running_policy = requeue: 重置为 PENDING 并重新排队
+            - 恢复完成后立即开始调度
+        """
+        with self._lock:
+            if self._recovered:
+                return
+            self._recovered = True
+
+            requeue_tasks = DEPLOY_TASK_DATA_MANAGER.list_deploy_tasks_by_status("PENDING")
+            orphan_tasks = DEPLOY_TASK_DATA_MANAGER.list_deploy_tasks_by_status("RUNNING")
+
+            for task in orphan_tasks:
+                if task.id in self.running_task_ids:
+                    continue
+
+                if self.orphan_running_policy == "requeue":
+                    DEPLOY_TASK_DATA_MANAGER.update_deploy_task_fields(task.id, {
+                        "status": "PENDING",
+                        "started_at": None,
+                        "failed_reason": None,
+                    })
+                    requeue_tasks.append(task)
+                    logger.warning(f"[TASK:{task.id}] orphaned RUNNING task requeued")
+                else:
+                    self.update_task_status(task.id, "FAILED", "Agent 重启，任务执行被中断")
+                    logger.warning(f"[TASK:{task.id}] orphaned RUNNING task marked as FAILED")
+
+            requeue_tasks.sort(key=lambda task: task.created_at or datetime.min)
+
+            now = time.monotonic()
+            for task in requeue_tasks:
+                self.task_resource_classes[task.id] = self._resolve_resource_class(task.project_id)
+                self._enqueued_at[task.id] = now
+                self._enqueue_pending_task(task)
+
+            logger.info(
+                f"DeployTaskService recovered, requeued_count={len(requeue_tasks)}, "
+                f"orphan_running_count={len(orphan_tasks)}, "
+                f"orphan_running_policy={self.orphan_running_policy}"
+            )
+
+            self.dispatch_pending_tasks()
+
     def can_run(self, task: DeployTask) -> bool:
         """
         判断任务当前是否可以执行。
@@ -125,6 +321,8 @@ class DeployTaskService:
         规则：
             1. 全局并发数不能超过限制
             2. 同一个 project_id 不能同时运行多个部署任务
+            3. 任务所属资源类别的并发数不能超过限制
+            4. 同一项目中有更早提交的等待任务时不能插队
         """
         if len(self.running_task_ids) >= self.max_concurrent_task:
             logger.debug(
@@ -139,28 +337,53 @@ class DeployTaskService:
             )
             return False
 
+        resource_class = self._get_resource_class(task)
+        if not self.resource_limiter.has_capacity(resource_class):
+            logger.debug(
+                f"[TASK:{task.id}] cannot run: resource_class={resource_class} reached limit"
+            )
+            return False
+
+        lane = self.pending_lanes.get(task.project_id)
+        if lane and lane[0].id != task.id:
+            logger.debug(
+                f"[TASK:{task.id}] cannot run: project_id={task.project_id} has earlier pending tasks"
+            )
+            return False
+
         return True
 
     def _start_task(self, task: DeployTask):
         """
-        启动任务执行。
+        启动任务执行（调用方需持有 self._lock，且已通过 can_run 校验）。
         """
+        resource_class = self._get_resource_class(task)
+        self.resource_limiter.try_acquire(resource_class)
+
         self.running_task_ids.add(task.id)
         self.deploying_project_ids.add(task.project_id)
+        self.task_handles[task.id] = DeployTaskHandle(task.id)
+
+        now = time.monotonic()
+        wait_seconds = now - self._enqueued_at.pop(task.id, now)
+        self._wait_stats.record(wait_seconds)
+        self.resource_limiter.record_wait(resource_class, wait_seconds)
+        self._running_started_at[task.id] = now
 
         logger.info(
             f"[TASK:{task.id}] start task, project_id={task.project_id}, "
+            f"resource_class={resource_class}, "
             f"running_task_count={len(self.running_task_ids)}, "
             f"deploying_project_count={len(self.deploying_project_ids)}"
         )
 
-        thread = Thread(target=self._run_task, args=(task,), daemon=True)
-        thread.start()
+        self._executor.submit(self._run_task, task)
 
     def _run_task(self, task: DeployTask):
         """
-        后台线程中的任务执行入口。
+        工作线程中的任务执行入口。
         """
+        handle = self.task_handles.get(task.id) or DeployTaskHandle(task.id)
         try:
             project = PROJECT_DATA_MANAGER.get_project(task.project_id)
             if project is None:
@@ -168,18 +391,38 @@ class DeployTaskService:
 
             project_type = (project.get("project_type") or "").upper()
 
+            # 项目未配置时使用全局默认值；配置为 0 或负数表示不限制
+            deploy_timeout_seconds = project.get("deploy_timeout_seconds")
+            step_timeout_seconds = project.get("step_timeout_seconds")
+            handle.deploy_timeout_seconds = (
+                self.default_deploy_timeout_seconds if deploy_timeout_seconds is None else deploy_timeout_seconds
+            )
+            handle.step_timeout_seconds = (
+                self.default_step_timeout_seconds if step_timeout_seconds is None else step_timeout_seconds
+            )
+            handle.start()
+
             if project_type == "PYTHON":
                 logger.info(f"[TASK:{task.id}] dispatch to PythonProjectDeployer")
                 self.update_task_status(task.id, "RUNNING")
-                deployer = PythonProjectDeployer()
+                deployer = PythonProjectDeployer(
+                    resource_limiter=self.resource_limiter,
+                    handle=handle
+                )
             elif project_type == "JAVA":
                 logger.info(f"[TASK:{task.id}] dispatch to JavaProjectDeployer")
                 self.update_task_status(task.id, "RUNNING")
-                deployer = JavaProjectDeployer()
+                deployer = JavaProjectDeployer(
+                    resource_limiter=self.resource_limiter,
+                    handle=handle
+                )
             elif project_type == "WEB":
                 logger.info(f"[TASK:{task.id}] dispatch to WebProjectDeployer")
                 self.update_task_status(task.id, "RUNNING")
-                deployer = WebProjectDeployer()
+                deployer = WebProjectDeployer(
+                    resource_limiter=self.resource_limiter,
+                    handle=handle
+                )
             else:
                 raise ValueError(f"Unsupported project type: {project_type}")
 
@@ -190,9 +433,14 @@ class DeployTaskService:
             )
             
             self.finish_task(task, success=True)
+        except DeployCancelledError as e:
+            logger.warning(f"[TASK:{task.id}] task cancelled: {e}")
+            self.finish_task(task, success=False, failed_reason=str(e), cancelled=True)
         except Exception as e:
             logger.exception(f"[TASK:{task.id}] task execution failed: {e}")
             self.finish_task(task, success=False, failed_reason=str(e))
+        finally:
+            handle.close()
 
     def update_task_status(
         self,
@@ -285,13 +533,14 @@ class DeployTaskService:
         task: DeployTask,
         success: bool,
         failed_reason: Optional[str] = None,
+        cancelled: bool = False,
     ):
         """
         结束任务。
 
         流程：
             1. 从运行中集合移除
-            2. 更新最终状态
+            2. 更新最终状态（cancelled 为 True 时为 CANCELLED）
             3. 调度等待中的后续任务
         """
         with self._lock:
@@ -300,45 +549,223 @@ class DeployTaskService:
                 f"project_id={task.project_id}"
             )
 
-            self.running_task_ids.discard(task.id)
+            if task.id in self.running_task_ids:
+                self.running_task_ids.discard(task.id)
+                self.resource_limiter.release(self._get_resource_class(task))
             self.deploying_project_ids.discard(task.project_id)
+            self.task_resource_classes.pop(task.id, None)
+            self.task_handles.pop(task.id, None)
+            self._mark_project_ready(task.project_id)
+
+            started_at = self._running_started_at.pop(task.id, None)
+            if started_at is not None:
+                self._busy_seconds += time.monotonic() - started_at
 
-            final_status = "SUCCESS" if success else "FAILED"
+            if cancelled:
+                final_status = "CANCELLED"
+            else:
+                final_status = "SUCCESS" if success else "FAILED"
             self.update_task_status(task.id, final_status, failed_reason)
 
             logger.info(
                 f"[TASK:{task.id}] runtime state cleared, "
                 f"running_task_count={len(self.running_task_ids)}, "
                 f"deploying_project_count={len(self.deploying_project_ids)}, "
-                f"pending_count={len(self.pending_task_queue)}"
+                f"pending_count={self.pending_count}"
             )
 
             self.dispatch_pending_tasks()
 
     def dispatch_pending_tasks(self):
         """
-        调度等待队列中的任务。
+        调度等待队列中的任务（调用方需持有 self._lock）。
 
         规则：
-            - 顺序扫描等待队列
-            - 找到可执行任务后立即启动
-            - 达到全局并发上限后停止继续调度
+            - 按轮次遍历资源类别，每个有空闲资源的类别每轮启动一个就绪项目的队首任务
+            - 同一资源类别内按就绪队列顺序（即项目间轮询）选择项目
+            - 达到全局并发上限，或一整轮既没有启动任务、也没有项目转入其他类别时停止
+        """
+        started = True
+        while started and self.pending_count:
+            started = False
+            requeue_count = self._ready_requeue_count
+
+            # _pop_ready_task 可能把项目转入其他类别的就绪队列，遍历快照避免字典在迭代中变化
+            for resource_class, ready in list(self.ready_projects.items()):
+                if len(self.running_task_ids) >= self.max_concurrent_task:
+                    return
+                if not ready or not self.resource_limiter.has_capacity(resource_class):
+                    continue
+
+                task = self._pop_ready_task(resource_class)
+                if task is None:
+                    continue
+
+                self._start_task(task)
+                started = True
+
+                logger.info(
+                    f"[TASK:{task.id}] dequeued and started, "
+                    f"project_id={task.project_id}, "
+                    f"remaining_pending_count={self.pending_count}"
+                )
+
+            # 本轮有项目转入了已遍历过的类别，再调度一轮
+            if self._ready_requeue_count != requeue_count:
+                started = True
+
+    def _coalesce_pending_tasks(self, newer_task: DeployTask):
         """
-        if not self.pending_task_queue:
+        取消同项目中仍在等待的旧任务（调用方需持有 self._lock）。
+
+        被取消的任务：
+            - 状态标记为 CANCELLED，failed_reason 为 superseded
+            - 释放其临时上传文件
+        正在运行的任务不受影响。
+        """
+        lane = self.pending_lanes.pop(newer_task.project_id, None)
+        if not lane:
             return
 
-        for task in list(self.pending_task_queue):
-            if not self.can_run(task):
-                continue
+        self.pending_count -= len(lane)
 
-            self.pending_task_queue.remove(task)
-            self._start_task(task)
+        for task in lane:
+            self.task_resource_classes.pop(task.id, None)
+            self._enqueued_at.pop(task.id, None)
+
+            try:
+                self.update_task_status(task.id, "CANCELLED", "superseded")
+            except ValueError:
+                logger.warning(f"[TASK:{task.id}] superseded task not found, skip status update")
+
+            self.release_task_artifact(task)
 
             logger.info(
-                f"[TASK:{task.id}] dequeued and started, "
-                f"project_id={task.project_id}, "
-                f"remaining_pending_count={len(self.pending_task_queue)}"
+                f"[TASK:{task.id}] cancelled: superseded by task {newer_task.id}, "
+                f"project_id={task.project_id}"
             )
 
-            if len(self.running_task_ids) >= self.max_concurrent_task:
-                break
\ No newline at end of file
+    def _enqueue_pending_task(self, task: DeployTask):
+        """
+        将任务加入所属项目的等待队列。
+        """
+        self.pending_lanes.setdefault(task.project_id, deque()).append(task)
+        self.pending_count += 1
+        self._mark_project_ready(task.project_id)
+
+    def _mark_project_ready(self, project_id: str):
+        """
+        项目有等待任务且当前未在部署时，将其加入队首任务资源类别的就绪队列末尾。
+        """
+        if project_id in self.deploying_project_ids or project_id in self._ready_project_ids:
+            return
+
+        lane = self.pending_lanes.get(project_id)
+        if not lane:
+            return
+
+        resource_class = self._get_resource_class(lane[0])
+        self.ready_projects.setdefault(resource_class, deque()).append(project_id)
+        self._ready_project_ids.add(project_id)
+
+    def _pop_ready_task(self, resource_class: str) -> Optional[DeployTask]:
+        """
+        从指定资源类别的就绪队列中取出下一个可执行任务。
+
+        就绪队列中的项目可能已失效（等待任务被移除或队首任务类别变化），此处惰性跳过。
+        """
+        ready = self.ready_projects.get(resource_class)
+        while ready:
+            project_id = ready.popleft()
+            self._ready_project_ids.discard(project_id)
+
+            lane = self.pending_lanes.get(project_id)
+            if not lane or project_id in self.deploying_project_ids:
+                continue
+
+            if self._get_resource_class(lane[0]) != resource_class:
+                self._mark_project_ready(project_id)
+                self._ready_requeue_count += 1
+                continue
+
+            task = lane.popleft()
+            self.pending_count -= 1
+            if not lane:
+                del self.pending_lanes[project_id]
+            return task
+
+        return None
+
+    def release_task_artifact(self, task: DeployTask):
+        """
+        释放任务对上传产物的占用：删除临时上传文件，或释放对产物存储的引用。
+        """
+        if remove_uploaded_file(task.upload_file_path):
+            logger.debug(f"[TASK:{task.id}] upload file released: {task.upload_file_path}")
+        ARTIFACT_STORE_MANAGER.release_reference(task.artifact_digest, task.id)
+
+    def collect_artifact_references(self) -> Dict[str, List[str]]:
+        """
+        收集现存任务对产物的引用关系（digest -> 任务 ID 列表），供产物 GC 校正引用计数。
+
+        已取消的任务不再占用产物。
+        """
+        references: Dict[str, List[str]] = {}
+        for task in DEPLOY_TASK_DATA_MANAGER.list_deploy_tasks():
+            if task.artifact_digest and task.status != "CANCELLED":
+                references.setdefault(task.artifact_digest, []).append(task.id)
+        return references
+
+    def get_scheduler_stats(self) -> Dict:
+        """
+        获取调度器运行统计。
+
+        返回字段：
+            - max_concurrent_task / running_count / pending_count: 全局并发上限、运行数、等待数
+            - pending_project_count: 有等待任务的项目数
+            - utilization: 当前全局并发占用率
+            - busy_utilization: 自服务启动以来工作线程的平均繁忙率
+            - wait_time: 任务从提交到开始执行的排队时间统计
+            - resources: 各资源类别的上限、占用数、等待数、利用率，
+              以及等待中的任务数 pending 与就绪项目数 ready_project_count
+        """
+        with self._lock:
+            now = time.monotonic()
+            busy_seconds = self._busy_seconds + sum(
+                now - started_at for started_at in self._running_started_at.values()
+            )
+            elapsed = max(now - self._stats_started_at, 1e-6)
+
+            resources = self.resource_limiter.stats()
+            for resource_stats in resources.values():
+                resource_stats["pending"] = 0
+            for lane in self.pending_lanes.values():
+                for task in lane:
+                    resource_stats = resources.setdefault(self._get_resource_class(task), {})
+                    resource_stats["pending"] = resource_stats.get("pending", 0) + 1
+            for resource_class, ready in self.ready_projects.items():
+                resources.setdefault(resource_class, {})["ready_project_count"] = len(ready)
+
+            return {
+                "max_concurrent_task": self.max_concurrent_task,
+                "running_count": len(self.running_task_ids),
+                "pending_count": self.pending_count,
+                "pending_project_count": len(self.pending_lanes),
+                "utilization": round(len(self.running_task_ids) / self.max_concurrent_task, 4),
+                "busy_utilization": round(busy_seconds / (elapsed * self.max_concurrent_task), 4),
+                "wait_time": self._wait_stats.snapshot(),
+                "resources": resources,
+            }
+
+    def _get_resource_class(self, task: DeployTask) -> str:
+        resource_class = self.task_resource_classes.get(task.id)
+        if resource_class is None:
+            resource_class = self._resolve_resource_class(task.project_id)
+            self.task_resource_classes[task.id] = resource_class
+        return resource_class
+
+    @staticmethod
+    def _resolve_resource_class(project_id: str) -> str:
+        project = PROJECT_DATA_MANAGER.get_project(project_id)
+        project_type = ((project or {}).get("project_type") or "").upper()
+        return PROJECT_TYPE_RESOURCE_CLASS.get(project_type, DEFAULT_RESOURCE_CLASS)
@@ -1,14 +1,69 @@
 import json
-from typing import Any, Dict, List, Optional
-
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from service.container_state_cache import ContainerStateCache
+from service.container_stats_sampler import ContainerStatsSampler
+from utils.docker_engine_client import DockerEngineClient, DockerEngineError, DockerEngineUnavailableError
+from utils.docker_format import (
+    decode_log_stream,
+    format_container_ps,
+    format_container_stats,
+    format_image_rows,
+    to_unix_timestamp,
+)
 from utils.docker_util import run_docker_command
 
 
+# Engine API 不可用，需要回退到 docker CLI
+_USE_CLI = object()
+
+
+def _via_engine(call: Callable[[DockerEngineClient], Any]) -> Any:
+    """
+    通过 Docker Engine API 执行调用；Engine API 未启用或无法连接时返回 _USE_CLI。
+    """
+    client = DockerEngineClient.get_instance()
+    if not client.is_available():
+        return _USE_CLI
+    try:
+        return call(client)
+    except DockerEngineUnavailableError:
+        return _USE_CLI
+
+
+def _is_not_found(error: DockerEngineError) -> bool:
+    return error.status_code == 404
+
+
 class DockerService:
+    """
+    DockerService
+
+    优先通过 Docker Engine API（Unix socket）访问 Docker，不可用时回退到 docker CLI。
+    两种方式返回的数据格式一致（与 docker CLI 的 --format "{{json .}}" 输出相同）。
+
+    容器列表与状态查询优先读取 ContainerStateCache（由 Docker 事件流维护），不访问 Docker。
+    容器资源统计优先读取 ContainerStatsSampler 的最新采样，不等待采样周期。
+    """
+
     DOCKER_PS_JSON_ARGS = ["ps", "-a", "--format", "{{json .}}"]
 
     @staticmethod
     def list_containers() -> List[Dict[str, Any]]:
+        cache = ContainerStateCache.get_instance()
+        if cache.is_ready():
+            return cache.list_containers()
+
+        containers = _via_engine(
+            lambda engine: [format_container_ps(container) for container in engine.list_containers(all=True)]
+        )
+        if containers is not _USE_CLI:
+            return containers
+
         result = run_docker_command(DockerService.DOCKER_PS_JSON_ARGS)
 
         containers: List[Dict[str, Any]] = []
@@ -21,6 +76,10 @@ class DockerService:
 
     @staticmethod
     def get_container(container_name: str) -> Optional[Dict[str, Any]]:
+        cache = ContainerStateCache.get_instance()
+        if cache.is_ready():
+            return cache.get_container(container_name)
+
         for container in DockerService.list_containers():
             if container.get("Names") == container_name:
                 return container
@@ -35,6 +94,19 @@ class DockerService:
 
     @staticmethod
     def get_container_ps_info(container_name: str) -> Optional[Dict[str, Any]]:
+        def from_engine(engine: DockerEngineClient) -> Optional[Dict[str, Any]]:
+            # name 过滤为模糊匹配，优先返回名称完全一致的容器
+            containers = [
+                format_container_ps(container)
+                for container in engine.list_containers(all=True, filters={"name": [container_name]})
+            ]
+            exact = [container for container in containers if container["Names"] == container_name]
+            return (exact or containers or [None])[0]
+
+        container = _via_engine(from_engine)
+        if container is not _USE_CLI:
+            return container
+
         result = run_docker_command([
             "ps", "-a",
             "--filter", f"name={container_name}",
@@ -49,6 +121,18 @@ class DockerService:
 
     @staticmethod
     def get_container_inspect_info(container_name: str) -> Optional[Dict[str, Any]]:
+        def from_engine(engine: DockerEngineClient) -> Optional[Dict[str, Any]]:
+            try:
+                return engine.inspect_container(container_name)
+            except DockerEngineError as e:
+                if _is_not_found(e):
+                    return None
+                raise
+
+        inspect_info = _via_engine(from_engine)
+        if inspect_info is not _USE_CLI:
+            return inspect_info
+
         result = run_docker_command(["inspect", container_name])
 
         inspect_list = json.loads(result)
@@ -84,6 +168,12 @@ class DockerService:
 
     @staticmethod
     def list_images() -> List[Dict[str, Any]]:
+        images = _via_engine(
+            lambda engine: [row for image in engine.list_images() for row in format_image_rows(image)]
+        )
+        if images is not _USE_CLI:
+            return images
+
         result = run_docker_command(["images", "--format", "{{json .}}"])
 
         images: List[Dict[str, Any]] = []
@@ -96,9 +186,24 @@ class DockerService:
 
     @staticmethod
     def get_docker_info() -> Dict[str, Any]:
+        info = _via_engine(lambda engine: engine.info())
+        if info is not _USE_CLI:
+            return info
+
         result = run_docker_command(["info", "--format", "{{json .}}"])
         return json.loads(result)
 
+    @staticmethod
+    def get_docker_version() -> str:
+        """
+        获取 Docker 版本描述，格式与 docker --version 一致。
+        """
+        version = _via_engine(lambda engine: engine.version())
+        if version is not _USE_CLI:
+            return f"Docker version {version.get('Version')}, build {(version.get('GitCommit') or '')[:7]}"
+
+        return run_docker_command(["--version"]).strip()
+
     @staticmethod
     def get_container_logs(
         container_name: str,
@@ -107,20 +212,36 @@ class DockerService:
         since: Optional[str] = None,
         until: Optional[str] = None,
     ) -> Dict[str, Any]:
-        docker_command = ["logs", f"--tail={tail}"]
+        since_timestamp = to_unix_timestamp(since) if since else None
+        until_timestamp = to_unix_timestamp(until) if until else None
+
+        logs_text = _USE_CLI
+        # 时间格式无法识别时交给 CLI 处理（并由 CLI 给出错误信息）
+        if (not since or since_timestamp) and (not until or until_timestamp):
+            def from_engine(engine: DockerEngineClient) -> str:
+                response = engine.container_logs(
+                    container_name, tail=tail, timestamps=timestamps,
+                    since=since_timestamp, until=until_timestamp,
+                )
+                return decode_log_stream(response.content, response.headers.get("content-type"))
+
+            logs_text = _via_engine(from_engine)
+
+        if logs_text is _USE_CLI:
+            docker_command = ["logs", f"--tail={tail}"]
 
-        if timestamps:
-            docker_command.append("--timestamps")
+            if timestamps:
+                docker_command.append("--timestamps")
 
-        if since:
-            docker_command.extend(["--since", since])
+            if since:
+                docker_command.extend(["--since", since])
 
-        if until:
-            docker_command.extend(["--until", until])
+            if until:
+                docker_command.extend(["--until", until])
 
-        docker_command.append(container_name)
+            docker_command.append(container_name)
 
-        logs_text = run_docker_command(docker_command)
+            logs_text = run_docker_command(docker_command)
 
         return {
             "container_name": container_name,
@@ -133,21 +254,99 @@ class DockerService:
 
     @staticmethod
     def start_container(container_name: str) -> str:
+        if _via_engine(lambda engine: engine.start_container(container_name)) is not _USE_CLI:
+            ContainerStateCache.get_instance().refresh(container_name)
+            return f"{container_name}\n"
         return run_docker_command(["start", container_name])
 
     @staticmethod
     def stop_container(container_name: str) -> str:
-        return run_docker_command(["stop", container_name])
+        if _via_engine(lambda engine: engine.stop_container(container_name)) is not _USE_CLI:
+            ContainerStateCache.get_instance().refresh(container_name)
+            return f"{container_name}\n"
+        return run_docker_command(["stop", container_name], timeout=DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS)
 
     @staticmethod
     def restart_container(container_name: str) -> str:
-        return run_docker_command(["restart", container_name])
-    
+        if _via_engine(lambda engine: engine.restart_container(container_name)) is not _USE_CLI:
+            ContainerStateCache.get_instance().refresh(container_name)
+            return f"{container_name}\n"
+        return run_docker_command(["restart", container_name], timeout=DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS)
+
+    @staticmethod
+    def remove_container(container_name: str) -> bool:
+        """
+        强制删除容器（运行中的容器会被停止），容器不存在时返回 False。
+        """
+        def from_engine(engine: DockerEngineClient) -> bool:
+            try:
+                engine.remove_container(container_name, force=True)
+                ContainerStateCache.get_instance().refresh(container_name)
+                return True
+            except DockerEngineError as e:
+                if _is_not_found(e):
+                    return False
+                raise
+
+        removed = _via_engine(from_engine)
+        if removed is not _USE_CLI:
+            return removed
+
+        try:
+            run_docker_command(["rm", "-f", container_name], timeout=DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS)
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.debug(f"删除容器失败或容器不存在: {container_name}, {e.stdout}")
+            return False
+
+    @staticmethod
+    def remove_image(image: str) -> bool:
+        """
+        强制删除镜像，镜像不存在时返回 False。
+        """
+        def from_engine(engine: DockerEngineClient) -> bool:
+            try:
+                engine.remove_image(image, force=True)
+                return True
+            except DockerEngineError as e:
+                if _is_not_found(e):
+                    return False
+                raise
+
+        removed = _via_engine(from_engine)
+        if removed is not _USE_CLI:
+            return removed
+
+        try:
+            run_docker_command(["rmi", "-f", image], timeout=DockerEngineClient.LONG_OPERATION_TIMEOUT_SECONDS)
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.debug(f"删除镜像失败或镜像不存在: {image}, {e.stdout}")
+            return False
+
     @staticmethod
     def get_container_stats(container_name: str) -> Optional[Dict[str, Any]]:
         """
         获取指定容器资源使用情况（单次快照）
         """
+        sampler = ContainerStatsSampler.get_instance()
+        if sampler.is_active():
+            stats = sampler.get_latest(container_name)
+            if stats is not None:
+                return stats
+
+        def from_engine(engine: DockerEngineClient) -> Optional[Dict[str, Any]]:
+            try:
+                return format_container_stats(engine.container_stats(container_name), container_name)
+            except DockerEngineError as e:
+                if _is_not_found(e):
+                    return None
+                raise
+
+        stats = _via_engine(from_engine)
+        if stats is not _USE_CLI:
+            return stats
+
         result = run_docker_command([
             "stats",
             "--no-stream",
@@ -159,4 +358,56 @@ class DockerService:
         if not result:
             return None
 
-        return json.loads(result)
\ No newline at end of file
+        return json.loads(result)
+
+    @staticmethod
+    def list_container_stats() -> List[Dict[str, Any]]:
+        """
+        获取所有运行中容器的资源使用情况，格式与 docker stats --no-stream --format "{{json .}}" 一致。
+        """
+        sampler = ContainerStatsSampler.get_instance()
+        if sampler.is_active():
+            return sampler.list_latest()
+
+        def from_engine(engine: DockerEngineClient) -> List[Dict[str, Any]]:
+            names = [
+                container["Names"] for container in
+                (format_container_ps(item) for item in engine.list_containers(all=False))
+            ]
+
+            def sample(name: str) -> Optional[Dict[str, Any]]:
+                try:
+                    return format_container_stats(engine.container_stats(name), name)
+                except DockerEngineError as e:
+                    # 列出后停止或删除的容器
+                    if _is_not_found(e) or e.status_code == 409:
+                        return None
+                    raise
+
+            # 单次采样需要等待一个采样周期，并发执行
+            with ThreadPoolExecutor(max_workers=engine.max_connections) as executor:
+                return [stats for stats in executor.map(sample, names) if stats is not None]
+
+        stats_list = _via_engine(from_engine)
+        if stats_list is not _USE_CLI:
+            return stats_list
+
+        result = run_docker_command(["stats", "--no-stream", "--format", "{{json .}}"])
+
+        stats_list: List[Dict[str, Any]] = []
+        for line in result.strip().split("\n"):
+            if not line:
+                continue
+            stats_list.append(json.loads(line))
+
+        return stats_list
+
+    @staticmethod
+    def get_container_stats_history(container_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取容器最近的资源采样（按时间升序），未启用后台采样时返回 None。
+        """
+        sampler = ContainerStatsSampler.get_instance()
+        if not sampler.is_active():
+            return None
+        return sampler.get_history(container_name)
@@ -0,0 +1,134 @@
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from manager import PROJECT_DATA_MANAGER
+from service.docker_service import DockerService
+
+
+class ProjectStatusService:
+    """
+    ProjectStatusService
+
+    项目部署状态的聚合统计。
+
+    说明：
+        - 容器列表只遍历一次，按容器名称建立精确匹配的索引，每个项目 O(1) 查找
+        - Web 项目是否已部署（container_project_path 下是否有文件）按路径缓存，
+          部署任务完成后由 WebProjectDeployer 调用 invalidate_web_project 失效；
+          目录被外部修改时最迟 WEB_DEPLOYED_TTL_SECONDS 后重新检查
+        - 统计结果缓存 SUMMARY_TTL_SECONDS，短时间内的重复请求直接返回
+    """
+
+    _instance = None
+
+    # 统计结果缓存时间（秒）
+    SUMMARY_TTL_SECONDS = 2
+    # Web 项目部署状态缓存时间（秒），兜底目录被外部修改的情况
+    WEB_DEPLOYED_TTL_SECONDS = 60
+
+    def __init__(self):
+        self._lock = Lock()
+        # container_project_path -> (过期时间, 是否已部署)
+        self._web_deployed: Dict[str, Tuple[float, bool]] = {}
+        # (过期时间, 统计结果)
+        self._summary: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get_status_summary(self) -> Dict[str, Any]:
+        """
+        统计所有项目的运行状态，check_time 为实际统计的时间。
+        """
+        cached = self._summary
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        summary = self._compute_status_summary()
+        self._summary = (time.monotonic() + self.SUMMARY_TTL_SECONDS, summary)
+        return summary
+
+    def is_web_project_deployed(self, container_project_path: str) -> bool:
+        """
+        Web 项目目录存在且不为空时视为已部署。
+        """
+        now = time.monotonic()
+        cached = self._web_deployed.get(container_project_path)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        path = Path(container_project_path)
+        deployed = path.is_dir() and any(path.iterdir())
+        with self._lock:
+            self._web_deployed[container_project_path] = (now + self.WEB_DEPLOYED_TTL_SECONDS, deployed)
+        return deployed
+
+    def invalidate_web_project(self, container_project_path: Optional[str] = None):
+        """
+        Web 项目目录发生变化（部署完成、失败）后调用；不指定路径时清空全部缓存。
+        """
+        with self._lock:
+            if container_project_path is None:
+                self._web_deployed.clear()
+            else:
+                self._web_deployed.pop(container_project_path, None)
+            self._summary = None
+
+    def _compute_status_summary(self) -> Dict[str, Any]:
+        check_time = datetime.now(timezone.utc).isoformat()
+        all_projects = PROJECT_DATA_MANAGER.list_projects()
+
+        # 容器名称 -> Status（docker ps 的 Names 可能包含以逗号分隔的多个名称）
+        container_status_map: Dict[str, str] = {}
+        for container_info in DockerService.list_containers():
+            status = container_info.get("Status", "")
+            for name in (container_info.get("Names") or "").split(","):
+                if name:
+                    container_status_map[name] = status
+
+        status_summary = {
+            "total": len(all_projects),
+            "running": 0,
+            "exited": 0,
+            "restarting": 0,
+            "unknown": 0,
+            "awaiting_deployment": 0,
+        }
+
+        for project in all_projects:
+            project_type = project.get("project_type") or ""
+
+            if project_type.lower() == "web":
+                container_project_path = project.get("container_project_path")
+                if container_project_path and self.is_web_project_deployed(container_project_path):
+                    status_summary["running"] += 1
+                else:
+                    status_summary["awaiting_deployment"] += 1
+                continue
+
+            container_name = project.get("container_name")
+            status = container_status_map.get(container_name) if container_name else None
+            if status is None:
+                status_summary["awaiting_deployment"] += 1
+                continue
+
+            normalized = status.lower()
+            if normalized.startswith("up"):
+                status_summary["running"] += 1
+            elif normalized.startswith("exited"):
+                status_summary["exited"] += 1
+            elif normalized.startswith("restarting"):
+                status_summary["restarting"] += 1
+            else:
+                status_summary["unknown"] += 1
+
+        return {
+            **status_summary,
+            "check_time": check_time,
+        }
@@ -0,0 +1,154 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from typing import Deque, Dict, Optional
+
+from loguru import logger
+
+
+class WaitTimeStats:
+    """
+    等待时间统计（保留最近 window 条样本）。
+
+    说明：
+        - 非线程安全，由调用方持锁访问
+    """
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.total_count = 0
+
+    def record(self, wait_seconds: float):
+        self._samples.append(wait_seconds)
+        self.total_count += 1
+
+    def snapshot(self) -> Dict:
+        samples = list(self._samples)
+        if not samples:
+            return {"count": self.total_count, "avg_ms": 0, "max_ms": 0, "last_ms": 0}
+
+        return {
+            "count": self.total_count,
+            "avg_ms": int(sum(samples) / len(samples) * 1000),
+            "max_ms": int(max(samples) * 1000),
+            "last_ms": int(samples[-1] * 1000),
+        }
+
+
+class ResourceLimiter:
+    """
+    ResourceLimiter
+
+    按资源类别限制并发占用数量，例如：
+        - docker_build: 镜像构建
+        - file_extract: 解压上传的产物
+        - web_deploy: 前端静态资源部署
+
+    使用方式：
+        - 调度器使用 try_acquire / release 做非阻塞的准入判断
+        - 部署步骤使用 slot() 阻塞等待，直到该类资源有空闲
+
+    说明：
+        - 未配置或上限 <= 0 的资源类别视为不限制
+    """
+
+    def __init__(self, limits: Dict[str, int]):
+        self._limits: Dict[str, int] = {
+            name: int(limit) for name, limit in (limits or {}).items()
+        }
+        self._in_use: Dict[str, int] = {name: 0 for name in self._limits}
+        self._waiting: Dict[str, int] = {name: 0 for name in self._limits}
+        self._wait_stats: Dict[str, WaitTimeStats] = {
+            name: WaitTimeStats() for name in self._limits
+        }
+        self._condition = Condition()
+
+    def try_acquire(self, resource_class: str) -> bool:
+        """
+        非阻塞占用一个资源，成功返回 True。
+        """
+        with self._condition:
+            if not self._has_capacity(resource_class):
+                return False
+            self._in_use[resource_class] = self._in_use.get(resource_class, 0) + 1
+            return True
+
+    def acquire(self, resource_class: str, timeout: Optional[float] = None) -> bool:
+        """
+        阻塞占用一个资源，超时返回 False。
+        """
+        started_at = time.monotonic()
+        with self._condition:
+            self._waiting[resource_class] = self._waiting.get(resource_class, 0) + 1
+            try:
+                acquired = self._condition.wait_for(
+                    lambda: self._has_capacity(resource_class),
+                    timeout=timeout
+                )
+            finally:
+                self._waiting[resource_class] -= 1
+
+            if not acquired:
+                return False
+
+            self._in_use[resource_class] = self._in_use.get(resource_class, 0) + 1
+            self._wait_stats.setdefault(resource_class, WaitTimeStats()).record(
+                time.monotonic() - started_at
+            )
+            return True
+
+    def record_wait(self, resource_class: str, wait_seconds: float):
+        """
+        记录一次外部排队等待时间（例如任务在调度队列中的等待）。
+        """
+        with self._condition:
+            self._wait_stats.setdefault(resource_class, WaitTimeStats()).record(wait_seconds)
+
+    def release(self, resource_class: str):
+        with self._condition:
+            in_use = self._in_use.get(resource_class, 0)
+            if in_use <= 0:
+                logger.warning(f"资源释放次数多于占用次数: resource_class={resource_class}")
+                return
+            self._in_use[resource_class] = in_use - 1
+            self._condition.notify_all()
+
+    def has_capacity(self, resource_class: str) -> bool:
+        with self._condition:
+            return self._has_capacity(resource_class)
+
+    @contextmanager
+    def slot(self, resource_class: str):
+        """
+        阻塞占用一个资源，退出上下文时自动释放。
+        """
+        self.acquire(resource_class)
+        try:
+            yield
+        finally:
+            self.release(resource_class)
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        返回各资源类别的上限、占用数、等待数与利用率。
+        """
+        with self._condition:
+            result = {}
+            for name in set(self._limits) | set(self._in_use):
+                limit = self._limits.get(name, 0)
+                in_use = self._in_use.get(name, 0)
+                result[name] = {
+                    "limit": limit if limit > 0 else None,
+                    "in_use": in_use,
+                    "waiting": self._waiting.get(name, 0),
+                    "utilization": round(in_use / limit, 4) if limit > 0 else None,
+                    "wait_time": self._wait_stats.get(name, WaitTimeStats()).snapshot(),
+                }
+            return result
+
+    def _has_capacity(self, resource_class: str) -> bool:
+        limit = self._limits.get(resource_class, 0)
+        if limit <= 0:
+            return True
+        return self._in_use.get(resource_class, 0) < limit
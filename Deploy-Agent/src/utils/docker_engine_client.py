@@ -0,0 +1,308 @@
+import json
+import os
+import time
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from urllib.parse import quote
+
+import httpx
+from loguru import logger
+
+from config.app_config import app_config
+
+
+class DockerEngineError(Exception):
+    """Docker Engine API 返回错误（如容器不存在、冲突等）"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class DockerEngineUnavailableError(DockerEngineError):
+    """无法连接 Docker Engine API（socket 不存在、无权限或守护进程未响应）"""
+
+
+class DockerEngineClient:
+    """
+    DockerEngineClient
+
+    通过 Unix socket（默认 /var/run/docker.sock）访问 Docker Engine API 的 HTTP 客户端。
+
+    说明：
+        - 连接池复用，省去 docker CLI 每次调用的进程创建与启动开销
+        - 线程安全：接口请求与部署线程共用同一个连接池
+        - 返回 Engine API 的原始 JSON，转换为 CLI 输出格式见 utils.docker_format
+        - Engine API 返回的错误以 DockerEngineError 抛出（status_code 为 HTTP 状态码）
+        - 连接失败时抛出 DockerEngineUnavailableError，并在 UNAVAILABLE_RETRY_SECONDS 内
+          标记为不可用，调用方据此回退到 docker CLI
+        - socket_path 可指向本地的假 socket 服务，便于测试
+    """
+
+    _instance = None
+
+    # 连接失败后，多长时间内不再尝试 Engine API
+    UNAVAILABLE_RETRY_SECONDS = 30
+    # 停止、重启容器等需要等待容器退出的操作的超时时间
+    LONG_OPERATION_TIMEOUT_SECONDS = 300
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        docker_config = app_config.docker
+        self.socket_path = socket_path or docker_config.socket_path
+        self.timeout_seconds = timeout_seconds or docker_config.timeout_seconds
+        self.max_connections = max_connections or docker_config.max_connections
+        self.enabled = docker_config.engine_api if enabled is None else enabled
+
+        self._lock = Lock()
+        self._client: Optional[httpx.Client] = None
+        self._unavailable_until = 0.0
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ==============================
+    # 连接
+    # ==============================
+
+    def is_available(self) -> bool:
+        """
+        是否可以使用 Engine API：已启用、socket 存在，且最近没有连接失败。
+        """
+        if not self.enabled or time.monotonic() < self._unavailable_until:
+            return False
+        return os.path.exists(self.socket_path)
+
+    def close(self):
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        timeout: Optional[float] = None,
+        ok_status: Sequence[int] = (),
+    ) -> httpx.Response:
+        """
+        发送请求到 Engine API。
+
+        Args:
+            method: HTTP 方法
+            path: API 路径，如 /containers/json
+            params: 查询参数
+            body: JSON 请求体
+            timeout: 读取超时（秒），默认使用 timeout_seconds
+            ok_status: 除 2xx 外视为成功的状态码（如 304 Not Modified）
+
+        Raises:
+            DockerEngineUnavailableError: 无法连接
+            DockerEngineError: 请求超时或 Engine API 返回错误
+        """
+        try:
+            response = self._get_client().request(
+                method,
+                path,
+                params=params,
+                json=body,
+                timeout=httpx.Timeout(self.timeout_seconds, read=timeout or self.timeout_seconds),
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError, FileNotFoundError, PermissionError) as e:
+            self._mark_unavailable(e)
+            raise DockerEngineUnavailableError(f"无法连接 Docker Engine API: {e}") from e
+        except httpx.TimeoutException as e:
+            raise DockerEngineError(f"Docker Engine API 请求超时: {method} {path}") from e
+
+        if response.is_success or response.status_code in ok_status:
+            return response
+        raise DockerEngineError(self._error_message(response), response.status_code)
+
+    # ==============================
+    # 系统
+    # ==============================
+
+    def version(self) -> Dict[str, Any]:
+        return self.request("GET", "/version").json()
+
+    def info(self) -> Dict[str, Any]:
+        return self.request("GET", "/info").json()
+
+    def events(self, since: Optional[float] = None, filters: Optional[Dict[str, List[str]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        订阅 Docker 事件流，逐个返回事件；阻塞等待新事件，直到连接断开。
+
+        Args:
+            since: 从该 Unix 时间戳开始（含之前已发生的事件），默认只返回订阅之后的事件
+            filters: 过滤条件，如 {"type": ["container"]}
+        """
+        params: Dict[str, Any] = {}
+        if since is not None:
+            params["since"] = f"{since:.9f}"
+        if filters:
+            params["filters"] = json.dumps(filters)
+        return self._stream_json("/events", params, "Docker 事件流已断开")
+
+    # ==============================
+    # 容器
+    # ==============================
+
+    def list_containers(self, all: bool = True, filters: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"all": "1" if all else "0"}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        return self.request("GET", "/containers/json", params=params).json()
+
+    def inspect_container(self, container: str) -> Dict[str, Any]:
+        return self.request("GET", f"/containers/{_quote(container)}/json").json()
+
+    def container_logs(
+        self,
+        container: str,
+        tail: Optional[int] = None,
+        timestamps: bool = False,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        获取容器日志（stdout + stderr）。
+
+        返回原始响应：未开启 TTY 的容器为多路复用格式，需用 utils.docker_format.decode_log_stream 解析。
+        since / until 需为 Unix 时间戳。
+        """
+        params: Dict[str, Any] = {
+            "stdout": "1",
+            "stderr": "1",
+            "timestamps": "1" if timestamps else "0",
+            "tail": "all" if tail is None else str(tail),
+        }
+        if since:
+            params["since"] = since
+        if until:
+            params["until"] = until
+        return self.request("GET", f"/containers/{_quote(container)}/logs", params=params)
+
+    def container_stats(self, container: str) -> Dict[str, Any]:
+        """
+        获取容器的单次资源统计（Engine API 会等待采样，precpu_stats 可用于计算 CPU 使用率）。
+        """
+        return self.request(
+            "GET", f"/containers/{_quote(container)}/stats", params={"stream": "0"}
+        ).json()
+
+    def container_stats_stream(self, container: str) -> Iterator[Dict[str, Any]]:
+        """
+        订阅容器的资源统计流（约每秒一次），容器停止后流结束。
+        """
+        return self._stream_json(
+            f"/containers/{_quote(container)}/stats", {"stream": "1"}, f"容器统计流已断开: {container}"
+        )
+
+    def start_container(self, container: str):
+        self.request("POST", f"/containers/{_quote(container)}/start", ok_status=(304,))
+
+    def stop_container(self, container: str):
+        self.request(
+            "POST", f"/containers/{_quote(container)}/stop",
+            timeout=self.LONG_OPERATION_TIMEOUT_SECONDS, ok_status=(304,)
+        )
+
+    def restart_container(self, container: str):
+        self.request(
+            "POST", f"/containers/{_quote(container)}/restart",
+            timeout=self.LONG_OPERATION_TIMEOUT_SECONDS
+        )
+
+    def remove_container(self, container: str, force: bool = False):
+        self.request(
+            "DELETE", f"/containers/{_quote(container)}",
+            params={"force": "1" if force else "0"},
+            timeout=self.LONG_OPERATION_TIMEOUT_SECONDS
+        )
+
+    # ==============================
+    # 镜像
+    # ==============================
+
+    def list_images(self, all: bool = False) -> List[Dict[str, Any]]:
+        return self.request("GET", "/images/json", params={"all": "1" if all else "0"}).json()
+
+    def remove_image(self, image: str, force: bool = False) -> List[Dict[str, Any]]:
+        return self.request(
+            "DELETE", f"/images/{_quote(image)}",
+            params={"force": "1" if force else "0"},
+            timeout=self.LONG_OPERATION_TIMEOUT_SECONDS
+        ).json()
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _get_client(self) -> httpx.Client:
+        client = self._client
+        if client is not None:
+            return client
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    transport=httpx.HTTPTransport(uds=self.socket_path),
+                    # 经 Unix socket 访问时主机名不参与路由，仅用于构造合法的 URL
+                    base_url="http://docker",
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+            return self._client
+
+    def _stream_json(self, path: str, params: Dict[str, Any], disconnected_message: str) -> Iterator[Dict[str, Any]]:
+        """
+        GET 流式接口，逐行解析 JSON；阻塞等待新数据，直到连接断开。
+        """
+        try:
+            with self._get_client().stream(
+                "GET", path, params=params,
+                timeout=httpx.Timeout(self.timeout_seconds, read=None),
+            ) as response:
+                if not response.is_success:
+                    response.read()
+                    raise DockerEngineError(self._error_message(response), response.status_code)
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line)
+        except (httpx.ConnectError, httpx.ConnectTimeout, FileNotFoundError, PermissionError) as e:
+            self._mark_unavailable(e)
+            raise DockerEngineUnavailableError(f"无法连接 Docker Engine API: {e}") from e
+        except httpx.TransportError as e:
+            raise DockerEngineError(f"{disconnected_message}: {e}") from e
+
+    def _mark_unavailable(self, error: Exception):
+        if time.monotonic() >= self._unavailable_until:
+            logger.warning(
+                f"Docker Engine API 不可用（{self.socket_path}），"
+                f"{self.UNAVAILABLE_RETRY_SECONDS} 秒内改用 docker CLI: {error}"
+            )
+        self._unavailable_until = time.monotonic() + self.UNAVAILABLE_RETRY_SECONDS
+
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        try:
+            message = response.json().get("message")
+        except ValueError:
+            message = None
+        return message or f"Docker Engine API 返回错误: HTTP {response.status_code}"
+
+
+def _quote(value: str) -> str:
+    return quote(value, safe="")
@@ -0,0 +1,369 @@
+"""
+将 Docker Engine API 返回的数据转换为与 docker CLI（--format "{{json .}}"）一致的格式，
+保证通过 Engine API 与通过 CLI 获取的数据对调用方没有区别。
+"""
+import re
+import struct
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+# ==============================
+# 数值与时间格式
+# ==============================
+
+_DECIMAL_UNITS = ["B", "kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"]
+_BINARY_UNITS = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
+
+
+def _format_size(size: float, base: float, units: List[str], precision: int) -> str:
+    size = float(size or 0)
+    index = 0
+    while size >= base and index < len(units) - 1:
+        size /= base
+        index += 1
+    return f"{size:.{precision}g}{units[index]}"
+
+
+def human_size(size: float, precision: int = 4) -> str:
+    """十进制单位（kB、MB），对应 go-units HumanSizeWithPrecision"""
+    return _format_size(size, 1000.0, _DECIMAL_UNITS, precision)
+
+
+def bytes_size(size: float) -> str:
+    """二进制单位（KiB、MiB），对应 go-units BytesSize"""
+    return _format_size(size, 1024.0, _BINARY_UNITS, 4)
+
+
+def human_duration(seconds: float) -> str:
+    """对应 go-units HumanDuration，如 "About an hour"、"3 days" """
+    seconds = int(seconds)
+    if seconds < 1:
+        return "Less than a second"
+    if seconds == 1:
+        return "1 second"
+    if seconds < 60:
+        return f"{seconds} seconds"
+
+    minutes = seconds // 60
+    if minutes == 1:
+        return "About a minute"
+    if minutes < 60:
+        return f"{minutes} minutes"
+
+    hours = int(round(seconds / 3600))
+    if hours == 1:
+        return "About an hour"
+    if hours < 48:
+        return f"{hours} hours"
+    if hours < 24 * 7 * 2:
+        return f"{hours // 24} days"
+    if hours < 24 * 30 * 2:
+        return f"{hours // 24 // 7} weeks"
+    if hours < 24 * 365 * 2:
+        return f"{hours // 24 // 30} months"
+    return f"{hours // 24 // 365} years"
+
+
+def format_unix_time(timestamp: int) -> str:
+    """对应 Go time.Time.String()，如 "2024-05-01 10:00:00 +0800 CST" """
+    return datetime.fromtimestamp(timestamp).astimezone().strftime("%Y-%m-%d %H:%M:%S %z %Z")
+
+
+def _ellipsis(value: str, max_length: int) -> str:
+    if len(value) <= max_length:
+        return value
+    return value[:max_length - 1] + "…"
+
+
+def _truncate_id(value: str) -> str:
+    return (value or "").split(":", 1)[-1][:12]
+
+
+_GO_DURATION_PATTERN = re.compile(r"^(\d+(\.\d+)?(ns|us|µs|ms|s|m|h))+$")
+_GO_DURATION_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ns|us|µs|ms|s|m|h)")
+_GO_DURATION_UNITS = {
+    "ns": 1e-9, "us": 1e-6, "µs": 1e-6, "ms": 1e-3, "s": 1, "m": 60, "h": 3600,
+}
+
+
+def to_unix_timestamp(value: str) -> Optional[str]:
+    """
+    将 docker logs --since / --until 支持的时间格式转换为 Engine API 需要的 Unix 时间戳。
+
+    支持：Unix 时间戳、相对时间（如 10m、1h30m）、RFC 3339 / ISO 8601 时间（不带时区时按本地时间）。
+    无法识别时返回 None。
+    """
+    value = (value or "").strip()
+    if re.fullmatch(r"\d+(\.\d+)?", value):
+        return value
+
+    if _GO_DURATION_PATTERN.match(value):
+        seconds = sum(
+            float(number) * _GO_DURATION_UNITS[unit]
+            for number, unit in _GO_DURATION_PART_PATTERN.findall(value)
+        )
+        return f"{time.time() - seconds:.9f}"
+
+    iso_value = value.replace("Z", "+00:00").replace(" ", "T", 1)
+    # Python 3.9 的 fromisoformat 只支持 6 位小数
+    iso_value = re.sub(r"(\.\d{6})\d+", r"\1", iso_value)
+    try:
+        parsed = datetime.fromisoformat(iso_value)
+    except ValueError:
+        return None
+    return f"{parsed.timestamp():.9f}"
+
+
+# ==============================
+# 容器
+# ==============================
+
+def format_ports(ports: List[Dict[str, Any]]) -> str:
+    items = []
+    for port in sorted(ports or [], key=lambda p: (p.get("PrivatePort", 0), p.get("Type", ""), p.get("IP", ""))):
+        private = f"{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"
+        public_port = port.get("PublicPort")
+        if public_port:
+            ip = port.get("IP") or "0.0.0.0"
+            if ":" in ip:
+                ip = f"[{ip}]"
+            item = f"{ip}:{public_port}->{private}"
+        else:
+            item = private
+        if item not in items:
+            items.append(item)
+    return ", ".join(items)
+
+
+def parse_docker_time(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Engine API 返回的 RFC 3339 时间（纳秒精度），零值（0001-01-01）或无法解析时返回 None。
+    """
+    if not value or value.startswith("0001-01-01"):
+        return None
+    value = re.sub(r"(\.\d{6})\d+", r"\1", value.replace("Z", "+00:00"))
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def format_container_status(state: Dict[str, Any], now: Optional[float] = None) -> str:
+    """
+    根据 inspect 返回的 State 生成状态描述，与 docker ps 的 Status 一致，如 "Up 2 hours (healthy)"、"Exited (0) 5 minutes ago"。
+    """
+    now = time.time() if now is None else now
+    started_at = parse_docker_time(state.get("StartedAt"))
+    finished_at = parse_docker_time(state.get("FinishedAt"))
+
+    if state.get("Running"):
+        if state.get("Paused"):
+            return f"Up {human_duration(now - (started_at or now))} (Paused)"
+        if state.get("Restarting"):
+            return f"Restarting ({state.get('ExitCode', 0)}) {human_duration(now - (finished_at or now))} ago"
+
+        status = f"Up {human_duration(now - (started_at or now))}"
+        health = (state.get("Health") or {}).get("Status")
+        if health == "starting":
+            status += " (health: starting)"
+        elif health in ("healthy", "unhealthy"):
+            status += f" ({health})"
+        return status
+
+    if state.get("Status") == "removing":
+        return "Removal In Progress"
+    if state.get("Dead"):
+        return "Dead"
+    if started_at is None:
+        return "Created"
+    if finished_at is None:
+        return ""
+    return f"Exited ({state.get('ExitCode', 0)}) {human_duration(now - finished_at)} ago"
+
+
+def format_container_ps(container: Dict[str, Any], state: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """
+    Engine API /containers/json 的单个容器 -> docker ps --format "{{json .}}" 的单行。
+
+    传入 inspect 返回的 State 时，State / Status 按当前时间重新计算（用于缓存的容器数据）。
+    """
+    names = [name[1:] if name.startswith("/") else name for name in container.get("Names") or []]
+    names = [name for name in names if "/" not in name]
+
+    mounts = container.get("Mounts") or []
+    mount_names = [_ellipsis(mount.get("Name") or mount.get("Source") or "", 15) for mount in mounts]
+    local_volumes = sum(1 for mount in mounts if mount.get("Driver") == "local")
+
+    labels = container.get("Labels") or {}
+    networks = ((container.get("NetworkSettings") or {}).get("Networks") or {}).keys()
+
+    created = int(container.get("Created") or 0)
+    size = human_size(container.get("SizeRw") or 0, 3)
+    if container.get("SizeRootFs"):
+        size = f"{size} (virtual {human_size(container['SizeRootFs'], 3)})"
+
+    if state:
+        container_state, status = state.get("Status") or "", format_container_status(state)
+    else:
+        container_state, status = container.get("State") or "", container.get("Status") or ""
+
+    return {
+        "Command": '"' + _ellipsis(container.get("Command") or "", 20) + '"',
+        "CreatedAt": format_unix_time(created),
+        "ID": _truncate_id(container.get("Id")),
+        "Image": container.get("Image") or "",
+        "Labels": ",".join(f"{key}={value}" for key, value in sorted(labels.items())),
+        "LocalVolumes": str(local_volumes),
+        "Mounts": ",".join(mount_names),
+        "Names": ",".join(names),
+        "Networks": ",".join(sorted(networks)),
+        "Ports": format_ports(container.get("Ports")),
+        "RunningFor": f"{human_duration(time.time() - created)} ago",
+        "Size": size,
+        "State": container_state,
+        "Status": status,
+    }
+
+
+def compute_container_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Engine API /containers/{id}/stats 的单次采样 -> 数值指标（CPU / 内存百分比、字节数）。
+
+    CPU 使用率需要 precpu_stats（上一次采样），计算方式与 docker CLI 一致。
+    """
+    cpu_stats = stats.get("cpu_stats") or {}
+    precpu_stats = stats.get("precpu_stats") or {}
+    cpu_delta = (cpu_stats.get("cpu_usage") or {}).get("total_usage", 0) \
+        - (precpu_stats.get("cpu_usage") or {}).get("total_usage", 0)
+    system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
+    online_cpus = cpu_stats.get("online_cpus") \
+        or len((cpu_stats.get("cpu_usage") or {}).get("percpu_usage") or []) or 1
+    cpu_percent = cpu_delta / system_delta * online_cpus * 100 if cpu_delta > 0 and system_delta > 0 else 0.0
+
+    memory_stats = stats.get("memory_stats") or {}
+    memory_usage = memory_stats.get("usage", 0)
+    memory_detail = memory_stats.get("stats") or {}
+    # 与 docker CLI 一致：不计入页缓存（cgroup v1 为 total_inactive_file，v2 为 inactive_file）
+    for key in ("total_inactive_file", "inactive_file"):
+        if key in memory_detail and memory_detail[key] < memory_usage:
+            memory_usage -= memory_detail[key]
+            break
+    memory_limit = memory_stats.get("limit", 0)
+    memory_percent = memory_usage / memory_limit * 100 if memory_limit else 0.0
+
+    network_rx = network_tx = 0
+    for network in (stats.get("networks") or {}).values():
+        network_rx += network.get("rx_bytes", 0)
+        network_tx += network.get("tx_bytes", 0)
+
+    block_read = block_write = 0
+    for entry in (stats.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []:
+        op = (entry.get("op") or "").lower()
+        if op == "read":
+            block_read += entry.get("value", 0)
+        elif op == "write":
+            block_write += entry.get("value", 0)
+
+    return {
+        "cpu_percent": round(cpu_percent, 2),
+        "memory_usage": memory_usage,
+        "memory_limit": memory_limit,
+        "memory_percent": round(memory_percent, 2),
+        "network_rx": network_rx,
+        "network_tx": network_tx,
+        "block_read": block_read,
+        "block_write": block_write,
+        "pids": (stats.get("pids_stats") or {}).get("current", 0),
+    }
+
+
+def format_container_stats(stats: Dict[str, Any], container: str) -> Dict[str, str]:
+    """
+    Engine API /containers/{id}/stats 的单次采样 -> docker stats --format "{{json .}}" 的单行。
+    """
+    metrics = compute_container_stats(stats)
+    name = stats.get("name") or ""
+    return {
+        "BlockIO": f"{human_size(metrics['block_read'], 3)} / {human_size(metrics['block_write'], 3)}",
+        "CPUPerc": f"{metrics['cpu_percent']:.2f}%",
+        "Container": container,
+        "ID": _truncate_id(stats.get("id")),
+        "MemPerc": f"{metrics['memory_percent']:.2f}%",
+        "MemUsage": f"{bytes_size(metrics['memory_usage'])} / {bytes_size(metrics['memory_limit'])}",
+        "Name": name[1:] if name.startswith("/") else name,
+        "NetIO": f"{human_size(metrics['network_rx'], 3)} / {human_size(metrics['network_tx'], 3)}",
+        "PIDs": str(metrics["pids"]),
+    }
+
+
+def decode_log_stream(data: bytes, content_type: Optional[str] = None) -> str:
+    """
+    解析 Engine API 的日志输出。
+
+    未开启 TTY 的容器，stdout / stderr 以多路复用格式返回：每帧 8 字节头（流类型、3 字节填充、
+    4 字节大端长度）+ 数据；开启 TTY 的容器直接返回原始输出。两路按原始顺序合并，与 CLI 一致。
+    """
+    multiplexed = (
+        "multiplexed" in content_type if content_type and "vnd.docker" in content_type
+        else len(data) >= 8 and data[0] in (0, 1, 2) and data[1:4] == b"\x00\x00\x00"
+    )
+    if not multiplexed:
+        return data.decode("utf-8", errors="replace")
+
+    chunks = []
+    offset = 0
+    while offset + 8 <= len(data):
+        length = struct.unpack(">I", data[offset + 4:offset + 8])[0]
+        chunks.append(data[offset + 8:offset + 8 + length])
+        offset += 8 + length
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+
+# ==============================
+# 镜像
+# ==============================
+
+def _split_repo_tag(repo_tag: str):
+    repository, separator, tag = repo_tag.rpartition(":")
+    if not separator or "/" in tag:
+        return repo_tag, "<none>"
+    return repository, tag
+
+
+def format_image_rows(image: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    Engine API /images/json 的单个镜像 -> docker images --format "{{json .}}" 的若干行（每个标签一行）。
+    """
+    created = int(image.get("Created") or 0)
+    size = image.get("Size") or 0
+    containers = image.get("Containers", -1)
+    common = {
+        "Containers": "N/A" if containers is None or containers < 0 else str(containers),
+        "CreatedAt": format_unix_time(created),
+        "CreatedSince": f"{human_duration(time.time() - created)} ago",
+        "ID": _truncate_id(image.get("Id")),
+        "SharedSize": "N/A",
+        "Size": human_size(size, 3),
+        "UniqueSize": "N/A",
+        "VirtualSize": human_size(image.get("VirtualSize") or size, 3),
+    }
+
+    digests: Dict[str, str] = {}
+    for repo_digest in image.get("RepoDigests") or []:
+        repository, _, digest = repo_digest.partition("@")
+        digests.setdefault(repository, digest)
+
+    repo_tags = [tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"]
+    rows = []
+    for repo_tag in repo_tags:
+        repository, tag = _split_repo_tag(repo_tag)
+        rows.append({**common, "Digest": digests.get(repository, "<none>"), "Repository": repository, "Tag": tag})
+
+    if not rows:
+        for repository, digest in digests.items():
+            rows.append({**common, "Digest": digest, "Repository": repository, "Tag": "<none>"})
+    if not rows:
+        rows.append({**common, "Digest": "<none>", "Repository": "<none>", "Tag": "<none>"})
+    return rows
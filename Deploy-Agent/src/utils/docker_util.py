@@ -1,18 +1,22 @@
 import subprocess
-from typing import List
+from typing import List, Optional
+
+from config.app_config import app_config
 
 
 # Docker命令执行路径，需根据宿主机挂载配置一致
 DOCKER_PATH = "/usr/bin/docker"
 
 # 安全执行Docker命令的辅助函数
-def run_docker_command(args: List[str]) -> str:
+# timeout 默认为 docker.timeout_seconds，超时后终止子进程并抛出 subprocess.TimeoutExpired
+def run_docker_command(args: List[str], timeout: Optional[float] = None) -> str:
     command = [DOCKER_PATH] + args
     result = subprocess.run(
         command,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
-        check=True
+        check=True,
+        timeout=timeout or app_config.docker.timeout_seconds
     )
     return result.stdout
\ No newline at end of file
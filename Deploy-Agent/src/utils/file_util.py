@@ -1,20 +1,97 @@
 import os
-import uuid
+import json
 import shutil
-from fastapi import UploadFile
+import tempfile
+from typing import Optional
 
-def save_uploaded_file(upload_file: UploadFile) -> str:
+def remove_uploaded_file(file_path: Optional[str]) -> bool:
     """
-    将上传文件保存到临时目录，并返回保存后的绝对路径。
+    删除临时上传目录（data/temp_uploads）下的上传文件。
+
+    现在的上传文件由产物存储管理，此处用于清理旧版本任务遗留的临时文件。
+
+    仅删除临时上传目录下的文件，其他路径一律忽略，返回是否实际删除。
     """
+    if not file_path:
+        return False
+
     upload_dir = os.path.join(os.getcwd(), "data", "temp_uploads")
-    os.makedirs(upload_dir, exist_ok=True)
+    real_path = os.path.realpath(file_path)
+    if os.path.dirname(real_path) != os.path.realpath(upload_dir):
+        return False
+
+    try:
+        os.remove(real_path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def link_or_copy(source_path: str, target_path: str) -> str:
+    """
+    将文件放置到目标路径，依次尝试硬链接、reflink（写时复制克隆）与普通复制。
+
+    目标文件已存在时先删除，避免原地覆盖写穿到共享同一 inode 的其他文件。
+    返回实际使用的方式：link / reflink / copy。
+    """
+    try:
+        os.remove(target_path)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(source_path, target_path)
+        return "link"
+    except OSError:
+        pass
 
-    ext = os.path.splitext(upload_file.filename)[1] or ".zip"
-    file_name = f"{uuid.uuid4().hex}{ext}"
-    file_path = os.path.join(upload_dir, file_name)
+    if _reflink(source_path, target_path):
+        return "reflink"
 
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(upload_file.file, f)
+    shutil.copyfile(source_path, target_path)
+    return "copy"
+
+
+def _reflink(source_path: str, target_path: str) -> bool:
+    """
+    通过 FICLONE ioctl 克隆文件（btrfs / xfs 等支持写时复制的文件系统），不支持时返回 False。
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    ficlone = 0x40049409
+    try:
+        with open(source_path, "rb") as source, open(target_path, "wb") as target:
+            fcntl.ioctl(target.fileno(), ficlone, source.fileno())
+        return True
+    except OSError:
+        try:
+            os.remove(target_path)
+        except FileNotFoundError:
+            pass
+        return False
+
+
+def atomic_write_json(file_path: str, data, **dump_kwargs):
+    """
+    以“临时文件 + 原子重命名”的方式写入 JSON 文件。
+
+    先写入同目录下的临时文件并 fsync，再通过 os.replace 覆盖目标文件，
+    保证任意时刻目标文件要么是旧内容、要么是完整的新内容。
+    """
+    directory = os.path.dirname(file_path)
+    os.makedirs(directory, exist_ok=True)
 
-    return file_path
+    fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
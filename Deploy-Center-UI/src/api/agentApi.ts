@@ -85,3 +85,44 @@ export async function callAgentApi(
     ...config,
   });
 }
+
+// 批量调用 Agent API 中的单个调用
+export interface AgentApiCall {
+  agent_id: number;
+  api_path: string;
+  method?: string;
+  // 调用标识，作为返回结果的键；未指定时使用调用在列表中的下标
+  key?: string;
+  data?: any;
+}
+
+// 批量调用 Agent API 中单个调用的结果
+export interface AgentApiCallResult<T = any> {
+  agent_id: number;
+  api_path: string;
+  method: string;
+  code: number;
+  msg: string | null;
+  data: T;
+  elapsed_ms: number;
+}
+
+// 批量调用 Agent API：一次请求并发完成多个调用，单个调用失败不影响其他调用
+export function batchCallAgentApi(
+  calls: AgentApiCall[],
+  options?: { timeout_seconds?: number; max_concurrency?: number }
+): Promise<HttpResult<Record<string, AgentApiCallResult>>> {
+  return request({
+    url: '/api/deploy-center/agent/batch-call',
+    method: 'post',
+    data: { calls, ...options },
+  });
+}
+
+// 获取所有 Agent 的运行状态（来自 Center 的后台健康探测）
+export function getFleetStatus(): Promise<HttpResult<any[]>> {
+  return request({
+    url: '/api/deploy-center/agent/fleet/status',
+    method: 'get',
+  });
+}
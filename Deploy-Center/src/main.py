@@ -3,6 +3,7 @@
 @Author: Tianfei Ji
 """
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -15,6 +16,20 @@ from routes.agent_routes import agent_router
 from routes.user_routes import user_router
 from routes.system_config_routes import system_config_router
 from routes.two_factor_routes import two_factor_router
+from manager import AGENT_CLIENT_MANAGER, AGENT_HEALTH_MANAGER, CACHED_DATA_MANAGER
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 后台定期探测各 Agent 的健康状态
+    AGENT_HEALTH_MANAGER.start()
+    # 定期清理过期缓存，并快照持久化缓存
+    CACHED_DATA_MANAGER.start_maintenance()
+    yield
+    await AGENT_HEALTH_MANAGER.stop()
+    CACHED_DATA_MANAGER.stop_maintenance()
+    # 关闭与各 Agent 的共享连接
+    await AGENT_CLIENT_MANAGER.close_all()
 
 
 app = FastAPI(
@@ -26,7 +41,8 @@ app = FastAPI(
         "url": "http://jitianfei.com",
         "email": "ieacoder@foxmail.com",
     },
-    openapi_url=None    # 禁用API文档
+    openapi_url=None,    # 禁用API文档
+    lifespan=lifespan,
 )
 
 # 添加 Token校验 Middleware
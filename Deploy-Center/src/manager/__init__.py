@@ -5,10 +5,18 @@ manager 包统一暴露全局单例管理器实例。
 本模块作为统一导入入口，提供系统中的DataManager 单例对象，方便调用方直接使用，提升可读性与一致性。
 """
 from .agent_data_manager import AgentDataManager
+from .cached_data_manager import CachedDataManager
 from .system_config_data_manager import SystemConfigDataManager
 from .user_data_manager import UserDataManager
+from .agent_client_manager import AgentClientManager
+from .agent_health_manager import AgentHealthManager
+from .agent_response_cache_manager import AgentResponseCacheManager
 
 
 AGENT_DATA_MANAGER = AgentDataManager().get_instance()
+CACHED_DATA_MANAGER = CachedDataManager().get_instance()
 SYSTEM_CONFIG_DATA_MANAGER = SystemConfigDataManager().get_instance()
-USER_DATA_MANAGER = UserDataManager().get_instance()
\ No newline at end of file
+USER_DATA_MANAGER = UserDataManager().get_instance()
+AGENT_CLIENT_MANAGER = AgentClientManager().get_instance()
+AGENT_HEALTH_MANAGER = AgentHealthManager().get_instance()
+AGENT_RESPONSE_CACHE_MANAGER = AgentResponseCacheManager().get_instance()
\ No newline at end of file
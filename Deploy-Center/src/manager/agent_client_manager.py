@@ -0,0 +1,222 @@
+import asyncio
+import importlib.util
+from typing import Any, Dict, Optional, Set, Tuple
+
+import httpx
+
+from config.log_config import get_logger
+from utils.circuit_breaker import CircuitBreaker
+from .system_config_data_manager import SystemConfigDataManager
+
+logger = get_logger()
+
+
+# 是否安装了 HTTP/2 支持（pip install httpx[http2]）
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class AgentClientManager:
+    """
+    AgentClientManager
+
+    按 Agent 维护应用生命周期内共享的 httpx.AsyncClient（连接池）。
+
+    说明：
+        - 每个 Agent 一个客户端，连接保持复用（keep-alive），避免每次调用都重新建立 TCP / TLS 连接
+        - 安装了 h2 时启用 HTTP/2，由 TLS ALPN 与 Agent 协商，不支持时自动回退到 HTTP/1.1
+        - 连接数上限与连接/读取超时来自系统配置，配置修改后对新建的客户端生效
+        - agent_* 系统配置首次使用时读取一次并保存在内存中，
+          通过 system_config_routes 修改或删除 agent_* 配置后调用 reload_settings 重新读取
+        - Agent 的 service_url 变化、Agent 被修改或删除时，旧客户端失效并关闭
+        - 应用关闭时统一关闭所有客户端
+
+    熔断与重试：
+        - 每个 Agent 一个熔断器，连续失败达到阈值后熔断，期间对该 Agent 的调用直接失败，
+          熔断时长过后放行一个试探调用，成功则恢复
+        - 幂等请求（GET 等）失败时按退避间隔有限次重试，重试次数与间隔来自系统配置
+    """
+
+    _instance = None
+
+    # 系统配置项缺失时使用的默认值
+    DEFAULT_CONNECT_TIMEOUT_SECONDS = 5
+    DEFAULT_READ_TIMEOUT_SECONDS = 60
+    DEFAULT_MAX_CONNECTIONS = 20
+    DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 5
+    DEFAULT_CIRCUIT_OPEN_SECONDS = 30
+    DEFAULT_RETRY_MAX_ATTEMPTS = 3
+    DEFAULT_RETRY_BACKOFF_SECONDS = 0.2
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AgentClientManager, cls).__new__(cls)
+            # agent_id -> (service_url, client)
+            cls._instance._clients: Dict[int, Tuple[str, httpx.AsyncClient]] = {}
+            cls._instance._closing_tasks: Set[asyncio.Task] = set()
+            cls._instance._breakers: Dict[int, CircuitBreaker] = {}
+            # agent_* 系统配置：config_key -> config_value，None 表示尚未读取
+            cls._instance._settings: Optional[Dict[str, Any]] = None
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get_client(self, agent: Dict) -> httpx.AsyncClient:
+        """
+        获取 Agent 对应的共享客户端，service_url 变化时重建。
+
+        需在事件循环中调用。
+
+        Args:
+            agent: Agent 信息，需包含 id 与 service_url
+        """
+        agent_id = agent["id"]
+        service_url = agent["service_url"]
+
+        entry = self._clients.get(agent_id)
+        if entry is not None:
+            cached_url, client = entry
+            if cached_url == service_url and not client.is_closed:
+                return client
+            self._discard(agent_id)
+
+        client = self._create_client()
+        self._clients[agent_id] = (service_url, client)
+        logger.info(f"Agent 客户端已创建: agent_id={agent_id}, service_url={service_url}")
+        return client
+
+    def get_breaker(self, agent_id: int) -> CircuitBreaker:
+        breaker = self._breakers.get(agent_id)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name=f"agent-{agent_id}",
+                failure_threshold=self._get_number_config(
+                    "agent_circuit_failure_threshold", self.DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+                ) or self.DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+                open_seconds=self._get_number_config(
+                    "agent_circuit_open_seconds", self.DEFAULT_CIRCUIT_OPEN_SECONDS
+                ) or self.DEFAULT_CIRCUIT_OPEN_SECONDS,
+            )
+            self._breakers[agent_id] = breaker
+        return breaker
+
+    def get_retry_policy(self) -> Tuple[int, float]:
+        """
+        幂等请求的重试策略：(最大尝试次数（含首次）, 首次重试的退避秒数)。
+        """
+        max_attempts = self._get_number_config("agent_retry_max_attempts", self.DEFAULT_RETRY_MAX_ATTEMPTS)
+        backoff = self._get_number_config("agent_retry_backoff_seconds", self.DEFAULT_RETRY_BACKOFF_SECONDS)
+        return max(int(max_attempts or 1), 1), backoff or 0
+
+    def breaker_stats(self) -> Dict[int, Dict]:
+        return {agent_id: breaker.snapshot() for agent_id, breaker in self._breakers.items()}
+
+    async def invalidate(self, agent_id: int):
+        """
+        使 Agent 的客户端失效并关闭，下次调用时重建，熔断器同时重置。
+        """
+        self._breakers.pop(agent_id, None)
+        entry = self._clients.pop(agent_id, None)
+        if entry is not None:
+            await entry[1].aclose()
+            logger.info(f"Agent 客户端已关闭: agent_id={agent_id}")
+
+    async def close_all(self):
+        """
+        关闭所有客户端并重置熔断器（应用关闭或连接配置变化时调用）。
+        """
+        entries = list(self._clients.values())
+        self._clients.clear()
+        self._breakers.clear()
+        for _, client in entries:
+            await client.aclose()
+        if entries:
+            logger.info(f"Agent 客户端已全部关闭: count={len(entries)}")
+
+    def get_setting(self, config_key: str, default=None):
+        """
+        读取内存中的 agent_* 系统配置原始值，未配置时返回 default。
+        """
+        return self._get_config(config_key, default)
+
+    def reload_settings(self):
+        """
+        丢弃内存中的 agent_* 配置，下次使用时重新读取。
+        """
+        self._settings = None
+
+    def stats(self) -> Dict:
+        return {
+            "http2_available": HTTP2_AVAILABLE,
+            "clients": [
+                {"agent_id": agent_id, "service_url": service_url}
+                for agent_id, (service_url, _) in self._clients.items()
+            ],
+        }
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _discard(self, agent_id: int):
+        """
+        移除失效的客户端，并在后台关闭。
+        """
+        self._breakers.pop(agent_id, None)
+        entry = self._clients.pop(agent_id, None)
+        if entry is None:
+            return
+
+        task = asyncio.get_running_loop().create_task(entry[1].aclose())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+        logger.info(f"Agent 客户端已失效: agent_id={agent_id}, service_url={entry[0]}")
+
+    def _create_client(self) -> httpx.AsyncClient:
+        connect_timeout = self._get_number_config("agent_connect_timeout_seconds", self.DEFAULT_CONNECT_TIMEOUT_SECONDS)
+        read_timeout = self._get_number_config("agent_read_timeout_seconds", self.DEFAULT_READ_TIMEOUT_SECONDS)
+        max_connections = self._get_number_config("agent_max_connections", self.DEFAULT_MAX_CONNECTIONS)
+        enable_http2 = self._get_config("agent_enable_http2", True)
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=connect_timeout,
+                read=read_timeout,
+                write=read_timeout,
+                pool=connect_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=int(max_connections) if max_connections else None,
+                max_keepalive_connections=int(max_connections) if max_connections else None,
+                keepalive_expiry=self.DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=bool(enable_http2) and HTTP2_AVAILABLE,
+        )
+
+    def _get_config(self, config_key: str, default):
+        settings = self._settings
+        if settings is None:
+            settings = self._settings = {
+                config.config_key: config.config_value
+                for config in SystemConfigDataManager.get_instance().list_configs()
+                if config.config_key and config.config_key.startswith("agent_")
+            }
+        return settings.get(config_key, default)
+
+    def _get_number_config(self, config_key: str, default) -> Optional[float]:
+        """
+        读取数值型配置：未配置时使用默认值，配置为空或不大于 0 表示不限制。
+        """
+        value = self._get_config(config_key, default)
+        if value is None or value == "":
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            logger.warning(f"系统配置 {config_key} 不是有效数值: {value}，使用默认值 {default}")
+            return default
+        return value if value > 0 else None
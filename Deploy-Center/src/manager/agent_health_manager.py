@@ -0,0 +1,346 @@
+import asyncio
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from config.log_config import get_logger
+from .agent_data_manager import AgentDataManager
+from .agent_client_manager import AgentClientManager
+
+logger = get_logger()
+
+
+class AgentHealthManager:
+    """
+    AgentHealthManager
+
+    后台定期探测各 Agent 的健康状态，并在内存中维护 Agent 集群状态表。
+
+    探测：
+        - 定期请求 /api/deploy-agent/health，记录最后在线时间与往返耗时（RTT）
+        - 首次在线、重新上线或信息过期时请求 /api/deploy-agent/inspect/info，记录版本等信息
+        - 探测间隔带随机抖动，避免所有 Agent 同时被探测
+        - 探测失败时按指数退避延长间隔，直到上限
+
+    状态：
+        - UNKNOWN: 尚未探测
+        - ONLINE: 最近一次探测成功
+        - OFFLINE: 连续失败次数达到阈值，对该 Agent 的调用将直接失败，不再等待连接超时
+
+    说明：
+        - 状态只保存在内存中，Center 重启后重新探测
+        - Agent 列表保存在内存中，每 AGENT_LIST_REFRESH_SECONDS 在线程中从 AgentDataManager 重新读取；
+          通过接口新增、修改、删除 Agent 后调用 refresh_agents，下一轮立即重新读取
+        - 探测超时、间隔与退避上限读取 AgentClientManager 内存中的 agent_* 配置，不访问配置文件
+    """
+
+    _instance = None
+
+    STATUS_UNKNOWN = "UNKNOWN"
+    STATUS_ONLINE = "ONLINE"
+    STATUS_OFFLINE = "OFFLINE"
+
+    HEALTH_PATH = "/api/deploy-agent/health"
+    INFO_PATH = "/api/deploy-agent/inspect/info"
+
+    # 调度循环的间隔
+    TICK_SECONDS = 1
+    # Agent 列表的重新读取间隔（兜底配置文件被外部修改的情况）
+    AGENT_LIST_REFRESH_SECONDS = 30
+    # 同时进行的最大探测数
+    MAX_CONCURRENT_PROBES = 16
+    # 连续失败多少次后标记为离线
+    FAILURE_THRESHOLD = 2
+    # 探测间隔的随机抖动比例
+    JITTER_RATIO = 0.2
+    # Agent 信息（版本等）的刷新间隔
+    INFO_REFRESH_SECONDS = 600
+    # 离线 Agent 被调用时，距上次探测超过该时间则立即重新探测
+    RECHECK_AFTER_SECONDS = 5
+
+    # 系统配置项缺失时使用的默认值
+    DEFAULT_INTERVAL_SECONDS = 15
+    DEFAULT_MAX_BACKOFF_SECONDS = 300
+    DEFAULT_TIMEOUT_SECONDS = 3
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AgentHealthManager, cls).__new__(cls)
+            cls._instance._states: Dict[int, Dict] = {}
+            cls._instance._next_check_at: Dict[int, float] = {}
+            cls._instance._info_requested_at: Dict[int, float] = {}
+            cls._instance._probing: Set[int] = set()
+            cls._instance._probe_tasks: Set[asyncio.Task] = set()
+            cls._instance._task: Optional[asyncio.Task] = None
+            # Agent 列表：None 表示需要重新读取
+            cls._instance._agents: Optional[List[Dict]] = None
+            cls._instance._agents_loaded_at = 0.0
+            # 每次 refresh_agents 加一，读取期间列表发生变化时丢弃读取结果
+            cls._instance._agents_generation = 0
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # ==============================
+    # 生命周期
+    # ==============================
+
+    def start(self):
+        """
+        启动后台探测任务（需在事件循环中调用）。
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("Agent 健康探测已启动")
+
+    async def stop(self):
+        tasks = [task for task in [self._task, *self._probe_tasks] if task is not None]
+        self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def refresh_agents(self):
+        """
+        Agent 新增、修改或删除后调用，下一轮调度前重新读取 Agent 列表。
+        """
+        self._agents = None
+        self._agents_generation += 1
+
+    # ==============================
+    # 查询
+    # ==============================
+
+    def get_fleet_status(self) -> List[Dict]:
+        """
+        获取所有 Agent 的状态（按 Agent 列表顺序）。
+        """
+        agents = self._agents
+        if agents is None:
+            agents = AgentDataManager.get_instance().list_agents()
+
+        fleet = []
+        for agent in agents:
+            state = self._states.get(agent["id"])
+            if state is None or state["service_url"] != agent.get("service_url"):
+                state = self._new_state(agent)
+            fleet.append({**state, "name": agent.get("name")})
+        return fleet
+
+    def get_status(self, agent_id: int) -> Optional[Dict]:
+        state = self._states.get(agent_id)
+        return dict(state) if state else None
+
+    def is_unavailable(self, agent_id: int, service_url: Optional[str] = None) -> bool:
+        """
+        判断 Agent 是否已知离线。
+
+        离线 Agent 距上次探测超过 RECHECK_AFTER_SECONDS 时，安排立即重新探测，
+        使恢复的 Agent 尽快重新可用。
+        """
+        state = self._states.get(agent_id)
+        if state is None or state["status"] != self.STATUS_OFFLINE:
+            return False
+        if service_url is not None and state["service_url"] != service_url:
+            return False
+
+        last_checked_at = state.get("last_checked_at")
+        if last_checked_at is None or (datetime.now() - last_checked_at).total_seconds() > self.RECHECK_AFTER_SECONDS:
+            self._next_check_at[agent_id] = time.monotonic()
+        return True
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    async def _run(self):
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PROBES)
+        while True:
+            try:
+                if self._agents is None or time.monotonic() - self._agents_loaded_at >= self.AGENT_LIST_REFRESH_SECONDS:
+                    await self._load_agents()
+                self._schedule_probes(semaphore)
+            except Exception as e:
+                logger.exception(f"Agent 健康探测调度失败: {e}")
+            await asyncio.sleep(self.TICK_SECONDS)
+
+    async def _load_agents(self):
+        """
+        在线程中读取 Agent 列表，不阻塞事件循环。
+        """
+        loaded_at = time.monotonic()
+        generation = self._agents_generation
+        agents = await asyncio.to_thread(AgentDataManager.get_instance().list_agents)
+        if generation != self._agents_generation:
+            return
+        self._agents = agents
+        self._agents_loaded_at = loaded_at
+
+    def _schedule_probes(self, semaphore: asyncio.Semaphore):
+        agents = self._agents
+        if agents is None:
+            return
+        now = time.monotonic()
+
+        # 同步 Agent 列表：移除已删除的 Agent，service_url 变化时重置状态
+        agent_ids = {agent["id"] for agent in agents}
+        for agent_id in list(self._states):
+            if agent_id not in agent_ids:
+                self._states.pop(agent_id, None)
+                self._next_check_at.pop(agent_id, None)
+                self._info_requested_at.pop(agent_id, None)
+
+        for agent in agents:
+            agent_id = agent["id"]
+            if not agent.get("service_url"):
+                continue
+
+            state = self._states.get(agent_id)
+            if state is None or state["service_url"] != agent["service_url"]:
+                self._states[agent_id] = self._new_state(agent)
+                self._next_check_at[agent_id] = now
+                self._info_requested_at.pop(agent_id, None)
+
+            if agent_id in self._probing or self._next_check_at.get(agent_id, now) > now:
+                continue
+
+            self._probing.add(agent_id)
+            task = asyncio.get_running_loop().create_task(self._probe(agent, semaphore))
+            self._probe_tasks.add(task)
+            task.add_done_callback(self._probe_tasks.discard)
+
+    async def _probe(self, agent: Dict, semaphore: asyncio.Semaphore):
+        agent_id = agent["id"]
+        service_url = agent["service_url"].rstrip("/")
+        timeout = self._get_number_config("agent_health_check_timeout_seconds", self.DEFAULT_TIMEOUT_SECONDS)
+
+        try:
+            async with semaphore:
+                client = AgentClientManager.get_instance().get_client(agent)
+                start = time.perf_counter()
+                try:
+                    response = await client.get(f"{service_url}{self.HEALTH_PATH}", timeout=timeout)
+                    response.raise_for_status()
+                except Exception as e:
+                    self._on_probe_failure(agent_id, service_url, e)
+                    return
+
+                rtt_ms = round((time.perf_counter() - start) * 1000, 2)
+                info = None
+                if self._need_info(agent_id, service_url):
+                    self._info_requested_at[agent_id] = time.monotonic()
+                    try:
+                        response = await client.get(f"{service_url}{self.INFO_PATH}", timeout=timeout)
+                        response.raise_for_status()
+                        info = response.json().get("data") or {}
+                    except Exception as e:
+                        logger.warning(f"获取 Agent 信息失败: agent_id={agent_id}, error={e.__class__.__name__}: {e}")
+
+                self._on_probe_success(agent_id, service_url, rtt_ms, info)
+        finally:
+            self._probing.discard(agent_id)
+
+    def _on_probe_success(self, agent_id: int, service_url: str, rtt_ms: float, info: Optional[Dict]):
+        state = self._get_current_state(agent_id, service_url)
+        if state is None:
+            return
+
+        now = datetime.now()
+        if state["status"] == self.STATUS_OFFLINE:
+            logger.info(f"Agent 已恢复在线: agent_id={agent_id}, service_url={service_url}")
+
+        state.update({
+            "status": self.STATUS_ONLINE,
+            "last_seen_at": now,
+            "last_checked_at": now,
+            "rtt_ms": rtt_ms,
+            "consecutive_failures": 0,
+            "last_error": None,
+        })
+        if info is not None:
+            state.update({
+                "agent_version": info.get("agent_version"),
+                "hostname": info.get("hostname"),
+                "os": info.get("os"),
+                "arch": info.get("arch"),
+                "docker_version": info.get("docker_version"),
+                "info_fetched_at": now,
+            })
+
+        interval = self._get_number_config("agent_health_check_interval_seconds", self.DEFAULT_INTERVAL_SECONDS)
+        self._next_check_at[agent_id] = time.monotonic() + self._jitter(interval)
+
+    def _on_probe_failure(self, agent_id: int, service_url: str, error: Exception):
+        state = self._get_current_state(agent_id, service_url)
+        if state is None:
+            return
+
+        state["consecutive_failures"] += 1
+        state["last_checked_at"] = datetime.now()
+        state["last_error"] = f"{error.__class__.__name__}: {error}"
+        if state["consecutive_failures"] >= self.FAILURE_THRESHOLD and state["status"] != self.STATUS_OFFLINE:
+            state["status"] = self.STATUS_OFFLINE
+            logger.warning(f"Agent 已离线: agent_id={agent_id}, service_url={service_url}, error={state['last_error']}")
+
+        # 指数退避：interval * 2^(失败次数 - 1)，不超过上限
+        interval = self._get_number_config("agent_health_check_interval_seconds", self.DEFAULT_INTERVAL_SECONDS)
+        max_backoff = self._get_number_config("agent_health_check_max_backoff_seconds", self.DEFAULT_MAX_BACKOFF_SECONDS)
+        backoff = min(interval * (2 ** (state["consecutive_failures"] - 1)), max(max_backoff, interval))
+        self._next_check_at[agent_id] = time.monotonic() + self._jitter(backoff)
+
+    def _get_current_state(self, agent_id: int, service_url: str) -> Optional[Dict]:
+        """
+        获取探测结果对应的状态；探测期间 Agent 被删除或 service_url 变化时返回 None，丢弃结果。
+        """
+        state = self._states.get(agent_id)
+        if state is None or state["service_url"].rstrip("/") != service_url:
+            return None
+        return state
+
+    def _need_info(self, agent_id: int, service_url: str) -> bool:
+        state = self._get_current_state(agent_id, service_url)
+        if state is None:
+            return False
+        # 首次在线或重新上线时获取；否则按刷新间隔获取（获取失败也按间隔重试）
+        if state["status"] != self.STATUS_ONLINE:
+            return True
+        requested_at = self._info_requested_at.get(agent_id)
+        return requested_at is None or time.monotonic() - requested_at >= self.INFO_REFRESH_SECONDS
+
+    def _jitter(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.JITTER_RATIO, 1 + self.JITTER_RATIO)
+
+    def _new_state(self, agent: Dict) -> Dict:
+        return {
+            "agent_id": agent["id"],
+            "service_url": agent.get("service_url"),
+            "status": self.STATUS_UNKNOWN,
+            "last_seen_at": None,
+            "last_checked_at": None,
+            "rtt_ms": None,
+            "consecutive_failures": 0,
+            "last_error": None,
+            "agent_version": None,
+            "hostname": None,
+            "os": None,
+            "arch": None,
+            "docker_version": None,
+            "info_fetched_at": None,
+        }
+
+    def _get_number_config(self, config_key: str, default: float) -> float:
+        config_value = AgentClientManager.get_instance().get_setting(config_key)
+        if config_value in (None, ""):
+            return default
+        try:
+            value = float(config_value)
+        except (TypeError, ValueError):
+            logger.warning(f"系统配置 {config_key} 不是有效数值: {config_value}，使用默认值 {default}")
+            return default
+        return value if value > 0 else default
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from config.log_config import get_logger
+
+logger = get_logger()
+
+
+class AgentResponseCacheManager:
+    """
+    AgentResponseCacheManager
+
+    Center 转发 Agent 只读接口时使用的短时响应缓存。
+
+    说明：
+        - 只缓存白名单中的 GET 接口（CACHEABLE_PATHS），各接口有独立的 TTL
+        - 缓存键为 (agent_id, method, path, query, 用户权限范围)，不同权限的用户互不共享
+        - 请求合并：相同缓存键的并发请求只向 Agent 发起一次调用，其余请求等待并共享结果
+        - 按缓存数据的字节数做 LRU 淘汰，总大小不超过 MAX_BYTES
+        - 对某个 Agent 的写操作（非 GET）成功后，清除该 Agent 的全部缓存；
+          清除时仍在进行中的调用，其结果不会写入缓存
+        - 只在当前进程内存中，Center 重启后失效
+    """
+
+    _instance = None
+
+    # 可缓存的 Agent 只读接口及其 TTL（秒）
+    CACHEABLE_PATHS: Dict[str, float] = {
+        "/api/deploy-agent/docker/images": 10,
+        "/api/deploy-agent/docker/info": 30,
+        "/api/deploy-agent/server/system_info": 30,
+        "/api/deploy-agent/inspect/info": 30,
+        "/api/deploy-agent/project/list": 5,
+    }
+
+    # 缓存数据总大小上限（字节）
+    MAX_BYTES = 32 * 1024 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AgentResponseCacheManager, cls).__new__(cls)
+            cls._instance._init_cache()
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _init_cache(self):
+        # key -> (agent_id, value, size, expire_at)
+        self._entries: "OrderedDict[Tuple, Tuple[int, Any, int, float]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        # 每个 Agent 的缓存版本号，清除缓存时递增
+        self._generations: Dict[int, int] = {}
+        self._total_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def get_ttl(self, method: str, path: str) -> Optional[float]:
+        """
+        获取接口的缓存 TTL，不可缓存时返回 None。
+        """
+        if method.upper() != "GET":
+            return None
+        return self.CACHEABLE_PATHS.get("/" + path.strip("/"))
+
+    async def get_or_load(
+        self,
+        agent_id: int,
+        key: Tuple,
+        ttl: float,
+        loader: Callable[[], Awaitable[Tuple[Any, int, bool]]],
+    ) -> Any:
+        """
+        从缓存获取数据，未命中时调用 loader 加载。
+
+        Args:
+            agent_id: Agent ID，用于按 Agent 清除缓存
+            key: 缓存键
+            ttl: 缓存时间（秒）
+            loader: 加载函数，返回 (数据, 字节数, 是否可缓存)；抛出的异常会传递给所有等待的请求，且不缓存
+
+        Returns:
+            缓存或新加载的数据（多个请求共享，调用方不能修改）
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[3] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._remove(key)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            generation = self._generations.get(agent_id, 0)
+            # 独立任务中加载，发起请求的客户端断开时不影响其他等待者
+            task = asyncio.get_running_loop().create_task(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_loaded(agent_id, key, ttl, generation, t))
+
+        return (await asyncio.shield(task))[0]
+
+    def invalidate_agent(self, agent_id: int):
+        """
+        清除 Agent 的全部缓存，进行中的调用结果也不再写入缓存。
+        """
+        self._generations[agent_id] = self._generations.get(agent_id, 0) + 1
+        keys = [key for key, entry in self._entries.items() if entry[0] == agent_id]
+        for key in keys:
+            self._remove(key)
+        if keys:
+            logger.debug(f"Agent 响应缓存已清除: agent_id={agent_id}, count={len(keys)}")
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self._entries),
+            "total_bytes": self._total_bytes,
+            "max_bytes": self.MAX_BYTES,
+            "inflight": len(self._inflight),
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "evictions": self._evictions,
+        }
+
+    # ==============================
+    # 内部方法
+    # ==============================
+
+    def _on_loaded(self, agent_id: int, key: Tuple, ttl: float, generation: int, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        value, size, cacheable = task.result()
+        if not cacheable or size > self.MAX_BYTES or self._generations.get(agent_id, 0) != generation:
+            return
+
+        self._remove(key)
+        self._entries[key] = (agent_id, value, size, time.monotonic() + ttl)
+        self._total_bytes += size
+
+        while self._total_bytes > self.MAX_BYTES and self._entries:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: Tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
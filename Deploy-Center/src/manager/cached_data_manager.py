@@ -1,67 +1,259 @@
 # managers/cached_data_manager.py
 import json
 import os
-from typing import List, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock, RLock, Timer
+from typing import Dict, List, Optional, Set
 from models.common.cached_data import CachedData
+from config.log_config import get_logger
+
+logger = get_logger()
 
 
 class CachedDataManager:
+    """
+    CachedDataManager
+
+    常驻内存的 TTL / LRU 缓存。
+
+    说明：
+        - 读写均在内存中完成，get / set / delete 为 O(1)，命中次数等统计只保存在内存中
+        - 过期：读取时惰性判断，并由后台定期清理（依据 CachedData.ttl / expire_at）
+        - 淘汰：条目数超过 MAX_ENTRIES 或数据总大小超过 MAX_BYTES 时，淘汰最久未使用的条目
+        - 标签：按 tags 批量失效（invalidate_tag）
+        - 持久化：只有 persistent=True 的条目会定期快照到 cached_data.json，启动时从中恢复
+    """
+
     _instance = None
     _data_file_path = os.path.join(
         os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
         "data", "cached_data.json"
     )
 
+    # 条目数上限
+    MAX_ENTRIES = 10000
+    # 数据总大小上限（按 cache_value 的 JSON 序列化长度估算）
+    MAX_BYTES = 64 * 1024 * 1024
+    # 过期清理与快照的间隔（秒）
+    MAINTENANCE_INTERVAL_SECONDS = 60
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(CachedDataManager, cls).__new__(cls)
+            cls._instance._init_cache()
         return cls._instance
 
-    def _load_cache(self) -> List[CachedData]:
-        try:
-            with open(self._data_file_path, "r", encoding="utf-8") as f:
-                raw_data = json.load(f)
-                return [CachedData(**item) for item in raw_data]
-        except FileNotFoundError:
-            return []
-
-    def _save_cache(self, items: List[CachedData]):
-        with open(self._data_file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [item.model_dump() for item in items],
-                f,
-                indent=4,
-                ensure_ascii=False,
-                default=str
-            )
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _init_cache(self):
+        self._lock = RLock()
+        self._flush_lock = Lock()
+        self._entries: "OrderedDict[str, CachedData]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._total_bytes = 0
+        # 持久化条目是否有变化，有变化时才写快照
+        self._dirty = False
+        self._timer: Optional[Timer] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._load_snapshot()
+
+    # ==============================
+    # 读写
+    # ==============================
 
     def list_cache(self, include_expired: bool = False) -> List[CachedData]:
-        cache_list = self._load_cache()
-        if include_expired:
-            return cache_list
-        return [item for item in cache_list if not item.is_expired()]
-    
+        with self._lock:
+            if include_expired:
+                return list(self._entries.values())
+            now = datetime.now()
+            return [item for item in self._entries.values() if not item.is_expired(now)]
+
     def set_cache(self, data: CachedData):
-        cache_list = self._load_cache()
-        for i, item in enumerate(cache_list):
-            if item.cache_key == data.cache_key:
-                cache_list[i] = data
-                break
-        else:
-            cache_list.append(data)
-        self._save_cache(cache_list)
+        now = datetime.now()
+        if data.created_at is None:
+            data.created_at = now
+        data.updated_at = now
+        if data.ttl and data.expire_at is None:
+            data.expire_at = data.created_at + timedelta(seconds=data.ttl)
+
+        size = len(json.dumps(data.cache_value, ensure_ascii=False, default=str))
+
+        with self._lock:
+            self._remove(data.cache_key)
+            self._entries[data.cache_key] = data
+            self._sizes[data.cache_key] = size
+            self._total_bytes += size
+            for tag in data.tags or []:
+                self._tag_index.setdefault(tag, set()).add(data.cache_key)
+            if data.persistent:
+                self._dirty = True
+            self._evict()
 
     def get_cache(self, cache_key: str) -> Optional[CachedData]:
-        cache_list = self._load_cache()
-        for item in cache_list:
-            if item.cache_key == cache_key:
-                if not item.is_expired():
-                    item.access()
-                    self._save_cache(cache_list)
-                    return item
-        return None
+        with self._lock:
+            item = self._entries.get(cache_key)
+            if item is None:
+                self._misses += 1
+                return None
+
+            if item.is_expired():
+                self._remove(cache_key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            item.access()
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            return item
 
     def delete_cache(self, cache_key: str):
-        cache_list = self._load_cache()
-        new_list = [item for item in cache_list if item.cache_key != cache_key]
-        self._save_cache(new_list)
\ No newline at end of file
+        with self._lock:
+            self._remove(cache_key)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        删除带有指定标签的全部条目，返回删除数量。
+        """
+        with self._lock:
+            keys = list(self._tag_index.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def purge_expired(self) -> int:
+        """
+        清理已过期的条目，返回清理数量。
+        """
+        with self._lock:
+            now = datetime.now()
+            keys = [key for key, item in self._entries.items() if item.is_expired(now)]
+            for key in keys:
+                self._remove(key)
+            self._expirations += len(keys)
+            return len(keys)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_entries": self.MAX_ENTRIES,
+                "max_bytes": self.MAX_BYTES,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    # ==============================
+    # 过期清理与持久化
+    # ==============================
+
+    def start_maintenance(self):
+        """
+        启动后台定期任务：清理过期条目，并在持久化条目有变化时写快照。
+        """
+        if self._timer is not None:
+            return
+
+        def run():
+            try:
+                self.purge_expired()
+                self.flush()
+            except Exception as e:
+                logger.exception(f"缓存定期维护失败: {e}")
+            finally:
+                if self._timer is not None:
+                    self._schedule(run)
+
+        self._schedule(run)
+
+    def stop_maintenance(self):
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+
+    def flush(self):
+        """
+        将持久化条目写入快照文件（无变化时跳过）。
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            now = datetime.now()
+            items = [
+                item.model_dump() for item in self._entries.values()
+                if item.persistent and not item.is_expired(now)
+            ]
+            self._dirty = False
+
+        try:
+            with self._flush_lock:
+                tmp_path = f"{self._data_file_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(items, f, indent=4, ensure_ascii=False, default=str)
+                os.replace(tmp_path, self._data_file_path)
+        except Exception:
+            self._dirty = True
+            raise
+
+    def _schedule(self, run):
+        self._timer = Timer(self.MAINTENANCE_INTERVAL_SECONDS, run)
+        self._timer.daemon = True
+        self._timer.start()
+
+    # ==============================
+    # 内部方法（调用方需持有锁）
+    # ==============================
+
+    def _remove(self, cache_key: str):
+        item = self._entries.pop(cache_key, None)
+        if item is None:
+            return
+        self._total_bytes -= self._sizes.pop(cache_key, 0)
+        for tag in item.tags or []:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._tag_index[tag]
+        if item.persistent:
+            self._dirty = True
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.MAX_ENTRIES or self._total_bytes > self.MAX_BYTES):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _load_snapshot(self):
+        try:
+            with open(self._data_file_path, "r", encoding="utf-8") as f:
+                raw_data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"加载缓存快照失败，忽略: {e}")
+            return
+
+        now = datetime.now()
+        for raw in raw_data:
+            item = CachedData(**raw)
+            # 旧版本文件中的条目均视为持久化条目
+            if "persistent" not in raw:
+                item.persistent = True
+            if not item.is_expired(now):
+                self.set_cache(item)
+        self._dirty = False
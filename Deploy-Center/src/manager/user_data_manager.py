@@ -1,17 +1,39 @@
 import json
 import os
-from typing import List, Optional
+from threading import RLock
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from models.entity.user import User
 
 
 class UserDataManager:
+    """
+    UserDataManager
+
+    用户数据保存在 user_data.json 中，读取时使用常驻内存的用户目录。
+
+    说明：
+        - 用户目录按 id 与 username 建立字典索引，get_user / get_user_by_username 为 O(1)
+        - create_user / update_user / delete_user 写文件后刷新目录；
+          文件被外部修改（mtime 或大小变化）时，下次读取自动重新加载
+        - 读取接口返回的 User 为目录中的共享对象，调用方不能修改
+        - 缓存每个用户序列化后的 X-User 请求头，转发 Agent 调用时不必重复序列化
+    """
+
     _instance = None
     _data_file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "user_data.json")
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(UserDataManager, cls).__new__(cls)
+            cls._instance._lock = RLock()
+            cls._instance._file_signature: Optional[Tuple[int, int]] = None
+            cls._instance._loaded = False
+            cls._instance._users: List[User] = []
+            cls._instance._users_by_id: Dict[int, User] = {}
+            cls._instance._users_by_username: Dict[str, User] = {}
+            # user_id -> (User, X-User 请求头)
+            cls._instance._user_headers: Dict[int, Tuple[User, str]] = {}
         return cls._instance
 
     def _load_users(self) -> List[User]:
@@ -25,48 +47,101 @@ class UserDataManager:
     def _save_users(self, users: List[User]):
         with open(self._data_file_path, "w", encoding="utf-8") as file:
             json.dump([user.model_dump() for user in users], file, indent=4, default=str, ensure_ascii=False)
+        self._invalidate()
 
     def create_user(self, user_data: dict):
-        users = self._load_users()
-        max_id = max((user.id for user in users), default=0)
-        user_data["id"] = max_id + 1
-        user_data["avatar"] = "https://cdn.quasar.dev/img/boy-avatar.png"   # 默认头像
-        user_data["created_at"] = datetime.now().isoformat()
-        user_data["status"] = user_data.get("status", "ENABLED")  # 如果没传，则默认状态为ENABLED
-        new_user = User(**user_data)
-        users.append(new_user)
-        self._save_users(users)
+        with self._lock:
+            users = self._load_users()
+            max_id = max((user.id for user in users), default=0)
+            user_data["id"] = max_id + 1
+            user_data["avatar"] = "https://cdn.quasar.dev/img/boy-avatar.png"   # 默认头像
+            user_data["created_at"] = datetime.now().isoformat()
+            user_data["status"] = user_data.get("status", "ENABLED")  # 如果没传，则默认状态为ENABLED
+            new_user = User(**user_data)
+            users.append(new_user)
+            self._save_users(users)
 
     def get_user(self, user_id: int) -> Optional[User]:
-        users = self._load_users()
-        return next((user for user in users if user.id == user_id), None)
+        self._ensure_loaded()
+        return self._users_by_id.get(user_id)
 
     def get_user_by_username(self, username: str) -> Optional[User]:
-        users = self._load_users()
-        return next((user for user in users if user.username == username), None)
+        self._ensure_loaded()
+        return self._users_by_username.get(username)
+
+    def get_user_header(self, user: User) -> str:
+        """
+        获取用户序列化后的 X-User 请求头（JSON 字符串），按用户缓存。
+        """
+        cached = self._user_headers.get(user.id)
+        if cached is not None and cached[0] is user:
+            return cached[1]
+
+        header = json.dumps(user.model_dump(), default=str)
+        # 只缓存目录中的当前用户对象，目录刷新后旧对象的缓存随之失效
+        if self._users_by_id.get(user.id) is user:
+            self._user_headers[user.id] = (user, header)
+        return header
 
     def update_user(self, user_id: int, updated_data: dict):
-        users = self._load_users()
-        for user in users:
-            if user.id == user_id:
-                for key, value in updated_data.items():
-                    if hasattr(user, key):
-                        setattr(user, key, value)
-                user.updated_at = datetime.now().isoformat()
-                self._save_users(users)
-                return
+        with self._lock:
+            users = self._load_users()
+            for user in users:
+                if user.id == user_id:
+                    for key, value in updated_data.items():
+                        if hasattr(user, key):
+                            setattr(user, key, value)
+                    user.updated_at = datetime.now().isoformat()
+                    self._save_users(users)
+                    return
         raise ValueError(f"User with ID {user_id} not found.")
 
     def delete_user(self, user_id: int):
-        users = self._load_users()
-        users = [user for user in users if user.id != user_id]
-        self._save_users(users)
+        with self._lock:
+            users = self._load_users()
+            users = [user for user in users if user.id != user_id]
+            self._save_users(users)
 
     def list_users(self) -> List[User]:
-        return self._load_users()
+        self._ensure_loaded()
+        return list(self._users)
 
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
             cls._instance = cls()
-        return cls._instance
\ No newline at end of file
+        return cls._instance
+
+    # ==============================
+    # 用户目录
+    # ==============================
+
+    def _ensure_loaded(self):
+        """
+        首次读取或文件发生变化时重新加载用户目录。
+        """
+        signature = self._get_file_signature()
+        if self._loaded and signature == self._file_signature:
+            return
+
+        with self._lock:
+            signature = self._get_file_signature()
+            if self._loaded and signature == self._file_signature:
+                return
+            users = self._load_users()
+            self._users = users
+            self._users_by_id = {user.id: user for user in users}
+            self._users_by_username = {user.username: user for user in users}
+            self._user_headers = {}
+            self._file_signature = signature
+            self._loaded = True
+
+    def _invalidate(self):
+        self._loaded = False
+
+    def _get_file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._data_file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
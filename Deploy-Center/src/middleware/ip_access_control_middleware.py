@@ -77,6 +77,6 @@ class IPAccessControlMiddleware(BaseHTTPMiddleware):
 
         if not ip_in_allow_list(client_ip, allow_list):
             logger.warning(f"非法访问尝试：IP {client_ip} 不在允许列表")
-            return HttpResult.failed(msg="非法访问", code=403).json_response()
+            return HttpResult.fail(msg="非法访问", code=403).json_response(status.HTTP_403_FORBIDDEN)
 
         return await call_next(request)
\ No newline at end of file
@@ -8,16 +8,15 @@ from manager import USER_DATA_MANAGER
 
 class UserInjectionMiddleware(BaseHTTPMiddleware):
      async def dispatch(self, request: Request, call_next):
+        request.state.current_user = None
         try:
-            auth_header = request.headers.get("Authorization", "")
-            if auth_header.startswith("Bearer "):
-                token = auth_header.removeprefix("Bearer ").strip()
-                user = JWTUtil.get_user_from_token(token)
-                if user:
-                    user_id = user.get("user_id")
-                    set_current_user(USER_DATA_MANAGER.get_user(user_id))
+            user = JWTUtil.get_user_from_request(request)
+            if user:
+                user_id = user.get("user_id")
+                request.state.current_user = USER_DATA_MANAGER.get_user(user_id)
+                set_current_user(request.state.current_user)
         except Exception as e:
             print(f"[UserInjectionMiddleware] 注入用户失败: {e}")
 
         response = await call_next(request)
-        return response
\ No newline at end of file
+        return response
@@ -1,7 +1,8 @@
 # middleware/verify_token_middleware.py
-import re
+from typing import Dict, Iterator, List, Pattern, Set, Tuple
 from fastapi import Request, status
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Route, compile_path
 from models.common.http_result import HttpResult
 from utils.jwt_util import JWTUtil
 
@@ -12,30 +13,71 @@ STATIC_SKIP_AUTH_PATHS = [
     "/openapi.json"
 ]
 
-class VerifyTokenMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
-        method = request.method
 
-        # Step 1: 判断是否在静态白名单
+def iter_routes(routes, prefix: str = "") -> Iterator[Tuple[str, Route]]:
+    """
+    展开应用路由，返回 (完整路径, 路由)。
+
+    较新版本的 FastAPI 中 include_router 不再把子路由复制到 app.routes，需要递归展开。
+    """
+    for route in routes:
+        included_router = getattr(route, "original_router", None)
+        if included_router is not None:
+            include_prefix = getattr(getattr(route, "include_context", None), "prefix", "")
+            yield from iter_routes(included_router.routes, prefix + include_prefix)
+        elif isinstance(route, Route):
+            yield prefix + route.path, route
+
+
+class SkipAuthMatcher:
+    """
+    @skip_auth 路由匹配表，根据应用路由一次性构建。
+
+    - 无路径参数的路由：按 (method, path) 做字典查找
+    - 带路径参数的路由：预编译路径正则后匹配
+    """
+
+    def __init__(self, routes):
+        self._exact: Dict[str, Set[str]] = {}
+        self._patterns: List[Tuple[Pattern, Set[str]]] = []
+
+        for path, route in iter_routes(routes):
+            if not getattr(route.endpoint, "_skip_auth", False):
+                continue
+            methods = set(route.methods or ())
+            path_regex, _, param_convertors = compile_path(path)
+            if param_convertors:
+                self._patterns.append((path_regex, methods))
+            else:
+                self._exact.setdefault(path, set()).update(methods)
+
+    def match(self, method: str, path: str) -> bool:
         if any(path == p or path.startswith(p + "/") for p in STATIC_SKIP_AUTH_PATHS):
-            return await call_next(request)
+            return True
+        if method in self._exact.get(path, ()):
+            return True
+        return any(method in methods and regex.match(path) for regex, methods in self._patterns)
 
-        # Step 2: 判断当前请求是否带有 @skip_auth 装饰器
-        for route in request.app.routes:
-            if hasattr(route, "endpoint") and method in route.methods:
-                if route.path == path or re.fullmatch(route.path.replace("{", "(?P<").replace("}", ">[^/]+)"), path):
-                    if getattr(route.endpoint, "_skip_auth", False):
-                        return await call_next(request)
 
-        # Step 3: 验证 Token
-        token = request.headers.get("Authorization")
-        if not token:
-            return HttpResult.failed(msg="Token is missing", code=403).json_response()
+class VerifyTokenMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        # 路由在应用启动前已全部注册，匹配表在第一个请求时构建一次
+        self._skip_auth_matcher = None
+
+    async def dispatch(self, request: Request, call_next):
+        # Step 1: 判断是否在静态白名单或带有 @skip_auth 装饰器
+        if self._skip_auth_matcher is None:
+            self._skip_auth_matcher = SkipAuthMatcher(request.app.routes)
+        if self._skip_auth_matcher.match(request.method, request.url.path):
+            return await call_next(request)
+
+        # Step 2: 验证 Token（结果保存在 request.state 中，后续中间件与接口共享）
+        if not request.headers.get("Authorization"):
+            return HttpResult.fail(msg="Token is missing", code=401).json_response(status.HTTP_401_UNAUTHORIZED)
 
-        token = token.replace("Bearer ", "")
-        user = JWTUtil.get_user_from_token(token)
+        user = JWTUtil.get_user_from_request(request)
         if not user:
-            return HttpResult.failed(msg="Invalid or expired token", code=403).json_response()
+            return HttpResult.fail(msg="Invalid or expired token", code=401).json_response(status.HTTP_401_UNAUTHORIZED)
 
         return await call_next(request)
@@ -13,23 +13,25 @@ class CachedData(BaseModel):
     hit_count: int = 0
     source: str = "runtime"
     tags: Optional[List[str]] = None
+    # 是否持久化到 cached_data.json（Center 重启后恢复）
+    persistent: bool = False
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    def is_expired(self) -> bool:
-        now = datetime.now().isoformat()
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now()
         if self.expire_at:
             return now >= self.expire_at
-        if self.ttl:
+        if self.ttl and self.created_at:
             return now >= self.created_at + timedelta(seconds=self.ttl)
         return False
 
     def access(self):
         self.hit_count += 1
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = datetime.now()
 
     def touch(self, ttl: Optional[int] = None):
-        self.updated_at = datetime.now().isoformat()
+        self.updated_at = datetime.now()
         if ttl:
             self.ttl = ttl
             self.expire_at = self.updated_at + timedelta(seconds=ttl)
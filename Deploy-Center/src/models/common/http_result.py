@@ -1,3 +1,4 @@
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import Generic, TypeVar, Optional
 
@@ -23,4 +24,10 @@ class HttpResult(BaseModel, Generic[T]):
 
     @classmethod
     def fail(cls, code: int = 500, msg: str = "failed", data: T = None):
-        return cls(code=code, msg=msg, data=data)
\ No newline at end of file
+        return cls(code=code, msg=msg, data=data)
+
+    def json_response(self, status_code: int = 200) -> JSONResponse:
+        """
+        转换为 JSONResponse（用于中间件等无法直接返回模型的场景）。
+        """
+        return JSONResponse(status_code=status_code, content=self.model_dump(mode="json"))
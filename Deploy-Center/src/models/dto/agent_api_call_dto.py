@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Any, Optional
+
+
+class AgentApiCallDto(BaseModel):
+    agent_id: int
+    api_path: str
+    method: str = "GET"
+    # 调用标识，作为返回结果的键；未指定时使用调用在列表中的下标
+    key: Optional[str] = None
+    # JSON 请求体
+    data: Optional[Any] = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from models.dto.agent_api_call_dto import AgentApiCallDto
+
+
+class BatchCallAgentRequestDto(BaseModel):
+    calls: List[AgentApiCallDto] = Field(..., min_length=1, max_length=500)
+    # 单个调用的超时时间（秒）
+    timeout_seconds: Optional[float] = Field(default=10, gt=0, le=300)
+    # 最大并发调用数
+    max_concurrency: Optional[int] = Field(default=16, ge=1, le=64)
@@ -1,13 +1,21 @@
-import json
+import asyncio
+import random
+import time
 import httpx
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from utils.jwt_util import JWTUtil
 
 from models.entity.agent import Agent
+from models.entity.user import User
 from models.dto.update_agent_request_dto import UpdateAgentRequestDto
+from models.dto.agent_api_call_dto import AgentApiCallDto
+from models.dto.batch_call_agent_request_dto import BatchCallAgentRequestDto
 from manager.user_data_manager import UserDataManager
-from manager import AGENT_DATA_MANAGER
+from manager import AGENT_DATA_MANAGER, AGENT_CLIENT_MANAGER, AGENT_HEALTH_MANAGER, AGENT_RESPONSE_CACHE_MANAGER
 from models.common.http_result import HttpResult
 from config.log_config import get_logger
 
@@ -24,6 +32,51 @@ async def get_agent_list():
         return HttpResult.fail(msg=str(e))
 
 
+@agent_router.get("/api/deploy-center/agent/fleet/status", summary="获取所有Agent的运行状态")
+async def get_fleet_status():
+    """
+    获取所有 Agent 的运行状态（来自后台健康探测，不会实时请求 Agent）：
+        - status: UNKNOWN / ONLINE / OFFLINE
+        - last_seen_at、last_checked_at、rtt_ms、consecutive_failures、last_error
+        - agent_version、hostname、os、arch、docker_version
+    """
+    try:
+        return HttpResult.ok(data=AGENT_HEALTH_MANAGER.get_fleet_status())
+    except Exception as e:
+        return HttpResult.fail(msg=str(e))
+
+
+@agent_router.get("/api/deploy-center/agent/circuit-breaker/status", summary="获取Agent熔断器状态")
+async def get_circuit_breaker_status():
+    """
+    获取各 Agent 熔断器的状态：state（CLOSED / OPEN / HALF_OPEN）、连续失败次数、累计失败与拒绝次数等。
+
+    只包含被调用过的 Agent。
+    """
+    try:
+        breakers = AGENT_CLIENT_MANAGER.breaker_stats()
+        return HttpResult.ok(data=[{"agent_id": agent_id, **snapshot} for agent_id, snapshot in breakers.items()])
+    except Exception as e:
+        return HttpResult.fail(msg=str(e))
+
+
+@agent_router.post("/api/deploy-center/agent/{agent_id}/circuit-breaker/reset", summary="重置Agent熔断器")
+async def reset_circuit_breaker(agent_id: int):
+    try:
+        AGENT_CLIENT_MANAGER.get_breaker(agent_id).reset()
+        return HttpResult.ok()
+    except Exception as e:
+        return HttpResult.fail(msg=str(e))
+
+
+@agent_router.get("/api/deploy-center/agent/response-cache/stats", summary="获取Agent响应缓存统计")
+async def get_response_cache_stats():
+    try:
+        return HttpResult.ok(data=AGENT_RESPONSE_CACHE_MANAGER.stats())
+    except Exception as e:
+        return HttpResult.fail(msg=str(e))
+
+
 @agent_router.get("/api/deploy-center/agent/{agent_id}", summary="获取Agent详情")
 async def get_agent(agent_id: int):
     try:
@@ -43,6 +96,7 @@ async def agent_register(agent_data: dict):
         # 若验证通过 -> 执行注册逻辑
         # 若验证失败 -> 中止注册并返回失败信息
         AGENT_DATA_MANAGER.create_agent(agent_data)
+        AGENT_HEALTH_MANAGER.refresh_agents()
         return HttpResult.ok()
     except Exception as e:
         return HttpResult.fail(msg=str(e))
@@ -52,6 +106,9 @@ async def agent_register(agent_data: dict):
 async def update_agent(update_dto: UpdateAgentRequestDto):
     try:
         AGENT_DATA_MANAGER.update_agent(update_dto.id, update_dto.model_dump(exclude={"id"}))
+        await AGENT_CLIENT_MANAGER.invalidate(update_dto.id)
+        AGENT_RESPONSE_CACHE_MANAGER.invalidate_agent(update_dto.id)
+        AGENT_HEALTH_MANAGER.refresh_agents()
         return HttpResult.ok()
     except ValueError as ve:
         return HttpResult.fail(code=404, msg=str(ve))
@@ -63,11 +120,263 @@ async def update_agent(update_dto: UpdateAgentRequestDto):
 async def delete_agent(agent_id: int):
     try:
         AGENT_DATA_MANAGER.delete_agent(agent_id)
+        await AGENT_CLIENT_MANAGER.invalidate(agent_id)
+        AGENT_RESPONSE_CACHE_MANAGER.invalidate_agent(agent_id)
+        AGENT_HEALTH_MANAGER.refresh_agents()
         return HttpResult.ok()
     except Exception as e:
         return HttpResult.fail(msg=str(e))
 
 
+# 逐跳头（Hop-by-hop headers），只对单个连接有效，转发时不能透传
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
+# 转发到 Agent 时需要剔除的请求头
+EXCLUDED_REQUEST_HEADERS = HOP_BY_HOP_HEADERS | {"host", "x-user"}
+
+# 幂等的 HTTP 方法，失败时允许重试
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# 允许重试的 Agent 响应状态码
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+
+class AgentUnavailableError(Exception):
+    """
+    Agent 无法调用（不存在、配置不完整或已知离线），code 为返回给调用方的状态码
+    """
+
+    def __init__(self, code: int, msg: str):
+        super().__init__(msg)
+        self.code = code
+        self.msg = msg
+
+
+def _resolve_agent(agent_id: int, api_path: str) -> Tuple[httpx.AsyncClient, str]:
+    """
+    根据 agent_id 获取该 Agent 的共享客户端，并拼接目标 Agent API 的完整 URL。
+
+    Raises:
+        AgentUnavailableError: Agent 不存在、缺少 service_url，或健康探测显示已离线（直接失败，不再等待连接超时）
+    """
+    agent: Dict = AGENT_DATA_MANAGER.get_agent(agent_id)
+    if not agent:
+        raise AgentUnavailableError(404, "Agent not found")
+
+    service_url = agent.get("service_url")
+    if not service_url:
+        raise AgentUnavailableError(400, "Agent 缺少 service_url")
+
+    if AGENT_HEALTH_MANAGER.is_unavailable(agent_id, service_url):
+        state = AGENT_HEALTH_MANAGER.get_status(agent_id) or {}
+        raise AgentUnavailableError(
+            503,
+            f"Agent（id={agent_id}）当前离线，最后在线时间: {state.get('last_seen_at') or '-'}，"
+            f"最近错误: {state.get('last_error') or '-'}"
+        )
+
+    # 防止双斜杠或拼错路径
+    url = f"{service_url.rstrip('/')}/{api_path.lstrip('/')}"
+    return AGENT_CLIENT_MANAGER.get_client(agent), url
+
+
+def _build_forward_headers(request: Request) -> Dict[str, str]:
+    """
+    构造转发到 Agent 的请求头：
+        - 透传原始请求头（包括 Authorization、Content-Type、Content-Length）
+        - 剔除 host 与逐跳头，避免影响代理连接
+        - 根据 Token 注入当前用户信息（X-User），客户端自带的 X-User 会被忽略
+    """
+    headers = {
+        key: value for key, value in request.headers.items()
+        if key.lower() not in EXCLUDED_REQUEST_HEADERS
+    }
+    headers.update(_build_user_headers(request))
+    return headers
+
+
+def _build_user_headers(request: Request, user: Optional[User] = None) -> Dict[str, str]:
+    """
+    构造携带认证与用户信息的请求头：Authorization 原样透传，并根据 Token 注入 X-User。
+    """
+    headers = {}
+    authorization = request.headers.get("Authorization", "")
+    if authorization:
+        headers["Authorization"] = authorization
+
+    if user is None:
+        user = _get_request_user(request)
+    if user:
+        # 用户对象序列化后的 JSON 字符串（按用户缓存）
+        headers["X-User"] = UserDataManager.get_instance().get_user_header(user)
+
+    return headers
+
+
+def _get_request_user(request: Request) -> Optional[User]:
+    """
+    获取当前用户（优先使用 UserInjectionMiddleware 保存在 request.state 中的用户）。
+    """
+    if hasattr(request.state, "current_user"):
+        return request.state.current_user
+    user_info = JWTUtil.get_user_from_request(request)
+    if not user_info:
+        return None
+    return UserDataManager.get_instance().get_user(user_info.get("user_id"))
+
+
+def _get_cache_key(agent_id: int, method: str, api_path: str, user: Optional[User]) -> Tuple[Optional[Tuple], Optional[float]]:
+    """
+    获取 Agent 只读接口的响应缓存键与 TTL，接口不可缓存时返回 (None, None)。
+
+    缓存键包含用户的权限范围（角色 + 权限列表），不同权限的用户不共享缓存。
+    """
+    parts = urlsplit(api_path)
+    ttl = AGENT_RESPONSE_CACHE_MANAGER.get_ttl(method, parts.path)
+    if ttl is None:
+        return None, None
+
+    scope = (user.role, tuple(sorted(user.permissions or []))) if user else None
+    return (agent_id, method.upper(), "/" + parts.path.strip("/"), parts.query, scope), ttl
+
+
+async def _load_agent_json(agent_id: int, client: httpx.AsyncClient, url: str, headers: Dict[str, str]) -> Tuple[Any, int, bool]:
+    """
+    响应缓存的加载函数：GET 请求 Agent 接口并解析 JSON，返回 (数据, 字节数, 是否可缓存)。
+
+    只有 Agent 返回成功（code 为 200）的结果才会被缓存。
+    """
+    response = await _send_with_policy(agent_id, client, client.build_request("GET", url, headers=headers))
+    response.raise_for_status()
+    data = response.json()
+    return data, len(response.content), isinstance(data, dict) and data.get("code") == 200
+
+
+def _build_response_headers(response: httpx.Response) -> Dict[str, str]:
+    """
+    构造返回给调用方的响应头，剔除逐跳头。
+
+    响应体以原始字节（未解压）透传，因此 Content-Encoding 与 Content-Length 保持原样。
+    """
+    return {
+        key: value for key, value in response.headers.items()
+        if key.lower() not in HOP_BY_HOP_HEADERS
+    }
+
+
+async def _send_to_agent(
+    agent_id: int,
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    request: Request,
+    params=None,
+) -> httpx.Response:
+    """
+    以流式方式将请求转发到 Agent：请求体边读边发，响应只读取响应头，响应体由调用方按需读取。
+
+    幂等请求的请求体很小，预先读入内存，以便失败时重试。
+    """
+    method = method.upper()
+    # 原始请求没有请求体时不传 content，避免 httpx 以 chunked 方式发送空请求体
+    has_body = "content-length" in request.headers or "transfer-encoding" in request.headers
+    if not has_body:
+        content = None
+    elif method in IDEMPOTENT_METHODS:
+        content = await request.body()
+    else:
+        content = request.stream()
+
+    agent_request = client.build_request(
+        method=method,
+        url=url,
+        params=params,
+        headers=_build_forward_headers(request),
+        content=content,
+    )
+    return await _send_with_policy(agent_id, client, agent_request, stream=True)
+
+
+async def _send_with_policy(
+    agent_id: int,
+    client: httpx.AsyncClient,
+    agent_request: httpx.Request,
+    stream: bool = False,
+) -> httpx.Response:
+    """
+    在熔断器保护下发送请求，幂等请求失败时按指数退避重试。
+
+    失败判定：网络错误、超时，或 Agent 返回 5xx；
+    重试条件：幂等请求，且为网络错误、超时或 502 / 503 / 504。
+
+    Raises:
+        AgentUnavailableError: 熔断器处于打开状态
+        httpx.TransportError: 重试后仍然失败
+    """
+    breaker = AGENT_CLIENT_MANAGER.get_breaker(agent_id)
+    max_attempts, backoff = AGENT_CLIENT_MANAGER.get_retry_policy()
+    if agent_request.method not in IDEMPOTENT_METHODS:
+        max_attempts = 1
+
+    for attempt in range(1, max_attempts + 1):
+        if not breaker.allow_request():
+            raise AgentUnavailableError(
+                503,
+                f"Agent（id={agent_id}）调用失败次数过多，已暂停调用，"
+                f"{round(breaker.retry_after_seconds())} 秒后重试"
+            )
+
+        try:
+            response = await client.send(agent_request, stream=stream)
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            if attempt >= max_attempts:
+                raise
+            logger.warning(
+                f"调用 Agent（id={agent_id}）失败，准备第 {attempt + 1} 次尝试: "
+                f"{agent_request.url}, 异常类型：{e.__class__.__name__}"
+            )
+        else:
+            if response.status_code < 500:
+                breaker.record_success()
+                # 写操作成功后，该 Agent 的只读接口缓存失效
+                if agent_request.method not in IDEMPOTENT_METHODS and response.status_code < 400:
+                    AGENT_RESPONSE_CACHE_MANAGER.invalidate_agent(agent_id)
+                return response
+
+            breaker.record_failure()
+            if attempt >= max_attempts or response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            await response.aclose()
+            logger.warning(
+                f"调用 Agent（id={agent_id}）返回 {response.status_code}，准备第 {attempt + 1} 次尝试: {agent_request.url}"
+            )
+
+        # 指数退避并加入随机抖动，避免同时重试
+        await asyncio.sleep(backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+
+
+def _stream_response(response: httpx.Response) -> StreamingResponse:
+    """
+    将 Agent 响应以原始字节逐块透传，响应结束（或客户端断开）后关闭响应，连接归还连接池。
+    """
+    return StreamingResponse(
+        response.aiter_raw(),
+        status_code=response.status_code,
+        headers=_build_response_headers(response),
+        background=BackgroundTask(response.aclose),
+    )
+
+
 """
 TODO: 
 1. 发请求的时候，携带userId和userName过去。拿到结果的时候，设置userName再返回出去
@@ -88,70 +397,75 @@ async def call_agent_api(agent_id: int, api_path: str, method: str, request: Req
         request (Request): FastAPI 提供的原始请求对象，包含 body、headers 等。
 
     Returns:
-        dict: 标准返回结构，包括 code、status、msg、data 字段，转发成功返回 Agent API 响应数据，失败时返回错误信息。
-
-    Raises:
-        HTTPException: 如果根据 agent_id 找不到对应 Agent，抛出 404 异常。
-        Exception: 其他请求过程中遇到的异常均捕获并返回 500 错误信息。
+        - Agent 返回 JSON 时：标准返回结构，包括 code、status、msg、data 字段，data 为 Agent API 响应数据
+        - Agent 返回其他内容（日志文件、二进制下载等）时：原样流式透传 Agent 的响应
+        - 失败时返回错误信息
 
     流程说明:
-        1. 根据 agent_id 获取 Agent 信息（IP、端口），如果不存在则返回 404。
+        1. 根据 agent_id 获取 Agent 信息，如果不存在则返回 404；健康探测显示 Agent 已离线时直接返回 503。
         2. 拼接目标 Agent API 的完整 URL。
-        3. 获取当前请求的 headers 和 body，保持 multipart 文件、JSON 等完整性。
-        4. 移除 headers 中的 'host' 字段，避免代理请求时产生冲突。
-        5. 使用 httpx.AsyncClient 发送原始请求到 Agent，设置 30 秒超时。
-        6. 捕获 Agent 的响应并返回，若响应失败或异常，记录日志并返回 500。
+        3. 透传请求头（移除 host 与逐跳头）并注入 X-User，请求体以流的方式边读边发，不在 Center 缓存
+           （幂等请求除外，其请求体很小，读入内存以便失败重试）。
+        4. 收到 Agent 响应头后：
+            - JSON 响应读取后包装为 HttpResult 返回（保持与前端的约定）
+            - 其他响应不解码、不记录内容，逐块透传给调用方
+        5. 请求失败（连接失败、超时等）或异常时记录日志并返回 500；Agent 处于熔断状态时直接返回 503。
+
+    另注：白名单中的只读接口（见 AgentResponseCacheManager）走短时响应缓存，并发的相同请求只调用一次 Agent；
+    对该 Agent 的写操作成功后缓存失效。
+
+    另注：请求通过该 Agent 的共享客户端发送，连接复用，超时、连接数上限、熔断与重试策略见系统配置（Agent 连接设置）。
 
     典型用途:
         - 多 Agent 服务部署，Center 作为统一入口。
         - 支持文件上传、JSON 请求等复杂场景。
         - 简单实现 API 网关/反向代理模式。
+
+    另见:
+        `/api/deploy-center/agent/{agent_id}/proxy/{api_path}`：纯流式代理，不做任何包装。
     """
+    url = api_path
+    response = None
     try:
-        agent: Dict = AGENT_DATA_MANAGER.get_agent(agent_id)
-        if not agent:
-            return HttpResult.fail(code=404, msg="Agent not found")
-
-        service_url = agent.get("service_url")
-        if not service_url:
-            return HttpResult.fail(code=400, msg="Agent 缺少 service_url")
+        try:
+            client, url = _resolve_agent(agent_id, api_path)
+        except AgentUnavailableError as e:
+            return HttpResult.fail(code=e.code, msg=e.msg)
 
-        # 防止双斜杠或拼错路径
-        url = f"{service_url.rstrip('/')}/{api_path.lstrip('/')}"
         logger.info(f"调用Agent API: {url}, 方法: {method}")
 
-        # 获取原始 body 和 headers
-        body = await request.body()
-        headers = dict(request.headers)
-
-        # 需要清除 host，避免影响
-        headers.pop('host', None)
-
-        # 获取token
-        token = request.headers.get("Authorization").replace("Bearer ", "")
-        user_info = JWTUtil.get_user_from_token(token)
-        user_id = user_info.get("user_id")
-        user_data_manager = UserDataManager.get_instance()
-        user = user_data_manager.get_user(user_id)
-        # 将用户对象序列化为 JSON 字符串
-        user_json = json.dumps(user.model_dump(), default=str)
-
-        # 将user_json添加到 headers 中
-        headers["X-User"] = user_json
-
-        async with httpx.AsyncClient(timeout=None) as client:
-            response = await client.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                content=body
+        # 只读接口优先使用响应缓存
+        user = _get_request_user(request)
+        cache_key, ttl = _get_cache_key(agent_id, method, api_path, user)
+        if cache_key is not None:
+            headers = _build_user_headers(request, user)
+            data = await AGENT_RESPONSE_CACHE_MANAGER.get_or_load(
+                agent_id, cache_key, ttl, lambda: _load_agent_json(agent_id, client, url, headers)
             )
-
-            logger.info(f"Agent API返回: {response.status_code}, {response.text}")
-            response.raise_for_status()
-            content_type = response.headers.get("Content-Type", "")
-            data = response.json() if "application/json" in content_type else response.text
             return HttpResult.ok(data=data, msg="Agent API调用成功")
+
+        response = await _send_to_agent(agent_id, client, method, url, request)
+
+        content_type = response.headers.get("Content-Type", "")
+        logger.info(
+            f"Agent API返回: {response.status_code}, Content-Type: {content_type}, "
+            f"Content-Length: {response.headers.get('Content-Length', '-')}"
+        )
+
+        if "application/json" not in content_type:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            stream_response = _stream_response(response)
+            response = None
+            return stream_response
+
+        await response.aread()
+        response.raise_for_status()
+        return HttpResult.ok(data=response.json(), msg="Agent API调用成功")
+    except AgentUnavailableError as e:
+        logger.warning(e.msg)
+        return HttpResult.fail(code=e.code, msg=e.msg)
     except httpx.RequestError as e:
         error_msg = f"[Center转发失败] 无法请求 Agent（id={agent_id}）的接口: {url}, 方法: {method.upper()}，异常类型：{e.__class__.__name__}，详情：{str(e)}"
         logger.error(error_msg)
@@ -159,4 +473,138 @@ async def call_agent_api(agent_id: int, api_path: str, method: str, request: Req
     except Exception as e:
         error_msg = f"[Center异常] 调用 Agent（id={agent_id}）的接口: {url}, 方法: {method.upper()} 出现未知错误，异常类型：{e.__class__.__name__}，详情：{str(e)}"
         logger.error(error_msg)
-        return HttpResult.fail(msg=error_msg)
\ No newline at end of file
+        return HttpResult.fail(msg=error_msg)
+    finally:
+        if response is not None:
+            await response.aclose()
+
+
+@agent_router.api_route(
+    "/api/deploy-center/agent/{agent_id}/proxy/{api_path:path}",
+    methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    summary="流式代理Agent API",
+)
+async def proxy_agent_api(agent_id: int, api_path: str, request: Request):
+    """
+    流式反向代理到指定 Agent 服务。
+
+    与 call-api 不同，这里不对 Agent 的响应做任何包装：
+        - HTTP 方法、查询参数、请求头原样转发（移除 host 与逐跳头，注入 X-User）
+        - 请求体与响应体均以流的方式逐块转发，不解码、不记录内容，
+          单个请求占用的内存与数据大小无关，适用于大文件上传、日志与文件下载等场景
+        - Agent 的状态码与响应头原样返回
+
+    示例:
+        GET /api/deploy-center/agent/1/proxy/api/deploy-agent/deploy-log/xxx.log
+    """
+    try:
+        client, url = _resolve_agent(agent_id, api_path)
+    except AgentUnavailableError as e:
+        return HttpResult.fail(code=e.code, msg=e.msg)
+
+    logger.info(f"代理Agent API: {url}, 方法: {request.method}")
+
+    try:
+        response = await _send_to_agent(agent_id, client, request.method, url, request, params=request.query_params)
+    except AgentUnavailableError as e:
+        logger.warning(e.msg)
+        return HttpResult.fail(code=e.code, msg=e.msg)
+    except httpx.RequestError as e:
+        error_msg = f"[Center转发失败] 无法请求 Agent（id={agent_id}）的接口: {url}, 方法: {request.method}，异常类型：{e.__class__.__name__}，详情：{str(e)}"
+        logger.error(error_msg)
+        return HttpResult.fail(code=502, msg=error_msg)
+
+    logger.info(
+        f"Agent API返回: {response.status_code}, Content-Type: {response.headers.get('Content-Type', '-')}, "
+        f"Content-Length: {response.headers.get('Content-Length', '-')}"
+    )
+    return _stream_response(response)
+
+
+async def _call_agent_json(call: AgentApiCallDto, headers: Dict[str, str], user: Optional[User]) -> Dict:
+    """
+    执行批量调用中的单个调用，返回该调用的结果（不抛出异常）。
+    """
+    method = call.method.upper()
+    try:
+        client, url = _resolve_agent(call.agent_id, call.api_path)
+    except AgentUnavailableError as e:
+        return {"code": e.code, "msg": e.msg, "data": None}
+
+    try:
+        cache_key, ttl = _get_cache_key(call.agent_id, method, call.api_path, user)
+        if cache_key is not None:
+            data = await AGENT_RESPONSE_CACHE_MANAGER.get_or_load(
+                call.agent_id, cache_key, ttl, lambda: _load_agent_json(call.agent_id, client, url, headers)
+            )
+            return {"code": 200, "msg": "Agent API调用成功", "data": data}
+
+        agent_request = client.build_request(
+            method=method,
+            url=url,
+            headers=headers,
+            json=call.data if method not in ("GET", "HEAD", "DELETE") else None,
+        )
+        response = await _send_with_policy(call.agent_id, client, agent_request)
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "")
+        data = response.json() if "application/json" in content_type else response.text
+        return {"code": 200, "msg": "Agent API调用成功", "data": data}
+    except AgentUnavailableError as e:
+        return {"code": e.code, "msg": e.msg, "data": None}
+    except httpx.HTTPStatusError as e:
+        return {"code": e.response.status_code, "msg": f"Agent API返回错误状态码: {e.response.status_code}", "data": None}
+    except httpx.RequestError as e:
+        return {"code": 500, "msg": f"[Center转发失败] 无法请求 Agent（id={call.agent_id}）的接口: {url}，异常类型：{e.__class__.__name__}，详情：{str(e)}", "data": None}
+
+
+@agent_router.post("/api/deploy-center/agent/batch-call", summary="批量调用多个Agent API")
+async def batch_call_agent_api(batch_dto: BatchCallAgentRequestDto, request: Request):
+    """
+    批量调用 Agent API，一次请求完成多个 Agent / 多个接口的调用（例如总览页面同时查询所有 Agent 的状态）。
+
+    说明：
+        - 所有调用并发执行，并发数不超过 max_concurrency
+        - 每个调用单独计时，超过 timeout_seconds 的调用返回超时，不影响其他调用
+        - 单个调用失败只体现在该调用的结果中，整体请求始终返回成功
+        - 仅支持 JSON 请求体；Agent 返回非 JSON 内容时以文本返回
+
+    Returns:
+        data 为调用结果字典：键为调用的 key（未指定时为调用在列表中的下标），
+        值包含 agent_id、api_path、method、code、msg、data、elapsed_ms
+    """
+    keys = [call.key if call.key is not None else str(index) for index, call in enumerate(batch_dto.calls)]
+    if len(set(keys)) != len(keys):
+        return HttpResult.fail(code=400, msg="调用的 key 不能重复")
+
+    user = _get_request_user(request)
+    headers = _build_user_headers(request, user)
+    semaphore = asyncio.Semaphore(batch_dto.max_concurrency)
+
+    async def run(call: AgentApiCallDto) -> Dict:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(_call_agent_json(call, headers, user), timeout=batch_dto.timeout_seconds)
+            except asyncio.TimeoutError:
+                result = {"code": 504, "msg": f"调用超时（{batch_dto.timeout_seconds} 秒）", "data": None}
+            except Exception as e:
+                logger.error(f"批量调用 Agent（id={call.agent_id}）的接口 {call.api_path} 出现未知错误: {e}")
+                result = {"code": 500, "msg": f"{e.__class__.__name__}: {str(e)}", "data": None}
+
+            return {
+                "agent_id": call.agent_id,
+                "api_path": call.api_path,
+                "method": call.method.upper(),
+                **result,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+            }
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run(call) for call in batch_dto.calls))
+    failed_count = sum(1 for result in results if result["code"] != 200)
+    logger.info(
+        f"批量调用Agent API: 调用数={len(results)}, 失败数={failed_count}, "
+        f"耗时={round((time.perf_counter() - start) * 1000, 2)}ms"
+    )
+    return HttpResult.ok(data=dict(zip(keys, results)))
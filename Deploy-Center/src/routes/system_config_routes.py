@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict
 from models.common.http_result import HttpResult
 from config.log_config import get_logger
-from manager import SYSTEM_CONFIG_DATA_MANAGER
+from manager import SYSTEM_CONFIG_DATA_MANAGER, AGENT_CLIENT_MANAGER
 from utils.decorators.skip_auth import skip_auth
 
 system_config_router = APIRouter()
@@ -43,6 +43,10 @@ async def update_config(config_key: str, updated_data: dict):
     """
     try:
         SYSTEM_CONFIG_DATA_MANAGER.update_config(config_key, updated_data)
+        # Agent 连接配置变化后，关闭现有客户端，按新配置重建
+        if config_key.startswith("agent_"):
+            AGENT_CLIENT_MANAGER.reload_settings()
+            await AGENT_CLIENT_MANAGER.close_all()
         return HttpResult.ok()
     except Exception as e:
         logger.error(f"更新系统配置失败: {e}")
@@ -55,6 +59,10 @@ async def delete_config(config_key: str):
     """
     try:
         SYSTEM_CONFIG_DATA_MANAGER.delete_config(config_key)
+        # Agent 连接配置恢复为默认值
+        if config_key.startswith("agent_"):
+            AGENT_CLIENT_MANAGER.reload_settings()
+            await AGENT_CLIENT_MANAGER.close_all()
         return HttpResult.ok()
     except Exception as e:
         logger.error(f"删除配置项失败: {e}")
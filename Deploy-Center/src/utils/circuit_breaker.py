@@ -0,0 +1,131 @@
+# utils/circuit_breaker.py
+import time
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    熔断器（Circuit Breaker）
+
+    状态：
+        - CLOSED: 正常放行，连续失败次数达到 failure_threshold 后进入 OPEN
+        - OPEN: 拒绝所有调用，open_seconds 后进入 HALF_OPEN
+        - HALF_OPEN: 只放行 half_open_max_calls 个试探调用，
+          试探成功回到 CLOSED，试探失败重新进入 OPEN
+
+    用法：
+        if not breaker.allow_request():
+            ...  # 直接失败
+        try:
+            ...  # 调用
+            breaker.record_success()
+        except Exception:
+            breaker.record_failure()
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, name: str, failure_threshold: int = 5, open_seconds: float = 30, half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(int(half_open_max_calls), 1)
+
+        self._lock = Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_at: Optional[float] = None
+        self._half_open_calls = 0
+
+        self._total_failures = 0
+        self._total_rejected = 0
+        self._last_failure_at: Optional[datetime] = None
+        self._last_state_change_at: Optional[datetime] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN:
+                # 试探调用未上报结果（如被取消）时，超过 open_seconds 后允许重新试探
+                if time.monotonic() - self._half_open_at >= self.open_seconds:
+                    self._half_open_at = time.monotonic()
+                    self._half_open_calls = 0
+                if self._half_open_calls < self.half_open_max_calls:
+                    self._half_open_calls += 1
+                    return True
+            self._total_rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._current_state() != self.CLOSED:
+                self._transition(self.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            self._total_failures += 1
+            self._last_failure_at = datetime.now()
+
+            state = self._current_state()
+            if state == self.HALF_OPEN or (state == self.CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._transition(self.OPEN)
+
+    def reset(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._transition(self.CLOSED)
+
+    def retry_after_seconds(self) -> float:
+        """
+        OPEN 状态下距离进入 HALF_OPEN 的剩余秒数，其他状态返回 0。
+        """
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0
+            return max(self._opened_at + self.open_seconds - time.monotonic(), 0)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "open_seconds": self.open_seconds,
+                "total_failures": self._total_failures,
+                "total_rejected": self._total_rejected,
+                "last_failure_at": self._last_failure_at,
+                "last_state_change_at": self._last_state_change_at,
+            }
+
+    # ==============================
+    # 内部方法（调用方需持有锁）
+    # ==============================
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str):
+        if state == self._state:
+            return
+        self._state = state
+        self._last_state_change_at = datetime.now()
+        self._half_open_calls = 0
+        self._opened_at = time.monotonic() if state == self.OPEN else None
+        self._half_open_at = time.monotonic() if state == self.HALF_OPEN else None
@@ -1,6 +1,11 @@
+import hashlib
+import time
 import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict
+from threading import Lock
+from typing import Optional, Dict, Tuple
+from fastapi import Request
 from manager import SYSTEM_CONFIG_DATA_MANAGER
 
 raw_config = SYSTEM_CONFIG_DATA_MANAGER.get_config("token_expiration_hours")
@@ -14,6 +19,14 @@ JWT_SECRET = "9f86d081884c7d659a2feaa0c55ad0f17a2c01997a033b48d1f4b42d69f2475b"
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_DELTA = timedelta(hours=token_expiration_hours)  # Token 有效期
 
+# 已验证 Token 的缓存：sha256(token) -> (用户信息, 过期时间戳)，按 LRU 淘汰
+TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: "OrderedDict[str, Tuple[Dict, float]]" = OrderedDict()
+_token_cache_lock = Lock()
+
+# request.state 中保存 Token 用户信息的属性名
+REQUEST_STATE_TOKEN_USER = "token_user"
+
 class JWTUtil:
     @staticmethod
     def generate_token(user_id: int, username: str, expires_delta: Optional[timedelta] = None) -> str:
@@ -67,16 +80,58 @@ class JWTUtil:
         """
         从 JWT Token 中提取用户信息。
 
+        验证通过的 Token 会缓存到其 exp 过期时间为止（键为 Token 的 SHA-256），
+        缓存命中时不再重复验签。
+
         Args:
             token (str): JWT Token。
 
         Returns:
             Optional[Dict]: 用户信息，如果 Token 无效或已过期，返回 None。
         """
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+            if cached is not None:
+                if cached[1] > time.time():
+                    _token_cache.move_to_end(key)
+                    return dict(cached[0])
+                del _token_cache[key]
+
         payload = JWTUtil.decode_token(token)
-        if payload:
-            return {
-                "user_id": payload.get("user_id"),
-                "username": payload.get("username")
-            }
-        return None
\ No newline at end of file
+        if not payload:
+            return None
+
+        user = {
+            "user_id": payload.get("user_id"),
+            "username": payload.get("username")
+        }
+        expire_at = payload.get("exp")
+        if isinstance(expire_at, (int, float)):
+            with _token_cache_lock:
+                _token_cache[key] = (user, float(expire_at))
+                while len(_token_cache) > TOKEN_CACHE_MAX_SIZE:
+                    _token_cache.popitem(last=False)
+        return dict(user)
+
+    @staticmethod
+    def get_user_from_request(request: Request) -> Optional[Dict]:
+        """
+        从请求头 Authorization 的 Token 中提取用户信息。
+
+        结果保存在 request.state 中，同一请求内的中间件与接口共享，只解析一次。
+
+        Args:
+            request (Request): 当前请求。
+
+        Returns:
+            Optional[Dict]: 用户信息，如果没有 Token 或 Token 无效，返回 None。
+        """
+        state = request.state
+        if hasattr(state, REQUEST_STATE_TOKEN_USER):
+            return getattr(state, REQUEST_STATE_TOKEN_USER)
+
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        user = JWTUtil.get_user_from_token(token) if token else None
+        setattr(state, REQUEST_STATE_TOKEN_USER, user)
+        return user